@@ -8,6 +8,9 @@ Usage:
   python scripts/create_user_with_one_order.py
 
 Then add the printed lines to your .env file (USER_WITH_ONE_ORDER_USERNAME, USER_WITH_ONE_ORDER_PASSWORD).
+
+Not needed with DATA_POOL=true: the test session then provisions such customers itself
+(see ssqatest/src/helpers/data_pool_helpers.py).
 """
 
 import os
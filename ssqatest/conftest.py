@@ -1,15 +1,24 @@
 # -*- coding: utf-8 -*-
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChOptions
-from selenium.webdriver.firefox.options import Options as FFOptions
 
 import os
-import time
 import allure
 from dotenv import load_dotenv
-from ssqatest.src.helpers.config_helpers import validate_environment, get_base_url, get_test_user
-from ssqatest.src.helpers.auth_helpers import login_via_requests_and_inject_cookies
+from ssqatest.src.helpers.config_helpers import validate_environment, get_base_url, get_test_user, get_db_backend
+from ssqatest.src.helpers.driver_helpers import (
+    DriverPool, build_driver_pool, get_blocked_resource_classes, apply_resource_blocking, PAGE_LOAD_STATS
+)
+from ssqatest.src.helpers import metrics_helpers
+from ssqatest.src.helpers.cleanup_helpers import CleanupRegistry, build_cleanup_registry
+from ssqatest.src.helpers.data_pool_helpers import DataPool, build_data_pool
+from ssqatest.src.helpers.database_helpers import close_db_pool, get_db_pool
+from ssqatest.src.helpers import sqlite_db_helpers
+from ssqatest.src.helpers.parallel_helpers import group_id_for, write_class_durations
+from ssqatest.src.helpers.auth_helpers import (
+    get_auth_state, inject_auth_state, finish_auth_state_restore, invalidate_auth_state, remember_local_storage,
+)
+from ssqatest.src.pages.MyAccountSignedIn import MyAccountSignedIn
+from ssqatest.src.SeleniumExtended import SeleniumExtended
 
 # Load environment variables from .env file (if it exists)
 # This happens automatically before any fixtures or tests run
@@ -19,70 +28,168 @@ load_dotenv()
 # This checks required variables and warns about missing optional ones
 validate_environment()
 
-@pytest.fixture(scope="class")
-def init_driver(request):
-
-    supported_browsers = ['chrome', 'ch', 'headlesschrome', 'firefox', 'ff', 'headlessfirefox']
-
-    browser = os.environ.get('BROWSER', None)
-    if not browser:
-        supported_list = ", ".join(supported_browsers)
-        raise EnvironmentError(
-            "Missing required environment variable: BROWSER. "
-            "Source env.sh or set export BROWSER=chrome. "
-            "Supported browsers: {}".format(supported_list)
-        )
-
-    browser = browser.lower()
-    if browser not in supported_browsers:
-        raise ValueError(
-            "Unsupported browser: '{}'. Supported: {}. Set via: export BROWSER=chrome".format(
-                browser, ", ".join(supported_browsers)
-            )
-        )
-
-    if browser in ('chrome', 'ch'):
-        driver = webdriver.Chrome()
-    elif browser in ('firefox', 'ff'):
-        driver = webdriver.Firefox()
-    elif browser in ('headlesschrome'):
-        chrome_options = ChOptions()
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--headless')
-        chrome_bin = os.environ.get('CHROME_BIN')
-        if chrome_bin:
-            chrome_options.binary_location = chrome_bin
-        driver = webdriver.Chrome(options=chrome_options)
-    elif browser == 'headlessfirefox':
-        ff_options = FFOptions()
-        ff_options.add_argument("--disable-gpu")
-        ff_options.add_argument("--no-sandbox")
-        ff_options.add_argument("--headless")
-        driver = webdriver.Firefox(options=ff_options)
-
-    # Standard viewport for deterministic UI tests (Full HD desktop)
-    driver.set_window_size(1920, 1080)
+DRIVER_POOL_KEY = pytest.StashKey[DriverPool]()
+CLEANUP_REGISTRY_KEY = pytest.StashKey[CleanupRegistry]()
+DATA_POOL_KEY = pytest.StashKey[DataPool]()
+# group id ('path::Class') -> seconds spent in setup, call and teardown of its tests this session
+CLASS_DURATIONS = {}
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "allow_resources(*classes): resource classes (images, fonts, analytics, thirdparty) the class needs "
+        "loaded even if BLOCK_RESOURCES blocks them",
+    )
+
+
+def pytest_sessionstart(session):
+    """
+    Creates the session's driver pool and starts launching the first browser in the background,
+    so it warms up while pytest collects tests (see build_driver_pool for the settings).
+    """
+    pool = build_driver_pool()
+    session.config.stash[DRIVER_POOL_KEY] = pool
+    registry = build_cleanup_registry()
+    session.config.stash[CLEANUP_REGISTRY_KEY] = registry
+    if not session.config.option.collectonly:
+        pool.prewarm()
+        # Deletes that failed in the previous session are retried in the background
+        if registry.requeue_retry_file():
+            registry.flush_in_background()
+        data_pool = build_data_pool()
+        if data_pool is not None:
+            session.config.stash[DATA_POOL_KEY] = data_pool
+            data_pool.refill_in_background()
 
+
+def pytest_collection_finish(session):
+    """Quits the pre-warmed browser if none of the selected tests use init_driver."""
+    if not any("init_driver" in getattr(item, "fixturenames", ()) for item in session.items):
+        session.config.stash[DRIVER_POOL_KEY].shutdown()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """Session-level pool of warm browsers used by init_driver (shut down in pytest_sessionfinish)."""
+    return request.config.stash[DRIVER_POOL_KEY]
+
+
+@pytest.fixture(scope="session")
+def cleanup_registry(request):
+    """
+    Session-level registry for test-created API data. Register instead of deleting in teardown, e.g.
+    cleanup_registry.register("reviews", review["id"]) or cleanup_registry.register("coupons", coupon["id"]);
+    everything is deleted in bulk in the background and at session end (see cleanup_helpers).
+    """
+    return request.config.stash[CLEANUP_REGISTRY_KEY]
+
+
+@pytest.fixture
+def seed_orders_db():
+    """
+    Seeds orders into the local SQLite stand-in (DB_BACKEND=sqlite) and deletes them after the test.
+    Yields seed(orders): each order is a dict of wp_posts columns with at least 'ID' (see sqlite_db_helpers.seed_orders).
+    Skips the test when the shop's MySQL database is in use, which is never written to.
+    """
+    if get_db_backend() != 'sqlite':
+        pytest.skip("Seeding the orders database needs DB_BACKEND=sqlite.")
+    pool = get_db_pool()
+    seeded_ids = []
+
+    def seed(orders):
+        with pool.connection() as connection:
+            ids = sqlite_db_helpers.seed_orders(connection, pool.db_name, orders)
+        seeded_ids.extend(ids)
+        return ids
+
+    yield seed
+    with pool.connection() as connection:
+        sqlite_db_helpers.delete_orders(connection, pool.db_name, seeded_ids)
+
+
+@pytest.fixture(scope="class")
+def init_driver(request, driver_pool):
+    """
+    Gives the test class a browser from the pool (self.driver). At the end of the class the
+    browser is reset (cookies, storage, extra tabs, about:blank) and returned to the pool.
+    With BLOCK_RESOURCES set, a class (or module) can opt back in to resource classes it needs,
+    e.g. @pytest.mark.allow_resources("images").
+    """
+    driver = driver_pool.acquire()
+    blocked = get_blocked_resource_classes()
+    if blocked:
+        allowed = {name for marker in request.node.iter_markers("allow_resources") for name in marker.args}
+        apply_resource_blocking(driver, [name for name in blocked if name not in allowed])
     request.cls.driver = driver
     yield
-    driver.quit()
+    driver_pool.release(driver)
+
+
+def _lease_test_user(request, user_id):
+    """
+    Returns credentials for a test user profile: a fresh customer from the data pool when DATA_POOL=true
+    (see data_pool_helpers), otherwise the account configured in env vars (see get_test_user).
+    """
+    data_pool = request.config.stash.get(DATA_POOL_KEY, None)
+    if data_pool is None:
+        return get_test_user(user_id)
+    return data_pool.lease(user_id)
+
+
+def _release_test_user(request, user_id, user):
+    """Pool customers are single-use: drop their cached login and queue them (and their orders) for bulk deletion."""
+    if "customer_id" not in user:
+        return
+    invalidate_auth_state(user_id, user["username"])
+    registry = request.config.stash[CLEANUP_REGISTRY_KEY]
+    for order_id in user.get("order_ids", []):
+        registry.register("orders", order_id)
+    registry.register("customers", user["customer_id"])
+
+
+def _log_in(driver, user_id, user):
+    """
+    Restores the user's cached logged-in state (see auth_helpers.get_auth_state) and opens My Account.
+    If the server no longer accepts the cached session (e.g. the user logged out elsewhere), logs in again.
+    """
+    base_url = get_base_url()
+    my_account = MyAccountSignedIn(driver)
+    state = get_auth_state(base_url, user_id, user["username"], user["password"])
+    inject_auth_state(driver, base_url, state)
+    try:
+        # Not go_to_my_account(): its ready element is missing on the signed-out page, so a stale
+        # session would time out there instead of reaching the re-login below
+        signed_in = my_account.open_my_account_and_check_signed_in()
+    finally:
+        finish_auth_state_restore(driver)
+    if not signed_in:
+        metrics_helpers.increment("auth_state.rejected")
+        driver.delete_all_cookies()
+        state = get_auth_state(base_url, user_id, user["username"], user["password"], refresh=True)
+        inject_auth_state(driver, base_url, state)
+        try:
+            my_account.go_to_my_account()
+        finally:
+            finish_auth_state_restore(driver)
+    if not state["local_storage"]:
+        remember_local_storage(driver, user_id, user["username"])
 
 
 @pytest.fixture(scope="class")
 def logged_in_my_account_smoke(request):
     """
     Establishes a logged-in session once per test class using my_account_smoke_user
-    (test_users.json, credentials from env). Depends on init_driver: use with
+    (test_users.json, credentials from env, or a pooled customer with DATA_POOL=true). Depends on init_driver: use with
     @pytest.mark.usefixtures('init_driver', 'logged_in_my_account_smoke').
     Framework rule: new class, new login — if a test needs a fresh login, put it in a different class.
+    The HTTP login itself is cached per user (see auth_helpers.get_auth_state); each class restores it into a clean browser.
     """
     driver = request.cls.driver
-    user = get_test_user("my_account_smoke_user")
-    base_url = get_base_url()
-    login_via_requests_and_inject_cookies(base_url, user["username"], user["password"], driver)
-    driver.get(base_url.rstrip("/") + "/my-account/")
+    user = _lease_test_user(request, "my_account_smoke_user")
+    _log_in(driver, "my_account_smoke_user", user)
     yield
+    _release_test_user(request, "my_account_smoke_user", user)
 
 
 @pytest.fixture(scope="class")
@@ -92,11 +199,10 @@ def logged_in_user_with_one_order(request):
     a user with at least one order (e.g. Orders tab order list). Depends on init_driver.
     """
     driver = request.cls.driver
-    user = get_test_user("user_with_one_order")
-    base_url = get_base_url()
-    login_via_requests_and_inject_cookies(base_url, user["username"], user["password"], driver)
-    driver.get(base_url.rstrip("/") + "/my-account/")
+    user = _lease_test_user(request, "user_with_one_order")
+    _log_in(driver, "user_with_one_order", user)
     yield
+    _release_test_user(request, "user_with_one_order", user)
 
 
 @pytest.hookimpl(hookwrapper=True)
@@ -134,8 +240,8 @@ def pytest_runtest_makereport(item, call):
             report.extra = extra
             return
 
-        # Brief pause so the page has time to paint (helps avoid white screenshot in CI/headless)
-        time.sleep(0.5)
+        # Let the page finish painting (helps avoid white screenshot in CI/headless)
+        SeleniumExtended(driver).wait_for_paint()
         screenshot_base64 = driver.get_screenshot_as_base64()
         extra.append(pytest_html.extras.image(screenshot_base64))
 
@@ -154,3 +260,52 @@ def pytest_runtest_makereport(item, call):
 
     report.extra = extra
 
+
+def pytest_runtest_logreport(report):
+    """Adds each test phase's time to its class total; runner.py schedules later runs on these durations."""
+    group_id = group_id_for(report.nodeid)
+    CLASS_DURATIONS[group_id] = CLASS_DURATIONS.get(group_id, 0.0) + report.duration
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Prints framework performance counters (e.g. cold starts avoided by the driver pool)."""
+    lines = metrics_helpers.format_metrics()
+    if lines:
+        terminalreporter.section("framework metrics")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+    sleeps = metrics_helpers.sleep_seconds_by_test()
+    if sleeps:
+        terminalreporter.section("sleep time per test (fixed sleeps, retry and polling backoff)")
+        for test, seconds in sorted(sleeps.items(), key=lambda item: item[1], reverse=True):
+            terminalreporter.write_line(f"{seconds:6.2f}s  {test}")
+
+    page_load_lines = PAGE_LOAD_STATS.summary_lines()
+    if page_load_lines:
+        terminalreporter.section(f"resource blocking (BLOCK_RESOURCES={os.environ.get('BLOCK_RESOURCES')})")
+        terminalreporter.write_line("'saved per load' is only shown for pages loaded both with and without blocking")
+        for line in page_load_lines:
+            terminalreporter.write_line(line)
+
+
+def pytest_sessionfinish(session):
+    """
+    Quits pooled browsers, deletes registered test data, closes pooled DB connections and writes
+    framework counters to RESULTS_DIR/metrics.json and per-class durations to RESULTS_DIR/class_durations.json.
+    """
+    pool = session.config.stash.get(DRIVER_POOL_KEY, None)
+    if pool is not None:
+        pool.shutdown()
+    data_pool = session.config.stash.get(DATA_POOL_KEY, None)
+    if data_pool is not None:
+        data_pool.shutdown()
+    registry = session.config.stash.get(CLEANUP_REGISTRY_KEY, None)
+    if registry is not None:
+        registry.close()
+    close_db_pool()
+    results_dir = os.environ.get("RESULTS_DIR")
+    if results_dir and metrics_helpers.snapshot():
+        metrics_helpers.write_metrics_file(results_dir)
+    if results_dir and CLASS_DURATIONS:
+        write_class_durations(results_dir, {g: round(seconds, 2) for g, seconds in CLASS_DURATIONS.items()})
@@ -1,6 +1,8 @@
 import pytest
 import argparse
 import os
+import sys
+import time
 import logging as logger
 from dotenv import load_dotenv
 
@@ -12,6 +14,79 @@ def add_drivers_to_path():
     pass
 
 
+def select_test_groups(selection_args, shard):
+    """
+    Collects the selected test classes and their expected durations from the history file.
+    With a shard (i, n) only the classes of shard i are returned; every shard computes the same
+    heaviest-first split from the same history, so shards get about equal run time.
+    Returns (group ids, {group id: expected seconds}).
+    """
+    # imported here so single-process runs keep working without the package being importable
+    from ssqatest.src.helpers import parallel_helpers
+
+    groups = parallel_helpers.collect_test_groups(['tests', *selection_args])
+    history = parallel_helpers.load_duration_history(parallel_helpers.get_duration_history_path())
+    weights = parallel_helpers.estimate_weights(groups, history)
+    group_ids = [group_id for group_id, _ in groups]
+    if shard:
+        index, total = shard
+        group_ids = parallel_helpers.assign_groups(weights, total)[index - 1]
+        print(f"Shard {index}/{total}: {len(group_ids)} of {len(groups)} test classes, "
+              f"expected {sum(weights[g] for g in group_ids):.1f}s")
+    return group_ids, {group_id: weights[group_id] for group_id in group_ids}
+
+
+def record_durations(results_dirs, since):
+    """Folds the class durations of this run (written by conftest after 'since') into the duration history file."""
+    from ssqatest.src.helpers import parallel_helpers
+
+    durations = parallel_helpers.read_class_durations(results_dirs, since=since)
+    if durations:
+        path = parallel_helpers.get_duration_history_path()
+        parallel_helpers.update_duration_history(path, durations)
+        print(f"Class durations saved to: {path}")
+
+
+def run_parallel(workers, weights, selection_args, worker_options, html):
+    """
+    Runs the given test classes in 'workers' pytest processes (see parallel_helpers) and returns
+    the worst worker exit code. Results: RESULTS_DIR/worker-<i>/ per worker, plus a merged
+    RESULTS_DIR/junit.xml, RESULTS_DIR/workers.json and, with --html, an index page linking the
+    per-worker reports.
+    :param weights: {group id: expected seconds} of the classes to run (see select_test_groups)
+    """
+    from ssqatest.src.helpers import parallel_helpers
+
+    result_dir = os.environ.get('RESULTS_DIR')
+    os.makedirs(result_dir, exist_ok=True)
+
+    if not weights:
+        print("No tests selected.")
+        return 5
+    # longest expected classes first, each to the least loaded worker
+    assignments = parallel_helpers.assign_groups(weights, workers)
+    print(f"Running {len(weights)} test classes in {min(workers, len(weights))} workers")
+
+    started_at = time.time()
+    start = time.perf_counter()
+    worker_results = parallel_helpers.run_workers(assignments, [*selection_args, *worker_options],
+                                                  result_dir, html_report=html)
+    wall_seconds = time.perf_counter() - start
+    record_durations([result["results_dir"] for result in worker_results], since=started_at)
+
+    parallel_helpers.merge_junit_reports(worker_results, os.path.join(result_dir, 'junit.xml'))
+    summary = parallel_helpers.build_utilization_summary(worker_results, wall_seconds)
+    parallel_helpers.write_summary_file(summary, result_dir)
+    if html:
+        index_path = parallel_helpers.write_html_index(summary, worker_results, os.path.join(result_dir, html), html)
+        print(f"pytest-html reports are linked from: {index_path}")
+    print("*****")
+    for line in parallel_helpers.format_utilization_summary(summary):
+        print(line)
+    print("*****")
+    return max(result["exit_code"] for result in worker_results)
+
+
 if __name__ == '__main__':
     pytest_arguments = ['tests']
     parser = argparse.ArgumentParser()
@@ -22,33 +97,74 @@ if __name__ == '__main__':
                         help='Path to html report. Relative to the "runner.py" script.')
     parser.add_argument('--allure_dir', required=False,
                         help='Path to html report. Relative to the "runner.py" script.')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of parallel pytest processes. Test classes are distributed across them '
+                             'and never split. Default 1 (single process). JUnit results are merged into '
+                             'RESULTS_DIR/junit.xml; with --html each worker writes its own report and '
+                             'RESULTS_DIR/<html> is an index page linking them.')
+    parser.add_argument('--shard', required=False,
+                        help='Run only shard i of n (e.g. 2/4), for splitting a run over CI jobs. Shards are '
+                             'balanced on the class durations of earlier runs (DURATION_HISTORY_FILE).')
 
     args = parser.parse_args()
     mark_to_run = args.mark_to_run
     html = args.html
     allure_dir = args.allure_dir
 
+    # options that select tests, and options that only affect reporting
+    selection_args = []
+    report_args = []
 
     if mark_to_run:
-        pytest_arguments.append(f'-m {mark_to_run}')
+        selection_args += ['-m', mark_to_run]
 
     if html:
         # if the html argument is passed then html report needs to be generated
         os.environ['HTML_REPORT_USED'] = 'true'
-        result_dir = os.environ.get('RESULTS_DIR')
-        pytest_arguments.append(f'--html={result_dir}/{html} --self-contained-html')
         print(f"pytest-html report will be: {html}")
 
     if allure_dir:
         # if 'allure_dir' argument is passed then allure report needs to be generated
         os.environ['ALLURE_USED'] = 'true'
-        pytest_arguments.append(f'--alluredir={allure_dir}')
+        # all workers write into the same allure results directory; allure merges them
+        report_args.append(f'--alluredir={allure_dir}')
         print(f"Allure report will be: {allure_dir}")
 
+    shard = None
+    if args.shard:
+        from ssqatest.src.helpers.parallel_helpers import parse_shard
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+
+    if args.workers > 1:
+        _, weights = select_test_groups(selection_args, shard)
+        sys.exit(run_parallel(args.workers, weights, selection_args, report_args, html))
+
+    if shard:
+        group_ids, _ = select_test_groups(selection_args, shard)
+        if not group_ids:
+            print("No test classes in this shard.")
+            sys.exit(5)
+        # run only this shard's classes instead of the whole 'tests' folder
+        pytest_arguments = group_ids
+
+    pytest_arguments += selection_args + report_args
+    if html:
+        result_dir = os.environ.get('RESULTS_DIR')
+        pytest_arguments += [f'--html={result_dir}/{html}', '--self-contained-html']
 
     # run tests
+    started_at = time.time()
     abc = pytest.main(pytest_arguments)
     print(pytest_arguments)
     print("*****")
     print(abc)
-    print("*****")
\ No newline at end of file
+    print("*****")
+    if os.environ.get('RESULTS_DIR'):
+        # needs the package importable (installed, or put on sys.path by pytest while collecting)
+        try:
+            record_durations([os.environ['RESULTS_DIR']], since=started_at)
+        except ImportError:
+            pass
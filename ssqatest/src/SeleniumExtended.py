@@ -1,32 +1,331 @@
 
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, \
+    NoSuchElementException, WebDriverException
 from selenium.webdriver.support.ui import Select
+from selenium.webdriver.common.by import By
+from ssqatest.src.helpers.driver_helpers import record_page_load
+from ssqatest.src.helpers import metrics_helpers
+from ssqatest.src.helpers.config_helpers import get_wait_engine
 
 import time
 
+
+# Finds all elements for a Selenium (by, value) locator inside the page.
+_JS_FIND_ELEMENTS = """
+function ssqaFind(by, value) {
+    var toArray = function (list) { return Array.prototype.slice.call(list); };
+    switch (by) {
+        case 'css selector': return toArray(document.querySelectorAll(value));
+        case 'id': return toArray(document.querySelectorAll('#' + CSS.escape(value)));
+        case 'name': return toArray(document.querySelectorAll('[name="' + CSS.escape(value) + '"]'));
+        case 'class name': return toArray(document.getElementsByClassName(value));
+        case 'tag name': return toArray(document.getElementsByTagName(value));
+        case 'xpath':
+            var result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < result.snapshotLength; i++) { nodes.push(result.snapshotItem(i)); }
+            return nodes;
+        case 'link text':
+            return toArray(document.querySelectorAll('a')).filter(function (a) { return a.innerText.trim() === value; });
+        case 'partial link text':
+            return toArray(document.querySelectorAll('a')).filter(function (a) { return a.innerText.indexOf(value) !== -1; });
+    }
+    return [];
+}
+function ssqaIsVisible(el) {
+    if (!el.isConnected) { return false; }
+    // Options have no box of their own; like Selenium, they are visible when their select is
+    if (el.tagName === 'OPTION' || el.tagName === 'OPTGROUP') {
+        var select = el.closest('select');
+        return select !== null && ssqaIsVisible(select);
+    }
+    var style = window.getComputedStyle(el);
+    if (style.display === 'none' || style.visibility === 'hidden' || style.visibility === 'collapse'
+        || parseFloat(style.opacity) === 0) { return false; }
+    var rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+"""
+
+# Resolves as soon as any of the checks is met (MutationObserver + transition/animation/url events, with a
+# cheap in-page re-check as safety net), when the time slice runs out, or when the page starts to unload.
+_JS_OBSERVER_WAIT = _JS_FIND_ELEMENTS + """
+var checks = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+function isMet(check) {
+    if (check.kind === 'url') { return window.location.href.indexOf(check.text) !== -1; }
+    var found = ssqaFind(check.by, check.value);
+    if (check.kind === 'present') { return found.length > 0; }
+    if (check.kind === 'all_visible') { return found.length > 0 && found.every(ssqaIsVisible); }
+    if (!found.length) { return false; }
+    var first = found[0];
+    if (check.kind === 'visible') { return ssqaIsVisible(first); }
+    if (check.kind === 'clickable') { return ssqaIsVisible(first) && !first.disabled; }
+    if (check.kind === 'text') { return (first.innerText || '').indexOf(check.text) !== -1; }
+    return false;
+}
+var finished = false, observer = null, interval = null, timer = null;
+var eventNames = ['transitionend', 'animationend', 'hashchange', 'popstate'];
+function finish(result) {
+    if (finished) { return; }
+    finished = true;
+    if (observer) { observer.disconnect(); }
+    clearInterval(interval);
+    clearTimeout(timer);
+    eventNames.forEach(function (name) { window.removeEventListener(name, evaluate, true); });
+    window.removeEventListener('pagehide', onUnload, true);
+    done(result);
+}
+function evaluate() {
+    for (var i = 0; i < checks.length; i++) {
+        if (isMet(checks[i])) { finish({met: true, index: i, detected_at: Date.now()}); return; }
+    }
+}
+function onUnload() { finish({navigated: true}); }
+evaluate();
+if (!finished) {
+    observer = new MutationObserver(evaluate);
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    eventNames.forEach(function (name) { window.addEventListener(name, evaluate, true); });
+    window.addEventListener('pagehide', onUnload, true);
+    interval = setInterval(evaluate, 250);
+    timer = setTimeout(function () { finish({met: false}); }, timeoutMs);
+}
+"""
+
+# Reads text, attributes, visibility and bounding box of every match of several locators in one call.
+# Text is the rendered text ('' for hidden elements, like WebElement.text); attributes prefer the DOM
+# property over the HTML attribute, like WebElement.get_attribute (so 'src'/'href' are absolute URLs).
+_JS_SNAPSHOT = _JS_FIND_ELEMENTS + """
+var locators = arguments[0], attributes = arguments[1], children = arguments[2] || {}, result = {};
+function readAttribute(el, name) {
+    if (name !== 'class' && name !== 'style' && name in el) {
+        var prop = el[name];
+        if (prop === null || prop === undefined) { return null; }
+        if (typeof prop === 'boolean') { return prop ? 'true' : null; }
+        if (typeof prop !== 'object' && typeof prop !== 'function') { return String(prop); }
+    }
+    return el.getAttribute(name);
+}
+function readElement(el, names) {
+    var visible = ssqaIsVisible(el), rect = el.getBoundingClientRect(), attrs = {};
+    names.forEach(function (name) { attrs[name] = readAttribute(el, name); });
+    return {
+        text: visible ? ((el.tagName === 'OPTION' ? el.text : el.innerText) || '').trim() : '',
+        attributes: attrs,
+        visible: visible,
+        rect: {x: rect.x, y: rect.y, width: rect.width, height: rect.height}
+    };
+}
+Object.keys(locators).forEach(function (key) {
+    var names = Array.isArray(attributes) ? attributes : (attributes[key] || []), selectors = children[key] || {};
+    result[key] = ssqaFind(locators[key][0], locators[key][1]).map(function (el) {
+        var match = readElement(el, names);
+        if (Object.keys(selectors).length) {
+            match.children = {};
+            Object.keys(selectors).forEach(function (child) {
+                var childEl = el.querySelector(selectors[child]);
+                match.children[child] = childEl ? readElement(childEl, names) : null;
+            });
+        }
+        return match;
+    });
+});
+return result;
+"""
+
+# Page is settled when the document finished loading and no jQuery (WooCommerce) AJAX request is pending.
+_JS_PAGE_SETTLED = "return document.readyState === 'complete' && (!window.jQuery || window.jQuery.active === 0);"
+
+
+# Scrolls the element to the viewport centre and resolves once its position is unchanged for two animation
+# frames (scroll finished, including smooth scrolling), or after 1 s at the latest.
+_JS_SCROLL_INTO_VIEW_AND_SETTLE = """
+var el = arguments[0], done = arguments[arguments.length - 1];
+el.scrollIntoView({block: 'center'});
+var started = Date.now(), lastTop = null, stableFrames = 0;
+function check() {
+    var top = el.getBoundingClientRect().top;
+    stableFrames = (top === lastTop) ? stableFrames + 1 : 0;
+    lastTop = top;
+    if (stableFrames >= 2 || Date.now() - started > 1000) { done(true); return; }
+    requestAnimationFrame(check);
+}
+requestAnimationFrame(check);
+"""
+
+# Resolves after the next two animation frames, i.e. once pending DOM changes have been painted.
+# Background tabs do not run animation frames, hence the timer fallback.
+_JS_WAIT_FOR_PAINT = """
+var done = arguments[arguments.length - 1], finished = false;
+function finish() { if (!finished) { finished = true; done(true); } }
+requestAnimationFrame(function () { requestAnimationFrame(finish); });
+setTimeout(finish, 250);
+"""
+
+# Values of the options of the first select matching the locator, or null if there is no such select.
+_JS_SELECT_OPTION_VALUES = _JS_FIND_ELEMENTS + """
+var select = ssqaFind(arguments[0], arguments[1])[0];
+if (!select || !select.options) { return null; }
+return Array.prototype.map.call(select.options, function (option) { return option.value; });
+"""
+
+
 class SeleniumExtended:
 
+    # Longest single in-browser observer wait before Selenium re-checks the condition itself
+    OBSERVER_SLICE_SECONDS = 2
+
     def __init__(self, driver):
         self.driver = driver
         self.default_timeout = 10
         self.max_retries = 3
-        self.retry_delay = 0.5  # Delay in seconds between retries
+        # 'polling' (WebDriverWait, one round trip per 500 ms) or 'observer' (in-page MutationObserver)
+        self.wait_engine = get_wait_engine()
+
+    def _wait_until(self, condition, check=None, timeout=None, message=''):
+        """
+        Waits until the expected condition returns a truthy value and returns that value.
+        With WAIT_ENGINE=observer and a 'check' (in-page description of the same condition), the browser
+        watches DOM mutations and wakes us up when the check is met; the Selenium condition then confirms
+        it, so results are the same as with polling. If the page navigates mid-wait, the observer cannot
+        run, or the observer reports the check met but the condition is not, the remaining time is spent polling.
+
+        :param condition: Callable taking the driver (e.g. EC.visibility_of_element_located(locator)).
+        :param check: Dict for the in-page observer, e.g. {'kind': 'visible', 'by': 'css selector', 'value': 'h1'},
+                      or a list of such dicts (woken up when any of them is met).
+                      Kinds: present, visible, all_visible, clickable, text, url.
+        :param timeout: Optional timeout (defaults to self.default_timeout)
+        :param message: Message for the TimeoutException.
+        """
+        timeout = timeout if timeout else self.default_timeout
+        start = time.perf_counter()
+        deadline = start + timeout
+        metrics_helpers.increment("waits.count")
+        try:
+            if self.wait_engine == 'observer' and check is not None:
+                checks = check if isinstance(check, list) else [check]
+                value = self._observer_wait(condition, checks, deadline)
+                if value:
+                    return value
+            remaining = max(0, deadline - time.perf_counter())
+            return WebDriverWait(self.driver, remaining).until(self._counted(condition), message=message)
+        finally:
+            metrics_helpers.increment("waits.seconds", time.perf_counter() - start)
+
+    def _counted(self, condition):
+        def counted_condition(driver):
+            metrics_helpers.increment("waits.polls")
+            return condition(driver)
+        return counted_condition
+
+    def _check_now(self, condition):
+        """Evaluates the condition once; element-not-found style errors count as 'not met'."""
+        try:
+            return self._counted(condition)(self.driver)
+        except (NoSuchElementException, StaleElementReferenceException):
+            return False
+
+    def _observer_wait(self, condition, checks, deadline):
+        """
+        Observer part of _wait_until: returns the condition value once met, or None if the deadline passed
+        or the wait has to fall back to polling (navigation mid-wait, or the check and condition disagree).
+        """
+        woken_up = False
+        while True:
+            value = self._check_now(condition)
+            if value:
+                return value
+            if woken_up:
+                # The in-page check says met but the condition does not agree (e.g. a check that cannot
+                # express the condition exactly); observing again would just wake up again right away
+                metrics_helpers.increment("waits.observer_fallbacks")
+                return None
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return None
+            slice_ms = int(min(remaining, self.OBSERVER_SLICE_SECONDS) * 1000)
+            try:
+                outcome = self.driver.execute_async_script(_JS_OBSERVER_WAIT, checks, slice_ms)
+            except WebDriverException:
+                # Document unloaded while the script was waiting (navigation) or script could not run
+                metrics_helpers.increment("waits.observer_fallbacks")
+                return None
+            if not outcome or outcome.get('navigated'):
+                metrics_helpers.increment("waits.observer_fallbacks")
+                return None
+            if outcome.get('met'):
+                metrics_helpers.increment("waits.observer_wakeups")
+                # Browser and test process share a clock locally; with a remote grid this includes clock skew
+                latency = max(0.0, time.time() - outcome['detected_at'] / 1000.0)
+                metrics_helpers.increment("waits.observer_detection_latency_seconds", latency)
+                woken_up = True
+
+    @staticmethod
+    def _check(kind, locator=None, text=None):
+        """Builds the in-page observer description of a condition (see _wait_until)."""
+        check = {'kind': kind}
+        if locator is not None:
+            check['by'], check['value'] = locator
+        if text is not None:
+            check['text'] = text
+        return check
     
+    def go_to(self, url, ready_locator=None, timeout=None):
+        """
+        Navigates to the given url and, if a ready_locator is given, waits until that element exists.
+        With PAGE_LOAD_STRATEGY 'eager' or 'none' driver.get() returns before the page has fully
+        loaded, so the page's readiness condition is what tells us we can start interacting.
+        Page objects should navigate through this method so page-load stats are recorded
+        (see driver_helpers.record_page_load).
+
+        :param url: Full url to load.
+        :param ready_locator: Locator of the element the page object needs before it is usable.
+        :param timeout: Optional timeout for the readiness wait (defaults to self.default_timeout)
+        """
+        timeout = timeout if timeout else self.default_timeout
+
+        old_document = None
+        if ready_locator and self.driver.capabilities.get('pageLoadStrategy') == 'none':
+            # With 'none' get() can return while the previous document is still displayed;
+            # its elements would satisfy the readiness check, so wait for the old document to go away.
+            old_document = self.driver.find_element(By.TAG_NAME, 'html')
+
+        self.driver.get(url)
+
+        if old_document is not None:
+            WebDriverWait(self.driver, timeout).until(EC.staleness_of(old_document))
+        if ready_locator:
+            self.wait_until_page_is_ready(ready_locator, timeout=timeout)
+        record_page_load(self.driver, url)
+
+    def wait_until_page_is_ready(self, ready_locator, timeout=None):
+        """Waits until the page's readiness element exists in the DOM (it may still be loading assets)."""
+        timeout = timeout if timeout else self.default_timeout
+
+        return self._wait_until(
+            EC.presence_of_element_located(ready_locator),
+            check=self._check('present', ready_locator),
+            timeout=timeout,
+            message=f'Page not ready: element with locator = {ready_locator} not present after {timeout} seconds.'
+        )
+
     def wait_and_input_text(self, locator, text, timeout=None):
         timeout = timeout if timeout else self.default_timeout
         
         for attempt in range(self.max_retries):
             try:
-                element = WebDriverWait(self.driver, timeout).until(
-                    EC.visibility_of_element_located(locator)
+                element = self._wait_until(
+                    EC.visibility_of_element_located(locator),
+                    check=self._check('visible', locator),
+                    timeout=timeout
                 )
                 element.send_keys(text)
                 return  # Success
             except StaleElementReferenceException:
                 if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
+                    self.wait_for_paint()
                     continue
                 else:
                     raise  # Re-raise on final attempt
@@ -38,12 +337,13 @@ class SeleniumExtended:
         
         for attempt in range(self.max_retries):
             try:
-                element = WebDriverWait(self.driver, timeout).until(
-                    EC.element_to_be_clickable(locator)
+                element = self._wait_until(
+                    EC.element_to_be_clickable(locator),
+                    check=self._check('clickable', locator),
+                    timeout=timeout
                 )
                 # Scroll element into view to avoid click interception
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                time.sleep(0.2)  # Brief pause after scroll
+                self.scroll_into_view_and_settle(element)
                 element.click()
                 return  # Success
             except (StaleElementReferenceException, ElementClickInterceptedException) as e:
@@ -51,15 +351,17 @@ class SeleniumExtended:
                     # Try JavaScript click as fallback for intercepted elements
                     if isinstance(e, ElementClickInterceptedException):
                         try:
-                            element = WebDriverWait(self.driver, timeout).until(
-                                EC.presence_of_element_located(locator)
+                            element = self._wait_until(
+                                EC.presence_of_element_located(locator),
+                                check=self._check('present', locator),
+                                timeout=timeout
                             )
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
                             self.driver.execute_script("arguments[0].click();", element)
                             return  # Success with JS click
                         except:
                             pass
-                    time.sleep(self.retry_delay)
+                    self.wait_for_paint()
                     continue
                 else:
                     raise  # Re-raise on final attempt
@@ -67,8 +369,10 @@ class SeleniumExtended:
     def wait_until_element_contains_text(self, locator, text, timeout=None):
         timeout = timeout if timeout else self.default_timeout
 
-        WebDriverWait(self.driver, timeout).until(
+        self._wait_until(
             EC.text_to_be_present_in_element(locator, text),
+            check=self._check('text', locator, text),
+            timeout=timeout,
             message=f'Element with locator = {locator}, does not contain text: "{text}", after waiting {timeout} seconds.'
         )
 
@@ -76,14 +380,18 @@ class SeleniumExtended:
         timeout = timeout if timeout else self.default_timeout
 
         if isinstance(locator_or_element, tuple):
-            elem = WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator_or_element)
+            elem = self._wait_until(
+                EC.visibility_of_element_located(locator_or_element),
+                check=self._check('visible', locator_or_element),
+                timeout=timeout
             )
         else:
             import selenium.webdriver.remote.webelement
             if isinstance(locator_or_element, selenium.webdriver.remote.webelement.WebElement):
-                elem = WebDriverWait(self.driver, timeout).until(
-                    EC.visibility_of(locator_or_element)
+                # No in-page check for an element handle; always polls
+                elem = self._wait_until(
+                    EC.visibility_of(locator_or_element),
+                    timeout=timeout
                 )
             else:
                 raise TypeError(f"The locator to check visibility must be a 'tuple' or a 'WebElement'. It was {type(locator_or_element)}")
@@ -93,8 +401,10 @@ class SeleniumExtended:
     def wait_until_elements_are_visible(self, locator, timeout=None):
         timeout = timeout if timeout else self.default_timeout
 
-        elem = WebDriverWait(self.driver, timeout).until(
-            EC.visibility_of_all_elements_located(locator)
+        elem = self._wait_until(
+            EC.visibility_of_all_elements_located(locator),
+            check=self._check('all_visible', locator),
+            timeout=timeout
         )
 
         return elem
@@ -104,26 +414,199 @@ class SeleniumExtended:
         err = err if err else f"Unable to find elements located by '{locator}'," \
                               f"after timeout of {timeout}"
         try:
-            elements = WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_all_elements_located(locator)
+            elements = self._wait_until(
+                EC.visibility_of_all_elements_located(locator),
+                check=self._check('all_visible', locator),
+                timeout=timeout
             )
         except TimeoutException:
             raise TimeoutException(err)
 
         return elements
 
+    def snapshot(self, locators, attributes=None, wait_until_visible=False, timeout=None, children=None):
+        """
+        Reads many locators in a single browser round trip. No element handles are kept, so there are no
+        stale element retries and no per-element '.text' / 'get_attribute' commands.
+
+        Example:
+            data = self.sl.snapshot({'thumbs': self.PRODUCT_ALTERNATE_IMAGES}, attributes=['src'])
+            srcs = [m['attributes']['src'] for m in data['thumbs']]
+
+        :param locators: Dict of key -> locator tuple.
+        :param attributes: Optional list of attribute names to read for every match (e.g. ['src', 'href']),
+                           or a dict of key -> list to read different attributes per locator.
+        :param wait_until_visible: If True, waits until every locator has at least one match and all its
+                                   matches are visible (same as wait_until_elements_are_visible).
+        :param timeout: Optional timeout for wait_until_visible (defaults to self.default_timeout)
+        :param children: Optional dict of key -> {name: CSS selector} to also read, for every match of that key,
+                         the first descendant matching each selector (e.g. {'items': {'image': 'img'}}), so
+                         parts of a list item stay paired with their item. Read with the key's attributes.
+        :return: Dict of key -> list of matches in document order. Each match is a dict with
+                 'text', 'attributes' (name -> value or None), 'visible' and 'rect' (x, y, width, height);
+                 keys in 'children' also get 'children' (name -> match dict, or None if not found).
+        """
+        timeout = timeout if timeout else self.default_timeout
+        if isinstance(attributes, dict):
+            attributes = {key: list(names) for key, names in attributes.items()}
+        else:
+            attributes = list(attributes or [])
+        locators = {key: list(locator) for key, locator in locators.items()}
+        children = dict(children or {})
+
+        def read(driver):
+            return driver.execute_script(_JS_SNAPSHOT, locators, attributes, children)
+
+        if not wait_until_visible:
+            return read(self.driver)
+
+        def all_visible(driver):
+            data = read(driver)
+            for matches in data.values():
+                if not matches or not all(match['visible'] for match in matches):
+                    return False
+            return data
+
+        return self._wait_until(
+            all_visible,
+            timeout=timeout,
+            message=f'Not all elements visible for locators = {locators} after waiting {timeout} seconds.'
+        )
+
+    def wait_until_page_is_settled(self, ready_locator=None, timeout=None):
+        """
+        Waits until the document finished loading, no jQuery AJAX request is pending and, if given,
+        'ready_locator' is present. Used as the single wait before non-blocking checks (is_present_now).
+
+        :param ready_locator: Optional locator tuple that must be present (e.g. the page's ready_locator)
+        :param timeout: Optional timeout (defaults to self.default_timeout)
+        """
+        timeout = timeout if timeout else self.default_timeout
+
+        def settled(driver):
+            if not driver.execute_script(_JS_PAGE_SETTLED):
+                return False
+            return ready_locator is None or bool(driver.find_elements(*ready_locator))
+
+        self._wait_until(
+            settled,
+            timeout=timeout,
+            message=f'Page not settled (document loading, AJAX pending or {ready_locator} not present) '
+                    f'after waiting {timeout} seconds.'
+        )
+
+    def is_present_now(self, locator, visible=True, settled_locator=None, legacy_timeout=None, timeout=None):
+        """
+        Answers 'is this element on the page?' without waiting for it: waits once for the page to be
+        settled, then checks immediately. Use it instead of try/except around a visibility wait, which
+        only reports absence after the whole timeout.
+
+        :param locator: Locator tuple to check
+        :param visible: If True (default) at least one match must be visible; if False presence in the DOM is enough.
+        :param settled_locator: Optional locator passed to wait_until_page_is_settled() (e.g. the page's ready_locator)
+        :param legacy_timeout: Timeout of the visibility wait this call replaces. When the element is absent,
+                               the difference to the time actually spent is added to 'absence_checks.seconds_saved'.
+        :param timeout: Optional timeout for the settle wait (defaults to self.default_timeout)
+        :return: True if present (and visible if requested), False otherwise.
+        """
+        start = time.perf_counter()
+        self.wait_until_page_is_settled(ready_locator=settled_locator, timeout=timeout)
+        matches = self.snapshot({'matches': locator})['matches']
+        present = any(match['visible'] for match in matches) if visible else bool(matches)
+
+        metrics_helpers.increment("absence_checks.count")
+        if not present and legacy_timeout:
+            saved = legacy_timeout - (time.perf_counter() - start)
+            if saved > 0:
+                metrics_helpers.increment("absence_checks.seconds_saved", saved)
+        return present
+
+    def assert_absent(self, locator, visible=True, settled_locator=None, message=None, legacy_timeout=None):
+        """
+        Asserts the element is not on the page (or not visible, if visible=True) once the page is settled.
+        See is_present_now() for the parameters.
+        """
+        if self.is_present_now(locator, visible=visible, settled_locator=settled_locator,
+                               legacy_timeout=legacy_timeout):
+            raise AssertionError(message or f"Element with locator = {locator} should not be on the page but it is.")
+
+    def assert_stays_hidden(self, locator, grace_seconds=1, message=None, legacy_timeout=None):
+        """
+        Asserts the element is not visible (absent, or in the DOM but hidden) and does not become visible
+        within 'grace_seconds', e.g. because it is injected or shown a moment later. Fails as soon as it is
+        visible and passes as soon as the grace period is over, in one bounded wait.
+
+        :param grace_seconds: How long the element must stay hidden
+        :param legacy_timeout: Timeout of the visibility wait this call replaces (see is_present_now)
+        """
+        start = time.perf_counter()
+        message = message or f"Element with locator = {locator} should not be visible but it is."
+
+        def hidden_through_grace(driver):
+            if any(match['visible'] for match in self.snapshot({'matches': locator})['matches']):
+                raise AssertionError(message)
+            return time.perf_counter() - start >= grace_seconds
+
+        self._wait_until(hidden_through_grace, timeout=grace_seconds + 1,
+                         message=f'Could not check that {locator} stays hidden within {grace_seconds} seconds.')
+        metrics_helpers.increment("absence_checks.count")
+        if legacy_timeout and legacy_timeout > grace_seconds:
+            metrics_helpers.increment("absence_checks.seconds_saved", legacy_timeout - (time.perf_counter() - start))
+
+    def wait_for_any(self, candidates, timeout=None):
+        """
+        Waits until the first of several alternatives matches and returns it, instead of waiting out a full
+        timeout on one locator before trying the next. All candidates are checked in the same poll (or
+        observer wake-up); when several match at once, the earliest in the list wins.
+
+        :param candidates: List of locator tuples (matched when an element is visible) and/or callables taking
+                           the driver and returning a truthy value (e.g. an expected condition) when matched.
+        :param timeout: Optional timeout (defaults to self.default_timeout)
+        :return: Tuple (winning candidate, value) where value is the visible element for a locator, or the
+                 callable's return value.
+        """
+        timeout = timeout if timeout else self.default_timeout
+
+        def first_match(driver):
+            for candidate in candidates:
+                try:
+                    if isinstance(candidate, tuple):
+                        value = next((element for element in driver.find_elements(*candidate)
+                                      if element.is_displayed()), None)
+                    else:
+                        value = candidate(driver)
+                except (NoSuchElementException, StaleElementReferenceException):
+                    continue
+                if value:
+                    return candidate, value
+            return False
+
+        # Callables have no in-page description, so the observer can only be used for locator-only races
+        checks = None
+        if all(isinstance(candidate, tuple) for candidate in candidates):
+            checks = [self._check('visible', candidate) for candidate in candidates]
+
+        return self._wait_until(
+            first_match,
+            check=checks,
+            timeout=timeout,
+            message=f'None of the candidates matched after waiting {timeout} seconds: {candidates}'
+        )
+
     def wait_and_get_text(self, locator, timeout=None):
         timeout = timeout if timeout else self.default_timeout
         
         for attempt in range(self.max_retries):
             try:
-                element = WebDriverWait(self.driver, timeout).until(
-                    EC.visibility_of_element_located(locator)
+                element = self._wait_until(
+                    EC.visibility_of_element_located(locator),
+                    check=self._check('visible', locator),
+                    timeout=timeout
                 )
                 return element.text
             except StaleElementReferenceException:
                 if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
+                    self.wait_for_paint()
                     continue
                 else:
                     raise  # Re-raise on final attempt
@@ -131,8 +614,10 @@ class SeleniumExtended:
     def wait_until_url_contains(self, url_substring, timeout=None):
         timeout = timeout if timeout else self.default_timeout
 
-        elem = WebDriverWait(self.driver, timeout).until(
-            EC.url_contains(url_substring)
+        self._wait_until(
+            EC.url_contains(url_substring),
+            check=self._check('url', text=url_substring),
+            timeout=timeout
         )
 
     def wait_and_select_dropdown(self, locator, to_select, select_by='visible_text', timeout=None):
@@ -162,7 +647,7 @@ class SeleniumExtended:
                 return  # Success
             except StaleElementReferenceException:
                 if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
+                    self.wait_for_paint()
                     continue
                 else:
                     raise  # Re-raise on final attempt
@@ -186,7 +671,7 @@ class SeleniumExtended:
                 return select.first_selected_option.text
             except StaleElementReferenceException:
                 if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
+                    self.wait_for_paint()
                     continue
                 else:
                     raise  # Re-raise on final attempt
@@ -194,30 +679,63 @@ class SeleniumExtended:
     def wait_and_get_dropdown_options_with_attributes(self, locator, value_attr='value', timeout=None):
         """
         Gets dropdown option elements and extracts their value and text attributes.
-        Handles stale element exceptions during element retrieval and attribute access.
+        Reads all options in one snapshot() call, so no element handles can go stale.
         
         :param locator: Locator tuple for the dropdown option elements
         :param value_attr: Attribute name to extract as 'value' (default: 'value')
         :param timeout: Optional timeout (defaults to self.default_timeout)
         :return: List of dictionaries with 'value' and 'text' keys
         """
-        timeout = timeout if timeout else self.default_timeout
-        
-        for attempt in range(self.max_retries):
+        snapshot = self.snapshot({'options': locator}, attributes=[value_attr],
+                                 wait_until_visible=True, timeout=timeout)
+        return [{'value': option['attributes'][value_attr], 'text': option['text']}
+                for option in snapshot['options']]
+
+    def scroll_into_view_and_settle(self, element):
+        """
+        Scrolls the element to the centre of the viewport and returns once scrolling has finished
+        (element position stable for two animation frames) instead of sleeping a fixed time.
+        """
+        with metrics_helpers.timed("settle.scroll_seconds"):
+            self.driver.execute_async_script(_JS_SCROLL_INTO_VIEW_AND_SETTLE, element)
+
+    def wait_for_paint(self):
+        """
+        Returns once the browser has painted pending DOM changes (two animation frames). Used before
+        retrying a stale element and before screenshots. Never raises (e.g. while an alert is open).
+        """
+        with metrics_helpers.timed("settle.paint_seconds"):
             try:
-                options_elements = self.wait_until_elements_are_visible(locator, timeout=timeout)
-                value_and_text = []
-                for element in options_elements:
-                    # Re-check visibility to ensure element is not stale before accessing attributes
-                    self.wait_until_element_is_visible(element)
-                    value_and_text.append({
-                        'value': element.get_attribute(value_attr),
-                        'text': element.text
-                    })
-                return value_and_text
-            except StaleElementReferenceException:
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
-                    continue
-                else:
-                    raise  # Re-raise on final attempt
\ No newline at end of file
+                self.driver.execute_async_script(_JS_WAIT_FOR_PAINT)
+            except WebDriverException:
+                pass
+
+    def get_select_option_values(self, locator):
+        """Returns the option values of the select at 'locator', or None if it is not on the page."""
+        return self.driver.execute_script(_JS_SELECT_OPTION_VALUES, *locator)
+
+    def wait_until_select_is_repopulated(self, locator, previous_option_values, timeout=None, or_until=None):
+        """
+        Waits until a dependent select (e.g. state after choosing a country) shows different options than
+        'previous_option_values' (from get_select_option_values() before the change). A select that
+        appears or disappears counts as a change.
+
+        :param locator: Locator tuple of the dependent select
+        :param previous_option_values: Option values before the change (None if the select was not present)
+        :param timeout: Optional timeout (defaults to self.default_timeout)
+        :param or_until: Optional callable taking the driver that also ends the wait when it returns a truthy
+                         value, e.g. 'the update that would repopulate the select has finished' for changes
+                         that can leave the options as they were.
+        """
+        timeout = timeout if timeout else self.default_timeout
+
+        def repopulated(driver):
+            values = driver.execute_script(_JS_SELECT_OPTION_VALUES, *locator)
+            return values != previous_option_values or (or_until is not None and or_until(driver))
+
+        with metrics_helpers.timed("settle.dependent_select_seconds"):
+            self._wait_until(
+                repopulated,
+                timeout=timeout,
+                message=f'Options of select with locator = {locator} did not change after waiting {timeout} seconds.'
+            )
@@ -1,26 +1,183 @@
 
+
+import json
+import os
 import string
 import random
+import threading
+import time
+import logging as logger
 from datetime import datetime
-from woocommerce import API
-from ssqatest.src.helpers.config_helpers import get_api_credentials
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from woocommerce.oauth import OAuth
+from ssqatest.src.helpers.config_helpers import get_api_credentials, get_int_from_env
 from ssqatest.src.helpers.generic_helpers import generate_random_email_and_password
+from ssqatest.src.helpers import metrics_helpers
+from ssqatest.src.helpers.cache_helpers import TwoTierCache
 
 
-def create_api_object():
-    api_creds = get_api_credentials()
+class WooCommerceClient:
+    """
+    Thread-safe WooCommerce REST API client backed by one keep-alive connection pool.
+    Same call style as woocommerce.API (get/post/put/delete return a requests.Response), but requests
+    reuse open connections instead of paying a TCP (+TLS) handshake per call, are retried with backoff
+    on 429/5xx, and use per-endpoint timeouts.
+    Use get_api_client() to get the process-wide instance.
+    """
 
-    wcapi = API(
-        url=api_creds['base_url'],
-        consumer_key=api_creds['api_key'],
-        consumer_secret=api_creds['api_secret'],
-        version="wc/v3"
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    # POST is not retried: a create that reached the server before failing must not be repeated
+    RETRY_METHODS = ("GET", "PUT", "DELETE", "OPTIONS")
+    # Seconds; first matching endpoint prefix wins, anything else uses 'timeout'
+    ENDPOINT_TIMEOUTS = (
+        ("orders", 30),
+        ("customers", 20),
     )
 
-    return wcapi
+    def __init__(self, url, consumer_key, consumer_secret, version="wc/v3", pool_size=10, retries=3,
+                 backoff_factor=0.5, timeout=10):
+        self.url = url.rstrip("/")
+        self.consumer_key = consumer_key
+        self.consumer_secret = consumer_secret
+        self.version = version
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self.is_ssl = self.url.startswith("https")
+
+        self.session = requests.Session()
+        # Retries are done in request(): with OAuth (http) every attempt needs a fresh signature/nonce
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"user-agent": "ssqatest-WooCommerceClient", "accept": "application/json"})
+        if self.is_ssl:
+            self.session.auth = HTTPBasicAuth(consumer_key, consumer_secret)
+
+        self._adapter = adapter
+        self._lock = threading.Lock()
+        self._connections_seen = 0
+        # time.monotonic() until which the server asked us to back off (429 + Retry-After); read by
+        # the async helpers' limiter so concurrent callers pause instead of piling on more requests
+        self.throttled_until = 0.0
+
+    def _timeout_for(self, endpoint):
+        for prefix, timeout in self.ENDPOINT_TIMEOUTS:
+            if endpoint.startswith(prefix):
+                return timeout
+        return self.timeout
+
+    def _build_url(self, method, endpoint, params):
+        """Returns (url, params) for one attempt. Over plain http the params are signed into the url (OAuth 1.0a)."""
+        url = f"{self.url}/wp-json/{self.version}/{endpoint}"
+        if self.is_ssl:
+            return url, params
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        oauth = OAuth(url=url, consumer_key=self.consumer_key, consumer_secret=self.consumer_secret,
+                      version=self.version, method=method, oauth_timestamp=int(time.time()))
+        return oauth.get_oauth_url(), None
+
+    def _record_new_connections(self):
+        """Adds connections opened since the last call to 'api.connections_opened' (reuse = requests / connections)."""
+        pools = self._adapter.poolmanager.pools
+        with self._lock:
+            total = sum(pools[key].num_connections for key in pools.keys())
+            if total > self._connections_seen:
+                metrics_helpers.increment("api.connections_opened", total - self._connections_seen)
+                self._connections_seen = total
+
+    def request(self, method, endpoint, data=None, params=None):
+        """
+        Sends one API request, retrying idempotent methods on connection errors and 429/5xx responses.
+        Returns the final requests.Response (callers assert on status_code as before).
+        """
+        method = method.upper()
+        headers = {}
+        body = None
+        if data is not None:
+            body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+            headers["content-type"] = "application/json;charset=utf-8"
+        max_attempts = self.retries + 1 if method in self.RETRY_METHODS else 1
+
+        for attempt in range(1, max_attempts + 1):
+            url, query = self._build_url(method, endpoint, dict(params or {}))
+            metrics_helpers.increment("api.requests")
+            try:
+                response = self.session.request(method, url, params=query, data=body, headers=headers,
+                                                timeout=self._timeout_for(endpoint))
+            except requests.ConnectionError:
+                if attempt == max_attempts:
+                    raise
+                response = None
+            finally:
+                self._record_new_connections()
+
+            if response is not None and (response.status_code not in self.RETRY_STATUSES or attempt == max_attempts):
+                return response
+
+            delay = self.backoff_factor * (2 ** (attempt - 1))
+            retry_after = response.headers.get("Retry-After") if response is not None else None
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, int(retry_after))
+            if response is not None and response.status_code == 429:
+                metrics_helpers.increment("api.throttled")
+                with self._lock:
+                    self.throttled_until = max(self.throttled_until, time.monotonic() + delay)
+            logger.warning(f"API {method} {endpoint} failed "
+                           f"({response.status_code if response is not None else 'connection error'}), "
+                           f"retry {attempt}/{max_attempts - 1} in {delay:.1f}s")
+            metrics_helpers.increment("api.retries")
+            metrics_helpers.counted_sleep(delay)
+
+    def get(self, endpoint, params=None):
+        return self.request("GET", endpoint, params=params)
+
+    def post(self, endpoint, data, params=None):
+        return self.request("POST", endpoint, data=data, params=params)
+
+    def put(self, endpoint, data, params=None):
+        return self.request("PUT", endpoint, data=data, params=params)
+
+    def delete(self, endpoint, params=None):
+        return self.request("DELETE", endpoint, params=params)
+
+
+_api_client = None
+_api_client_lock = threading.Lock()
+
+
+def get_api_client():
+    """
+    Returns the process-wide WooCommerceClient (created on first use).
+    Optional settings: API_POOL_SIZE (default 10), API_RETRIES (default 3), API_TIMEOUT (seconds, default 10).
+    """
+    global _api_client
+    with _api_client_lock:
+        if _api_client is None:
+            api_creds = get_api_credentials()
+            _api_client = WooCommerceClient(
+                url=api_creds['base_url'],
+                consumer_key=api_creds['api_key'],
+                consumer_secret=api_creds['api_secret'],
+                version="wc/v3",
+                pool_size=get_int_from_env("API_POOL_SIZE", 10),
+                retries=get_int_from_env("API_RETRIES", 3),
+                timeout=get_int_from_env("API_TIMEOUT", 10),
+            )
+        return _api_client
+
+
+def create_api_object():
+    """Kept for existing callers; returns the shared pooled client (see get_api_client())."""
+    return get_api_client()
 
 def create_user():
-    api_obj = create_api_object()
+    api_obj = get_api_client()
     user_info = generate_random_email_and_password()
 
     create_customer_payload = {
@@ -40,7 +197,7 @@ def create_customer():
     Creates a customer via WooCommerce API and returns id, email, password.
     Use when you need the customer id (e.g. to create an order for that customer).
     """
-    api_obj = create_api_object()
+    api_obj = get_api_client()
     user_info = generate_random_email_and_password()
     payload = {"email": user_info["email"], "password": user_info["password"]}
     response = api_obj.post("customers", payload)
@@ -56,7 +213,7 @@ def create_order_for_customer(customer_id, product_id=None):
     :param product_id: Product to add to the order; if None, uses first available product (e.g. beanie).
     :return: Created order dict from API.
     """
-    api_obj = create_api_object()
+    api_obj = get_api_client()
     if product_id is None:
         product = get_product_by_slug("beanie")
         product_id = product["id"]
@@ -90,7 +247,7 @@ def create_coupon(coupon_code=None, length=7, expired=False):
             "date_expires": expiration_date
         }
 
-    api_obj = create_api_object()
+    api_obj = get_api_client()
     rs_api = api_obj.post('coupons', data=payload)
     assert rs_api.status_code == 201, f'Failed creating coupon. Status code {rs_api.status_code}. ' \
                                         f'Payload: {payload}. \n' \
@@ -99,7 +256,7 @@ def create_coupon(coupon_code=None, length=7, expired=False):
     return coupon_code
 
 def get_coupon_info_by_coupon_code(coupon_code):
-    api_obj = create_api_object()
+    api_obj = get_api_client()
     params = {'code': coupon_code}
     rs_api = api_obj.get('coupons', params=params)
     assert rs_api.status_code == 200, f"Failed getting coupon by coupon code: {coupon_code}"
@@ -107,20 +264,88 @@ def get_coupon_info_by_coupon_code(coupon_code):
     return rs_api.json()
 
 def delete_coupon_by_coupon_code(coupon_code):
-    api_obj = create_api_object()
+    api_obj = get_api_client()
     coupon_info = get_coupon_info_by_coupon_code(coupon_code)
     coupon_id = coupon_info[0]['id']
     rs_api = api_obj.delete(f"coupons/{coupon_id}", params={"force": True})
     assert rs_api.status_code == 200, f"Failed to delete coupon via api: coupon code: {coupon_code}"
 
-def get_product_by_slug(slug):
+_product_cache = None
+_product_cache_lock = threading.Lock()
+
+
+def _get_product_cache():
+    """Returns the product cache, or None if disabled with PRODUCT_CACHE=false."""
+    global _product_cache
+    if os.environ.get("PRODUCT_CACHE", "true").lower() == "false":
+        return None
+    with _product_cache_lock:
+        if _product_cache is None:
+            _product_cache = TwoTierCache("products")
+        return _product_cache
+
+
+def _product_cache_key(slug):
+    # Same slug is a different product on another environment
+    return f"{os.environ.get('ENV', 'test').lower()}.{slug}"
+
+
+# Review counts and ratings change without bumping a product's modified_gmt, so revalidation re-reads them
+_PRODUCT_RATING_FIELDS = ('rating_count', 'average_rating')
+
+
+def _fetch_product_revalidation(slug):
+    """Small query for the fields that decide whether a cached product can be used: modified_gmt and the ratings."""
+    rs_api = get_api_client().get('products', params={
+        'slug': slug,
+        '_fields': ','.join(('id', 'modified_gmt') + _PRODUCT_RATING_FIELDS),
+    })
+    if rs_api.status_code != 200 or not rs_api.json():
+        return None
+    return rs_api.json()[0]
+
+
+def invalidate_cached_product(product_id):
+    """Drops a product from the cache after it changed (price, reviews, ...). Called by the write helpers."""
+    cache = _get_product_cache()
+    if cache is not None:
+        env_prefix = _product_cache_key("")
+        cache.delete_where(lambda product: product.get('id') == int(product_id), key_prefix=env_prefix)
+
+
+def get_product_by_slug(slug, use_cache=True):
     """
     Fetches a single product by slug from the WooCommerce API.
     Used as source-of-truth for PDP tests (name, images, SKU, etc.).
+    Results are cached in memory and on disk (see cache_helpers) per environment: an entry younger than
+    PRODUCT_CACHE_TTL seconds (default 3600) is used without a request. An older one is revalidated with a
+    small query for modified_gmt and the rating fields (reviews do not change modified_gmt) and, if
+    modified_gmt is unchanged, used with the current ratings for another TTL. Writes through update_product()
+    and the review helpers invalidate the entry, so only changes made outside the run can be up to a TTL old.
     :param slug: Product slug (e.g. 'beanie', 'hoodie').
+    :param use_cache: Set False to always fetch from the API.
     :return: Product dict from API.
     """
-    api_obj = create_api_object()
+    cache = _get_product_cache() if use_cache else None
+    key = _product_cache_key(slug)
+    if cache is not None:
+        entry = cache.get(key)
+        if entry is not None:
+            product = entry['value']
+            if time.time() - entry['stored_at'] < get_int_from_env("PRODUCT_CACHE_TTL", 3600):
+                metrics_helpers.increment("product_cache.hits")
+                return product
+            current = _fetch_product_revalidation(slug)
+            if current is not None and current['id'] == product['id'] \
+                    and current.get('modified_gmt') == product.get('modified_gmt'):
+                metrics_helpers.increment("product_cache.revalidated")
+                for field in _PRODUCT_RATING_FIELDS:
+                    product[field] = current.get(field)
+                cache.set(key, product)
+                return product
+        metrics_helpers.increment("product_cache.misses")
+
+    api_obj = get_api_client()
     rs_api = api_obj.get('products', params={'slug': slug})
     assert rs_api.status_code == 200, (
         f"Failed to get product by slug '{slug}'. Status: {rs_api.status_code}. Response: {rs_api.text}"
@@ -129,6 +354,8 @@ def get_product_by_slug(slug):
     assert len(products) > 0, (
         f"No product found with slug '{slug}'. API returned empty list."
     )
+    if cache is not None:
+        cache.set(key, products[0])
     return products[0]
 
 
@@ -140,8 +367,9 @@ def update_product(product_id, data):
                  Use sale_price="" to remove sale.
     :return: Updated product dict from API.
     """
-    api_obj = create_api_object()
+    api_obj = get_api_client()
     rs_api = api_obj.put(f"products/{product_id}", data)
+    invalidate_cached_product(product_id)
     assert rs_api.status_code == 200, (
         f"Failed to update product {product_id}. Status: {rs_api.status_code}. Response: {rs_api.text}"
     )
@@ -158,7 +386,7 @@ def create_product_review(product_id, reviewer, review, rating, reviewer_email=N
     :param reviewer_email: Optional reviewer email (some stores require it).
     :return: Created review dict from API.
     """
-    api_obj = create_api_object()
+    api_obj = get_api_client()
     payload = {
         "product_id": product_id,
         "reviewer": reviewer,
@@ -168,6 +396,7 @@ def create_product_review(product_id, reviewer, review, rating, reviewer_email=N
     if reviewer_email:
         payload["reviewer_email"] = reviewer_email
     rs_api = api_obj.post("products/reviews", data=payload)
+    invalidate_cached_product(product_id)  # rating_count / average_rating change
     assert rs_api.status_code == 201, (
         f"Failed to create review for product {product_id}. "
         f"Status: {rs_api.status_code}. Response: {rs_api.text}"
@@ -181,7 +410,7 @@ def get_product_reviews(product_id):
     :param product_id: Product ID (int).
     :return: List of review dicts.
     """
-    api_obj = create_api_object()
+    api_obj = get_api_client()
     rs_api = api_obj.get("products/reviews", params={"product": product_id, "per_page": 100})
     assert rs_api.status_code == 200, (
         f"Failed to get reviews for product {product_id}. Status: {rs_api.status_code}. Response: {rs_api.text}"
@@ -195,12 +424,156 @@ def delete_product_review(review_id):
     :param review_id: Review ID (int).
     :return: Response dict (typically {"deleted": true, "previous": {...}}).
     """
-    api_obj = create_api_object()
+    api_obj = get_api_client()
     rs_api = api_obj.delete(f"products/reviews/{review_id}", params={"force": True})
     assert rs_api.status_code == 200, (
         f"Failed to delete review {review_id}. Status: {rs_api.status_code}. Response: {rs_api.text}"
     )
-    return rs_api.json()
+    deleted = rs_api.json()
+    product_id = (deleted.get("previous") or {}).get("product_id")
+    if product_id:
+        invalidate_cached_product(product_id)  # rating_count / average_rating change
+    return deleted
+
+
+# WooCommerce rejects batch requests with more than 100 items in total (create + update + delete)
+WC_BATCH_LIMIT = 100
+
+
+def batch_request(resource, create=None, update=None, delete=None, batch_size=WC_BATCH_LIMIT):
+    """
+    Creates/updates/deletes many objects through WooCommerce's '<resource>/batch' endpoint, split into
+    as many requests as the batch size limit requires.
+    Supported resources: 'coupons', 'products', 'customers', 'orders', 'products/reviews'.
+
+    :param resource: API resource, e.g. 'coupons'.
+    :param create: List of payloads to create.
+    :param update: List of payloads to update (each must contain 'id').
+    :param delete: List of ids to delete (batch deletes are permanent, like force=True).
+    :param batch_size: Max items per request (defaults to the server limit).
+    :return: Dict with 'create', 'update' and 'delete' lists, each in the same order as the input list.
+             An item that failed has an 'error' key, e.g. {"id": 0, "error": {"code": ..., "message": ...}}.
+    """
+    items = ([("create", item) for item in (create or [])]
+             + [("update", item) for item in (update or [])]
+             + [("delete", item) for item in (delete or [])])
+    results = {"create": [], "update": [], "delete": []}
+    api_obj = get_api_client()
+
+    for start in range(0, len(items), batch_size):
+        payload = {}
+        for operation, item in items[start:start + batch_size]:
+            payload.setdefault(operation, []).append(item)
+        rs_api = api_obj.post(f"{resource}/batch", data=payload)
+        assert rs_api.status_code == 200, (
+            f"Failed batch request to '{resource}/batch'. Status: {rs_api.status_code}. Response: {rs_api.text}"
+        )
+        response = rs_api.json()
+        # The server answers every operation list in request order
+        for operation, sent in payload.items():
+            returned = response.get(operation) or []
+            assert len(returned) == len(sent), (
+                f"Batch '{resource}' {operation}: sent {len(sent)} items, got {len(returned)} results."
+            )
+            results[operation].extend(returned)
+    return results
+
+
+def _assert_batch_succeeded(resource, results):
+    failures = [(operation, index, item["error"]) for operation, items in results.items()
+                for index, item in enumerate(items) if isinstance(item, dict) and item.get("error")]
+    assert not failures, f"Batch '{resource}' had {len(failures)} failed items (operation, index, error): {failures}"
+
+
+def create_coupons(qty=None, coupon_codes=None, length=7, expired=False):
+    """
+    Creates many coupons (same settings as create_coupon()) with batch requests.
+    :param qty: Number of coupons with random codes (ignored if coupon_codes is given).
+    :param coupon_codes: Optional list of codes to create.
+    :return: List of dicts with 'id' and 'code', in input order.
+    """
+    if coupon_codes is None:
+        coupon_codes = [''.join(random.choice(string.ascii_uppercase) for i in range(length)) for _ in range(qty)]
+    expiration_date = datetime.now().isoformat() if expired else None
+    payloads = [{"code": code, "discount_type": "percent", "amount": "100", "date_expires": expiration_date}
+                for code in coupon_codes]
+    results = batch_request("coupons", create=payloads)
+    _assert_batch_succeeded("coupons", results)
+    return [{"id": coupon["id"], "code": coupon["code"]} for coupon in results["create"]]
+
+
+def delete_coupons(coupon_ids):
+    """Deletes coupons by id with batch requests (no lookup per coupon code needed)."""
+    results = batch_request("coupons", delete=list(coupon_ids))
+    _assert_batch_succeeded("coupons", results)
+
+
+def create_customers(qty):
+    """
+    Creates 'qty' customers with batch requests.
+    :return: List of dicts with id, email, password (same shape as create_customer()).
+    """
+    users = [generate_random_email_and_password() for _ in range(qty)]
+    results = batch_request("customers", create=[{"email": u["email"], "password": u["password"]} for u in users])
+    _assert_batch_succeeded("customers", results)
+    return [{"id": customer["id"], "email": user["email"], "password": user["password"]}
+            for customer, user in zip(results["create"], users)]
+
+
+def delete_customers(customer_ids):
+    results = batch_request("customers", delete=list(customer_ids))
+    _assert_batch_succeeded("customers", results)
+
+
+def create_orders(payloads):
+    """Creates orders (list of order payloads, see create_order_for_customer()) with batch requests. Returns created orders."""
+    results = batch_request("orders", create=list(payloads))
+    _assert_batch_succeeded("orders", results)
+    return results["create"]
+
+
+def delete_orders(order_ids):
+    results = batch_request("orders", delete=list(order_ids))
+    _assert_batch_succeeded("orders", results)
+
+
+def update_products(updates):
+    """
+    Updates many products with batch requests.
+    :param updates: List of dicts, each with 'id' and the fields to change.
+    :return: Updated product dicts in input order.
+    """
+    results = batch_request("products", update=list(updates))
+    for product in updates:
+        invalidate_cached_product(product["id"])
+    _assert_batch_succeeded("products", results)
+    return results["update"]
+
+
+def create_product_reviews(reviews):
+    """
+    Creates many product reviews with batch requests.
+    :param reviews: List of dicts with product_id, reviewer, review, rating and optional reviewer_email.
+    :return: Created review dicts in input order.
+    """
+    payloads = [dict(review, rating=int(review["rating"])) for review in reviews]
+    results = batch_request("products/reviews", create=payloads)
+    for product_id in {review["product_id"] for review in reviews}:
+        invalidate_cached_product(product_id)  # rating_count / average_rating change
+    _assert_batch_succeeded("products/reviews", results)
+    return results["create"]
+
+
+def delete_product_reviews(review_ids):
+    """Deletes many product reviews by id with batch requests. Returns the deleted review dicts in input order."""
+    results = batch_request("products/reviews", delete=list(review_ids))
+    for review in results["delete"]:
+        # Each item is {"deleted": true, "previous": {...}} like the single delete response
+        product_id = (review.get("previous") or review).get("product_id")
+        if product_id:
+            invalidate_cached_product(product_id)  # rating_count / average_rating change
+    _assert_batch_succeeded("products/reviews", results)
+    return results["delete"]
 
 
 def get_random_products(qty=1, **kwargs):
@@ -217,7 +590,7 @@ def get_random_products(qty=1, **kwargs):
     :param kwargs:
     :return:
     """
-    api_obj = create_api_object()
+    api_obj = get_api_client()
 
     kwargs['per_page'] = 100
 
@@ -0,0 +1,143 @@
+"""
+asyncio variants of the api_helpers functions, for seeding independent test data at the same time.
+Every helper has the same name, arguments and return value as its api_helpers counterpart; it runs the
+synchronous helper in a worker thread over the shared pooled client, so connection reuse, retries and
+the product cache behave exactly as in sync code.
+
+Calls go through a per event loop limiter: at most API_CONCURRENCY (default 4) helpers run at once,
+API_RATE_LIMIT (calls per second, default 0 = no limit) spaces out their start times, and when the
+server answers 429 no new call starts until its Retry-After has passed.
+
+Example (class fixtures are synchronous, so use run()):
+    from ssqatest.src.helpers import api_helpers_async as api_async
+
+    product, coupon, customer = api_async.run(
+        api_async.get_product_by_slug("beanie"),
+        api_async.create_coupon(),
+        api_async.create_customer(),
+    )
+"""
+
+import asyncio
+import functools
+import time
+import weakref
+import logging as logger
+from contextlib import asynccontextmanager
+
+from ssqatest.src.helpers import api_helpers
+from ssqatest.src.helpers import metrics_helpers
+from ssqatest.src.helpers.config_helpers import get_int_from_env
+
+
+class ApiLimiter:
+    """
+    Concurrency and rate limiter for async API helper calls.
+    :param max_concurrency: helpers allowed to run at the same time
+    :param rate_per_second: max helper calls started per second (0 = no limit)
+    """
+
+    def __init__(self, max_concurrency=4, rate_per_second=0):
+        if max_concurrency < 1:
+            raise ValueError(f"❌ API_CONCURRENCY must be at least 1.\n"
+                             f"   Got: {max_concurrency}")
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._min_interval = 1 / rate_per_second if rate_per_second > 0 else 0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def _wait_for_turn(self):
+        """Sleeps until this call may start: after the previous call's rate slot and any server back-off."""
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start, api_helpers.get_api_client().throttled_until)
+            self._next_start = start + self._min_interval
+        if start > now:
+            metrics_helpers.increment("api_async.limiter_wait_seconds", start - now)
+            await asyncio.sleep(start - now)
+
+    @asynccontextmanager
+    async def slot(self):
+        async with self._semaphore:
+            await self._wait_for_turn()
+            yield
+
+
+# asyncio primitives belong to the loop they are first used on; run() starts a new loop per call
+_limiters = weakref.WeakKeyDictionary()
+
+
+def get_limiter():
+    """Returns the ApiLimiter of the running event loop (created on first use from API_CONCURRENCY/API_RATE_LIMIT)."""
+    loop = asyncio.get_running_loop()
+    limiter = _limiters.get(loop)
+    if limiter is None:
+        limiter = ApiLimiter(max_concurrency=get_int_from_env("API_CONCURRENCY", 4),
+                             rate_per_second=get_int_from_env("API_RATE_LIMIT", 0))
+        _limiters[loop] = limiter
+    return limiter
+
+
+def _to_async(func):
+    """Wraps a synchronous api_helpers function as a coroutine function that runs it under the limiter."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        async with get_limiter().slot():
+            metrics_helpers.increment("api_async.calls")
+            return await asyncio.to_thread(func, *args, **kwargs)
+    return wrapper
+
+
+async def gather(*aws):
+    """
+    Awaits the given coroutines concurrently and returns their results in the same order.
+    If one fails the others still finish (no half-created data is left running), then the first error is raised.
+    """
+    results = await asyncio.gather(*aws, return_exceptions=True)
+    errors = [r for r in results if isinstance(r, BaseException)]
+    for error in errors[1:]:
+        logger.error(f"Concurrent API call also failed: {error!r}")
+    if errors:
+        raise errors[0]
+    return list(results)
+
+
+def run(*aws):
+    """
+    Runs the given coroutines concurrently from synchronous code (fixtures, scripts) and returns their results.
+    One coroutine returns its result; several return a list in the same order.
+    Setup time is close to the slowest single call instead of the sum of all calls.
+    """
+    if not aws:
+        raise ValueError("❌ run() needs at least one coroutine.")
+    start = time.perf_counter()
+    try:
+        results = asyncio.run(gather(*aws))
+    finally:
+        metrics_helpers.increment("api_async.run_seconds", time.perf_counter() - start)
+    return results[0] if len(aws) == 1 else results
+
+
+create_user = _to_async(api_helpers.create_user)
+create_customer = _to_async(api_helpers.create_customer)
+create_order_for_customer = _to_async(api_helpers.create_order_for_customer)
+create_coupon = _to_async(api_helpers.create_coupon)
+get_coupon_info_by_coupon_code = _to_async(api_helpers.get_coupon_info_by_coupon_code)
+delete_coupon_by_coupon_code = _to_async(api_helpers.delete_coupon_by_coupon_code)
+get_product_by_slug = _to_async(api_helpers.get_product_by_slug)
+update_product = _to_async(api_helpers.update_product)
+create_product_review = _to_async(api_helpers.create_product_review)
+get_product_reviews = _to_async(api_helpers.get_product_reviews)
+delete_product_review = _to_async(api_helpers.delete_product_review)
+batch_request = _to_async(api_helpers.batch_request)
+create_coupons = _to_async(api_helpers.create_coupons)
+delete_coupons = _to_async(api_helpers.delete_coupons)
+create_customers = _to_async(api_helpers.create_customers)
+delete_customers = _to_async(api_helpers.delete_customers)
+create_orders = _to_async(api_helpers.create_orders)
+delete_orders = _to_async(api_helpers.delete_orders)
+update_products = _to_async(api_helpers.update_products)
+create_product_reviews = _to_async(api_helpers.create_product_reviews)
+delete_product_reviews = _to_async(api_helpers.delete_product_reviews)
+get_random_products = _to_async(api_helpers.get_random_products)
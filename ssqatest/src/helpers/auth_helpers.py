@@ -2,22 +2,37 @@
 Authentication helpers for tests that need a logged-in session.
 Uses HTTP login (e.g. wp-login.php) to obtain cookies and injects them
 into the Selenium WebDriver so the browser is logged in without UI login.
+
+Logged-in states (cookies plus localStorage) are cached per user and environment, in memory and on
+disk (CACHE_DIR, default RESULTS_DIR/cache), so each user logs in once per run, or once until the
+login cookie expires, and every class, worker and later run restores the same state.
+AUTH_STATE_CACHE=false logs in for every class instead.
 """
 
+import json
+import os
+import threading
+import time
+import logging as logger
+
 import requests
+from urllib.parse import urlsplit
+from selenium.common.exceptions import WebDriverException
+from ssqatest.src.helpers import metrics_helpers
+from ssqatest.src.helpers.driver_helpers import is_chromium
+from ssqatest.src.helpers.cache_helpers import TwoTierCache
 
 
-def login_via_requests_and_inject_cookies(base_url, username, password, driver):
-    """
-    Log in via WordPress wp-login.php using requests, then inject the
-    session cookies into the given Selenium WebDriver so subsequent
-    navigations are authenticated.
+# A cached state is not used when its login cookie expires within this many seconds
+AUTH_STATE_EXPIRY_MARGIN = 300
+# Lifetime assumed for states whose cookies have no expiry (browser-session cookies)
+AUTH_STATE_DEFAULT_TTL = 3600
 
-    :param base_url: Site base URL (e.g. https://demostore.supersqa.com), no trailing slash.
-    :param username: Login username (or email).
-    :param password: Login password.
-    :param driver: Selenium WebDriver instance.
-    :raises AssertionError: If login response indicates failure (e.g. still on wp-login).
+
+def _login_via_requests(base_url, username, password):
+    """
+    Logs in via WordPress wp-login.php with requests and returns the session cookies
+    as Selenium cookie dicts (no domain, so they apply to the page they are added on).
     """
     login_url = base_url.rstrip("/") + "/wp-login.php"
     session = requests.Session()
@@ -29,6 +44,8 @@ def login_via_requests_and_inject_cookies(base_url, username, password, driver):
             "log": username,
             "pwd": password,
             "wp-submit": "Log In",
+            # persistent cookies carry an expiry, which is how long a cached state stays usable
+            "rememberme": "forever",
         },
         allow_redirects=True,
         timeout=15,
@@ -41,10 +58,7 @@ def login_via_requests_and_inject_cookies(base_url, username, password, driver):
             f"Login failed: final URL is still wp-login.php. Check credentials for user '{username}'."
         )
 
-    # Ensure driver is on the same origin so cookies apply
-    driver.get(base_url)
-
-    # Selenium add_cookie uses current page domain; do not pass domain so it matches.
+    cookies = []
     for cookie in session.cookies:
         cookie_dict = {
             "name": cookie.name,
@@ -55,8 +69,218 @@ def login_via_requests_and_inject_cookies(base_url, username, password, driver):
             cookie_dict["expiry"] = int(cookie.expires)
         if cookie.secure:
             cookie_dict["secure"] = True
+        cookies.append(cookie_dict)
+    return cookies
+
+
+def _set_cookies_via_cdp(driver, base_url, cookies):
+    """
+    Sets all cookies for base_url's host in one Network.setCookies call. Needs no page to be open,
+    so the browser can stay on about:blank until the first real navigation.
+    """
+    cdp_cookies = []
+    for cookie_dict in cookies:
+        cdp_cookie = {
+            "name": cookie_dict["name"],
+            "value": cookie_dict["value"],
+            # host-only cookie for base_url's host, same as add_cookie without a domain
+            "url": base_url,
+            "path": cookie_dict.get("path", "/"),
+            "secure": cookie_dict.get("secure", False),
+        }
+        if "expiry" in cookie_dict:
+            cdp_cookie["expires"] = cookie_dict["expiry"]
+        cdp_cookies.append(cdp_cookie)
+    driver.execute_cdp_cmd("Network.setCookies", {"cookies": cdp_cookies})
+
+
+def _add_cookies(driver, base_url, cookies):
+    """
+    Puts cookies into the browser for base_url's domain.
+    Chrome: one DevTools call before any navigation. Other browsers (or if that call fails): open base_url,
+    then add the cookies one by one (Selenium add_cookie uses the current page's domain).
+    """
+    if is_chromium(driver):
+        try:
+            _set_cookies_via_cdp(driver, base_url, cookies)
+            metrics_helpers.increment("auth_state.cdp_cookie_injections")
+            return
+        except WebDriverException as e:
+            logger.warning(f"Network.setCookies failed, adding cookies after opening {base_url}: {e}")
+
+    # Ensure driver is on the same origin so cookies apply
+    driver.get(base_url)
+    metrics_helpers.increment("auth_state.cookie_page_loads")
+    for cookie_dict in cookies:
         try:
             driver.add_cookie(cookie_dict)
         except Exception as e:
-            if "wordpress_logged_in" in cookie.name or "wordpress_" in cookie.name:
+            if "wordpress_" in cookie_dict["name"]:
                 raise e
+
+
+# Sets localStorage items when a document of the given origin loads (before the page's own scripts run)
+_JS_SET_LOCAL_STORAGE_ON_LOAD = """
+(function (origin, items) {
+    if (window.location.origin !== origin) { return; }
+    for (const [k, v] of Object.entries(items)) { window.localStorage.setItem(k, v); }
+})(%s, %s);
+"""
+
+# Identifiers of the localStorage scripts added by _set_local_storage, per driver session
+_local_storage_scripts = {}
+
+
+def _set_local_storage(driver, base_url, local_storage):
+    """
+    Writes localStorage items for base_url's origin. Chrome registers a script that sets them when the next
+    page of that origin loads, so no page is opened here; finish_auth_state_restore() removes it again.
+    Otherwise (or if that fails) base_url is opened first unless the browser is already on that origin.
+    """
+    if is_chromium(driver):
+        parts = urlsplit(base_url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        try:
+            script = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                "source": _JS_SET_LOCAL_STORAGE_ON_LOAD % (json.dumps(origin), json.dumps(local_storage)),
+            })
+            _local_storage_scripts.setdefault(driver.session_id, []).append(script["identifier"])
+            return
+        except (WebDriverException, KeyError) as e:
+            logger.warning(f"Page.addScriptToEvaluateOnNewDocument failed, setting localStorage from the page: {e}")
+
+    if not driver.current_url.startswith(base_url.rstrip("/")):
+        driver.get(base_url)
+    driver.execute_script(
+        "for (const [k, v] of Object.entries(arguments[0])) { window.localStorage.setItem(k, v); }",
+        local_storage,
+    )
+
+
+def login_via_requests_and_inject_cookies(base_url, username, password, driver):
+    """
+    Log in via WordPress wp-login.php using requests, then inject the
+    session cookies into the given Selenium WebDriver so subsequent
+    navigations are authenticated.
+
+    :param base_url: Site base URL (e.g. https://demostore.supersqa.com), no trailing slash.
+    :param username: Login username (or email).
+    :param password: Login password.
+    :param driver: Selenium WebDriver instance.
+    :raises AssertionError: If login response indicates failure (e.g. still on wp-login).
+    """
+    _add_cookies(driver, base_url, _login_via_requests(base_url, username, password))
+
+
+_auth_state_cache = None
+_auth_state_locks = {}
+_auth_state_locks_lock = threading.Lock()
+
+
+def _get_auth_state_cache():
+    global _auth_state_cache
+    if _auth_state_cache is None:
+        _auth_state_cache = TwoTierCache("auth_state")
+    return _auth_state_cache
+
+
+def _auth_state_key(user_id, username):
+    env = os.environ.get("ENV", "test").lower()
+    return f"{env}-{user_id}-{username}"
+
+
+def _lock_for(key):
+    with _auth_state_locks_lock:
+        return _auth_state_locks.setdefault(key, threading.Lock())
+
+
+def _state_expires_at(cookies, now):
+    """Earliest expiry of the WordPress auth cookies, or now + AUTH_STATE_DEFAULT_TTL if they have none."""
+    expiries = [c["expiry"] for c in cookies if c["name"].startswith("wordpress_") and "expiry" in c]
+    return min(expiries) if expiries else now + AUTH_STATE_DEFAULT_TTL
+
+
+def _is_auth_state_cache_enabled():
+    return os.environ.get("AUTH_STATE_CACHE", "true").strip().lower() not in ("false", "0", "no")
+
+
+def get_auth_state(base_url, user_id, username, password, refresh=False):
+    """
+    Returns the logged-in state {'cookies': [...], 'local_storage': {...}, 'expires_at': <epoch seconds>}
+    for a test user: the cached one while its login cookie is still valid, otherwise a fresh HTTP login.
+    Concurrent callers for the same user in one process share a single login.
+
+    :param user_id: Test user profile id (e.g. 'my_account_smoke_user'); part of the cache key with ENV and username.
+    :param refresh: Ignore the cached state and log in again (e.g. after the server rejected it).
+    """
+    key = _auth_state_key(user_id, username)
+    use_cache = _is_auth_state_cache_enabled()
+    with _lock_for(key):
+        now = time.time()
+        if use_cache and not refresh:
+            cached = _get_auth_state_cache().get(key)
+            if cached is not None and cached["value"]["expires_at"] - AUTH_STATE_EXPIRY_MARGIN > now:
+                metrics_helpers.increment("auth_state.cache_hits")
+                return cached["value"]
+
+        with metrics_helpers.timed("auth_state.login_seconds"):
+            cookies = _login_via_requests(base_url, username, password)
+        metrics_helpers.increment("auth_state.logins")
+        state = {"cookies": cookies, "local_storage": {}, "expires_at": _state_expires_at(cookies, now)}
+        if use_cache:
+            _get_auth_state_cache().set(key, state)
+        return state
+
+
+def invalidate_auth_state(user_id, username):
+    """Drops the cached state of a user (memory and disk), so the next get_auth_state() logs in again."""
+    _get_auth_state_cache().delete(_auth_state_key(user_id, username))
+
+
+def inject_auth_state(driver, base_url, state):
+    """
+    Restores a state from get_auth_state() into the driver: cookies for base_url's domain, then its localStorage.
+    On Chrome nothing is loaded, so the caller's next navigation is the class's first page load; call
+    finish_auth_state_restore() after that navigation.
+    """
+    with metrics_helpers.timed("auth_state.restore_seconds"):
+        _add_cookies(driver, base_url, state["cookies"])
+        if state.get("local_storage"):
+            _set_local_storage(driver, base_url, state["local_storage"])
+
+
+def finish_auth_state_restore(driver):
+    """
+    Removes the localStorage scripts inject_auth_state() registered (Chrome), once the first page of the
+    site has loaded, so later pages, and later classes on the same browser, do not get the state set again.
+    """
+    for identifier in _local_storage_scripts.pop(driver.session_id, []):
+        try:
+            driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": identifier})
+        except WebDriverException as e:
+            logger.warning(f"Could not remove the localStorage restore script {identifier}: {e}")
+
+
+def remember_local_storage(driver, user_id, username):
+    """
+    Stores the current page's localStorage in the user's cached state, so later restores bring it back too.
+    Call on a page of the site after a successful restore.
+    """
+    if not _is_auth_state_cache_enabled():
+        return
+    key = _auth_state_key(user_id, username)
+    with _lock_for(key):
+        cached = _get_auth_state_cache().get(key)
+        if cached is None:
+            return
+        try:
+            local_storage = driver.execute_script(
+                "const s = {}; for (let i = 0; i < window.localStorage.length; i++) {"
+                " const k = window.localStorage.key(i); s[k] = window.localStorage.getItem(k); } return s;"
+            )
+        except Exception as e:
+            logger.debug(f"Could not read localStorage for the auth state cache: {e}")
+            return
+        state = cached["value"]
+        state["local_storage"] = local_storage or {}
+        _get_auth_state_cache().set(key, state, stored_at=cached["stored_at"])
@@ -0,0 +1,119 @@
+"""
+Two-tier (in-process LRU + on-disk JSON) cache for data that is expensive to fetch and rarely changes,
+e.g. catalog products looked up by every PDP class fixture.
+The disk tier lives under CACHE_DIR (or RESULTS_DIR/cache), so it is shared by parallel workers and
+survives between runs. Entries carry the time they were stored; callers decide what is fresh enough. A memory entry is only
+used while its disk file is unchanged, so an invalidation by one worker is seen by all of them.
+"""
+
+import copy
+import json
+import os
+import re
+import threading
+import time
+import logging as logger
+from collections import OrderedDict
+
+
+def get_cache_dir():
+    """Returns CACHE_DIR, or RESULTS_DIR/cache, or None (memory-only cache) if neither is set."""
+    cache_dir = os.environ.get("CACHE_DIR")
+    if cache_dir:
+        return cache_dir
+    results_dir = os.environ.get("RESULTS_DIR")
+    return os.path.join(results_dir, "cache") if results_dir else None
+
+
+class TwoTierCache:
+    """
+    Thread-safe cache of JSON-serializable values.
+    get() returns a dict {'value': ..., 'stored_at': <epoch seconds>} (a deep copy) or None.
+    """
+
+    def __init__(self, namespace, max_memory_entries=128, cache_dir=None):
+        self.namespace = namespace
+        self.max_memory_entries = max_memory_entries
+        base_dir = cache_dir if cache_dir is not None else get_cache_dir()
+        self.dir = os.path.join(base_dir, namespace) if base_dir else None
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        safe_key = re.sub(r"[^A-Za-z0-9_.-]", "_", key)
+        return os.path.join(self.dir, f"{safe_key}.json")
+
+    def _remember(self, key, entry, mtime=None):
+        self._memory[key] = (entry, mtime)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        try:
+            mtime = os.stat(self._path(key)).st_mtime_ns if self.dir else None
+        except FileNotFoundError:
+            # Deleted on disk (possibly by another worker): the memory copy is invalid too
+            with self._lock:
+                self._memory.pop(key, None)
+            return None
+
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None and cached[1] == mtime:
+                self._memory.move_to_end(key)
+                return copy.deepcopy(cached[0])
+        if not self.dir:
+            return None
+
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {self._path(key)}: {e}")
+            return None
+        with self._lock:
+            self._remember(key, entry, mtime)
+        return copy.deepcopy(entry)
+
+    def set(self, key, value, stored_at=None):
+        entry = {"value": copy.deepcopy(value), "stored_at": stored_at if stored_at is not None else time.time()}
+        if not self.dir:
+            with self._lock:
+                self._remember(key, entry)
+            return
+        os.makedirs(self.dir, exist_ok=True)
+        path = self._path(key)
+        # Write then rename, so other workers never read a half-written file
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._remember(key, entry, os.stat(path).st_mtime_ns)
+
+    def delete(self, key):
+        with self._lock:
+            self._memory.pop(key, None)
+        if self.dir:
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def delete_where(self, predicate, key_prefix=""):
+        """Deletes every entry (memory and disk) with a key starting with 'key_prefix' whose value matches 'predicate'."""
+        keys = set()
+        with self._lock:
+            keys.update(k for k in self._memory if k.startswith(key_prefix))
+        if self.dir and os.path.isdir(self.dir):
+            safe_prefix = re.sub(r"[^A-Za-z0-9_.-]", "_", key_prefix)
+            for file_name in os.listdir(self.dir):
+                if file_name.startswith(safe_prefix) and file_name.endswith(".json"):
+                    keys.add(file_name[:-len(".json")])
+        for key in keys:
+            entry = self.get(key)
+            if entry is not None and predicate(entry["value"]):
+                self.delete(key)
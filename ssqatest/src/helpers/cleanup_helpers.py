@@ -0,0 +1,160 @@
+"""
+Deferred, bulk teardown of data created by tests through the API (coupons, reviews, customers, orders).
+Fixtures register what they created instead of deleting it inline; the registry deletes it with batch
+API calls on a background thread (once enough has piled up) and at the end of the session, so cleanup
+never blocks a test. Deletes that fail are written to RESULTS_DIR/cleanup_retry.jsonl and are retried
+at the start of the next session; they never fail a test.
+"""
+
+import json
+import os
+import threading
+import logging as logger
+from concurrent.futures import ThreadPoolExecutor
+
+from ssqatest.src.helpers import metrics_helpers
+from ssqatest.src.helpers.api_helpers import batch_request, get_coupon_info_by_coupon_code, WC_BATCH_LIMIT
+
+
+# Registry kind -> batch endpoint resource. Deleted in this order (reviews/orders before what they refer to).
+RESOURCES = {
+    "reviews": "products/reviews",
+    "orders": "orders",
+    "coupons": "coupons",
+    "customers": "customers",
+}
+
+
+class CleanupRegistry:
+    """
+    Collects ids of test-created objects and deletes them in bulk.
+
+    :param retry_file: Path of the JSON lines file for failed deletes (None = only log failures).
+    :param flush_threshold: Pending items that trigger a background flush.
+    """
+
+    def __init__(self, retry_file=None, flush_threshold=WC_BATCH_LIMIT):
+        self.retry_file = retry_file
+        self.flush_threshold = flush_threshold
+        self._pending = {kind: [] for kind in RESOURCES}
+        self._coupon_codes = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cleanup")
+        self._futures = []
+
+    def register(self, kind, resource_id):
+        """Queues an object for deletion, e.g. register("reviews", 123)."""
+        if kind not in RESOURCES:
+            raise ValueError(
+                f"❌ Unknown cleanup kind: '{kind}'\n"
+                f"   Valid kinds are: {', '.join(RESOURCES)}"
+            )
+        with self._lock:
+            self._pending[kind].append(int(resource_id))
+        self._maybe_flush_in_background()
+
+    def register_coupon_code(self, coupon_code):
+        """
+        Queues a coupon by code (as returned by create_coupon()); its id is looked up during the flush, one
+        API call per code. When the id is known (e.g. from create_coupons()) use register("coupons", id) instead.
+        """
+        with self._lock:
+            self._coupon_codes.append(coupon_code)
+        self._maybe_flush_in_background()
+
+    def pending_count(self):
+        with self._lock:
+            return sum(len(ids) for ids in self._pending.values()) + len(self._coupon_codes)
+
+    def _maybe_flush_in_background(self):
+        if self.pending_count() >= self.flush_threshold:
+            self.flush_in_background()
+
+    def flush_in_background(self):
+        """Starts deleting everything registered so far on the cleanup thread and returns immediately."""
+        with self._lock:
+            self._futures = [future for future in self._futures if not future.done()]
+            self._futures.append(self._executor.submit(self.flush))
+
+    def flush(self):
+        """Deletes everything registered so far (blocking). Failures go to the retry file."""
+        with self._lock:
+            pending = {kind: ids for kind, ids in self._pending.items() if ids}
+            self._pending = {kind: [] for kind in RESOURCES}
+            coupon_codes, self._coupon_codes = self._coupon_codes, []
+
+        failures = []
+        for coupon_code in coupon_codes:
+            try:
+                coupons = get_coupon_info_by_coupon_code(coupon_code)
+                pending.setdefault("coupons", []).extend(coupon["id"] for coupon in coupons)
+            except Exception as e:
+                failures.append({"kind": "coupon_codes", "id": coupon_code, "error": str(e)})
+
+        with metrics_helpers.timed("cleanup.flush_seconds"):
+            for kind, resource in RESOURCES.items():
+                ids = pending.get(kind)
+                if ids:
+                    failures.extend(self._delete(kind, resource, ids))
+
+        if failures:
+            metrics_helpers.increment("cleanup.failed", len(failures))
+            self._write_failures(failures)
+
+    def _delete(self, kind, resource, ids):
+        """Batch-deletes ids; returns a list of failure records."""
+        try:
+            results = batch_request(resource, delete=ids)
+        except Exception as e:
+            return [{"kind": kind, "id": resource_id, "error": str(e)} for resource_id in ids]
+        failures = []
+        for resource_id, item in zip(ids, results["delete"]):
+            if isinstance(item, dict) and item.get("error"):
+                error = item["error"]
+                # Already gone (e.g. deleted by the test itself) counts as cleaned up
+                if isinstance(error, dict) and "invalid" in str(error.get("code", "")):
+                    continue
+                failures.append({"kind": kind, "id": resource_id, "error": error})
+        metrics_helpers.increment("cleanup.deleted", len(ids) - len(failures))
+        return failures
+
+    def _write_failures(self, failures):
+        for failure in failures:
+            logger.warning(f"Cleanup failed for {failure['kind']} {failure['id']}: {failure['error']}")
+        if not self.retry_file:
+            return
+        os.makedirs(os.path.dirname(self.retry_file) or ".", exist_ok=True)
+        with self._lock, open(self.retry_file, "a", encoding="utf-8") as f:
+            for failure in failures:
+                f.write(json.dumps(failure, default=str) + "\n")
+
+    def requeue_retry_file(self):
+        """Registers the failures recorded by a previous session again and clears the retry file."""
+        if not self.retry_file or not os.path.exists(self.retry_file):
+            return 0
+        with open(self.retry_file, "r", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f if line.strip()]
+        os.remove(self.retry_file)
+        for record in records:
+            if record["kind"] == "coupon_codes":
+                self.register_coupon_code(record["id"])
+            else:
+                self.register(record["kind"], record["id"])
+        return len(records)
+
+    def close(self):
+        """Waits for background flushes, deletes whatever is left and stops the cleanup thread."""
+        for future in list(self._futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning(f"Background cleanup flush failed: {e}")
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+
+def build_cleanup_registry():
+    """Creates the session registry with its retry file under RESULTS_DIR (if set)."""
+    results_dir = os.environ.get("RESULTS_DIR")
+    retry_file = os.path.join(results_dir, "cleanup_retry.jsonl") if results_dir else None
+    return CleanupRegistry(retry_file=retry_file)
@@ -37,6 +37,10 @@ def validate_environment():
             'example': 'export DB_PASSWORD=root'
         }
     }
+    # The SQLite stand-in needs no credentials
+    if get_db_backend() == 'sqlite':
+        del required_vars['DB_USER']
+        del required_vars['DB_PASSWORD']
     
     # Check all required variables
     missing_vars = []
@@ -69,6 +73,36 @@ Note: All variables are required to ensure full test suite can run.
     
     return True
 
+def get_db_backend():
+    """
+    Returns the database backend from DB_BACKEND: 'mysql' (default, the shop database) or
+    'sqlite' (a local stand-in for hermetic DB-verification tests; see sqlite_db_helpers).
+    """
+    backend = os.environ.get('DB_BACKEND', 'mysql').strip().lower()
+    if backend not in ('mysql', 'sqlite'):
+        raise ValueError(
+            f"❌ Unknown DB_BACKEND: '{backend}'\n"
+            f"   Valid backends are: 'mysql', 'sqlite'\n"
+            f"   Set via: export DB_BACKEND=sqlite (defaults to 'mysql' if not set)"
+        )
+    return backend
+
+
+def get_wait_engine():
+    """
+    Returns the wait engine from WAIT_ENGINE: 'polling' (default, WebDriverWait) or
+    'observer' (in-page MutationObserver; see SeleniumExtended._wait_until).
+    """
+    wait_engine = os.environ.get('WAIT_ENGINE', 'polling').strip().lower()
+    if wait_engine not in ('polling', 'observer'):
+        raise ValueError(
+            f"❌ Unknown WAIT_ENGINE: '{wait_engine}'\n"
+            f"   Valid wait engines are: 'polling', 'observer'\n"
+            f"   Set via: export WAIT_ENGINE=observer (defaults to 'polling' if not set)"
+        )
+    return wait_engine
+
+
 def get_base_url():
 
     env = os.environ.get('ENV', 'test')
@@ -177,19 +211,31 @@ def get_api_credentials():
     return {'base_url': base_url, 'api_key': api_key, 'api_secret': api_secret}
 
 
-def get_test_user(user_id: str):
+def get_int_from_env(var_name, default):
     """
-    Load a test user definition by id from configs/test_users.json and resolve
-    credentials from environment variables (username_env / password_env).
-    Use for tests that need a specific user type (e.g. my_account_smoke_user).
+    Reads an optional integer setting from the environment (e.g. DRIVER_POOL_SIZE).
+    Returns 'default' if the variable is not set.
+    Raises ValueError if the variable is set but is not a valid integer.
+    """
+    value = os.environ.get(var_name)
+    if value is None or value.strip() == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(
+            f"❌ Invalid {var_name} value: '{value}'\n"
+            f"   {var_name} must be a valid integer (e.g. export {var_name}={default})"
+        )
 
-    Returns:
-        dict with keys: id, description (optional), username, password
+
+def get_test_user_definitions():
+    """
+    Returns the list of user definitions from configs/test_users.json (id, description, username_env,
+    password_env and the optional 'seed' block used by the data pool).
 
     Raises:
         FileNotFoundError: if test_users.json is missing
-        ValueError: if user_id is not found in config
-        EnvironmentError: if required username/password env vars are not set
     """
     import json
     from pathlib import Path
@@ -205,7 +251,24 @@ def get_test_user(user_id: str):
     with open(users_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
-    users = data.get("users") or []
+    return data.get("users") or []
+
+
+def get_test_user(user_id: str):
+    """
+    Load a test user definition by id from configs/test_users.json and resolve
+    credentials from environment variables (username_env / password_env).
+    Use for tests that need a specific user type (e.g. my_account_smoke_user).
+
+    Returns:
+        dict with keys: id, description (optional), username, password
+
+    Raises:
+        FileNotFoundError: if test_users.json is missing
+        ValueError: if user_id is not found in config
+        EnvironmentError: if required username/password env vars are not set
+    """
+    users = get_test_user_definitions()
     user_def = next((u for u in users if u.get("id") == user_id), None)
     if not user_def:
         available = [u.get("id") for u in users if u.get("id")]
@@ -0,0 +1,156 @@
+"""
+Pool of pre-provisioned customers for account tests (DATA_POOL=true).
+Each user profile in configs/test_users.json with a 'seed' block (e.g. {"orders": 1}) gets a stock of
+fresh customers created ahead of time with batch API calls. Tests lease one instead of using the shared
+env-configured account or creating one inline, so account setup is a constant-time file move.
+
+Entries are JSON files under DATA_POOL_DIR (default RESULTS_DIR/data_pool)/<env>/<profile>/available.
+Leasing moves a file to 'leased' with os.rename, which only one process can win, so parallel workers
+never get the same customer. Stock left at the end of a session is used by the next one.
+Entries hold the generated passwords of these throwaway customers; keep the directory out of reports.
+"""
+
+import json
+import os
+import threading
+import time
+import logging as logger
+from concurrent.futures import ThreadPoolExecutor
+
+from ssqatest.src.helpers import metrics_helpers
+from ssqatest.src.helpers.config_helpers import get_test_user_definitions, get_int_from_env
+from ssqatest.src.helpers.api_helpers import create_customers, create_orders, get_product_by_slug, \
+    get_random_products
+
+
+class DataPool:
+    """
+    :param pool_dir: Base directory of the pool (shared by workers).
+    :param target_size: Available entries to keep per profile.
+    """
+
+    def __init__(self, pool_dir, target_size=3):
+        self.pool_dir = os.path.join(pool_dir, os.environ.get("ENV", "test").lower())
+        self.target_size = target_size
+        self.profiles = {user["id"]: user["seed"] for user in get_test_user_definitions() if "seed" in user}
+        self._executor = ThreadPoolExecutor(max_workers=max(1, len(self.profiles)), thread_name_prefix="data-pool")
+        self._refills = {}
+        self._lock = threading.Lock()
+
+    def _dir(self, profile, state):
+        path = os.path.join(self.pool_dir, profile, state)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def available_count(self, profile):
+        return len([f for f in os.listdir(self._dir(profile, "available")) if f.endswith(".json")])
+
+    def refill_in_background(self, profiles=None):
+        """Tops up every profile (or the given ones) to target_size concurrently; returns immediately."""
+        for profile in profiles or self.profiles:
+            with self._lock:
+                running = self._refills.get(profile)
+                if running is None or running.done():
+                    self._refills[profile] = self._executor.submit(self._refill, profile)
+
+    def _refill(self, profile):
+        missing = self.target_size - self.available_count(profile)
+        if missing <= 0:
+            return
+        try:
+            with metrics_helpers.timed("data_pool.refill_seconds"):
+                entries = self.provision(profile, missing)
+            for entry in entries:
+                self._store(profile, entry)
+            metrics_helpers.increment("data_pool.provisioned", len(entries))
+        except Exception as e:
+            # A failed refill only means leases fall back to inline provisioning
+            logger.warning(f"Data pool refill for '{profile}' failed: {e}")
+
+    def _product_id_for(self, seed):
+        query = seed.get("product_query")
+        if query:
+            return get_random_products(qty=1, **query)[0]["id"]
+        return get_product_by_slug("beanie")["id"]
+
+    def provision(self, profile, qty):
+        """Creates 'qty' customers for the profile (and their orders) with batch calls; returns pool entries."""
+        seed = self.profiles[profile]
+        customers = create_customers(qty)
+        orders_per_customer = int(seed.get("orders", 0))
+        orders = []
+        if orders_per_customer:
+            product_id = self._product_id_for(seed)
+            orders = create_orders([
+                {"customer_id": customer["id"], "line_items": [{"product_id": product_id, "quantity": 1}],
+                 "status": "completed"}
+                for customer in customers for _ in range(orders_per_customer)
+            ])
+        entries = []
+        for index, customer in enumerate(customers):
+            customer_orders = orders[index * orders_per_customer:(index + 1) * orders_per_customer]
+            entries.append({
+                "id": profile,
+                "customer_id": customer["id"],
+                "username": customer["email"],
+                "password": customer["password"],
+                "order_ids": [order["id"] for order in customer_orders],
+                "created_at": time.time(),
+            })
+        return entries
+
+    def _store(self, profile, entry):
+        available = self._dir(profile, "available")
+        tmp_path = os.path.join(self._dir(profile, "tmp"), f"{entry['customer_id']}.json")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, os.path.join(available, f"{entry['customer_id']}.json"))
+
+    def lease(self, profile):
+        """
+        Returns a fresh customer for the profile: dict with id (profile), username, password, customer_id,
+        order_ids. Takes one from stock if there is any, otherwise provisions one inline.
+        Triggers a background refill either way.
+        """
+        if profile not in self.profiles:
+            raise ValueError(
+                f"❌ Test user '{profile}' has no 'seed' block in test_users.json\n"
+                f"   Profiles available in the data pool: {list(self.profiles)}"
+            )
+        available = self._dir(profile, "available")
+        leased = self._dir(profile, "leased")
+        entry = None
+        for file_name in sorted(os.listdir(available)):
+            if not file_name.endswith(".json"):
+                continue
+            try:
+                # Atomic: if another worker leased this entry first, the rename fails and we try the next
+                os.rename(os.path.join(available, file_name), os.path.join(leased, file_name))
+            except FileNotFoundError:
+                continue
+            with open(os.path.join(leased, file_name), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            metrics_helpers.increment("data_pool.leased_from_stock")
+            break
+
+        if entry is None:
+            metrics_helpers.increment("data_pool.provisioned_inline")
+            entry = self.provision(profile, 1)[0]
+        self.refill_in_background([profile])
+        return entry
+
+    def shutdown(self):
+        """Stops the refill threads; refills already running finish so their entries are not lost."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+def build_data_pool():
+    """
+    Returns a DataPool if DATA_POOL=true, otherwise None.
+    Optional settings: DATA_POOL_SIZE (customers kept per profile, default 3),
+    DATA_POOL_DIR (default RESULTS_DIR/data_pool).
+    """
+    if os.environ.get("DATA_POOL", "false").lower() != "true":
+        return None
+    pool_dir = os.environ.get("DATA_POOL_DIR") or os.path.join(os.environ.get("RESULTS_DIR", "."), "data_pool")
+    return DataPool(pool_dir, target_size=get_int_from_env("DATA_POOL_SIZE", 3))
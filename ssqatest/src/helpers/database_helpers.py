@@ -1,55 +1,369 @@
 
+import os
+import threading
+import time
+import logging as logger
+from contextlib import contextmanager
+
 import pymysql
-from ssqatest.src.helpers.config_helpers import get_database_credentials
+from ssqatest.src.helpers.config_helpers import get_database_credentials, get_db_backend, get_int_from_env
+from ssqatest.src.helpers import sqlite_db_helpers
+from ssqatest.src.helpers import metrics_helpers
 from ssqatest.src.configs.generic_configs import GenericConfigs
 
 
-def read_from_db(sql):
-    db_creds = get_database_credentials()
-    connection = None
-
-    try:
-        # connect to database
-        # Use the database name from credentials (from .env or GenericConfigs fallback)
-        db_name = db_creds['db_name']
-        print(f"🔍 Executing SQL query: {sql}")
-        connection = pymysql.connect(
+class _PooledConnection:
+    """A pool entry: the connection plus the bookkeeping used for health checks, lifetime and thread affinity."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.owner = threading.get_ident()
+
+
+class DBConnectionPool:
+    """
+    Thread-safe pool of persistent database connections.
+    Connections are borrowed with 'with pool.connection() as conn:'. A thread gets back the connection it
+    used last when that one is idle (per-worker affinity), otherwise any idle one, otherwise a new one
+    up to 'max_size'; when all are busy it waits up to 'wait_timeout' seconds.
+    Connections idle for more than 'ping_after' seconds are pinged before use, connections older than
+    'max_lifetime' seconds are replaced, and a connection that raised a connection error is discarded.
+    Connections run in autocommit mode so every query sees rows committed after the connection was opened.
+    :param connect: callable that opens a new DB-API connection (defaults to pymysql with the configured credentials)
+    """
+
+    def __init__(self, connect, db_name, max_size=4, max_lifetime=300, ping_after=30, wait_timeout=30):
+        if max_size < 1:
+            raise ValueError(f"❌ DB_POOL_SIZE must be at least 1.\n"
+                             f"   Got: {max_size}")
+        self.connect = connect
+        self.db_name = db_name
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.ping_after = ping_after
+        self.wait_timeout = wait_timeout
+        self._idle = []
+        self._open = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def _open_connection(self):
+        with metrics_helpers.timed("db.connect_seconds"):
+            entry = _PooledConnection(self.connect())
+        metrics_helpers.increment("db.connections_opened")
+        return entry
+
+    def _close_entry(self, entry):
+        try:
+            entry.connection.close()
+        except Exception as e:
+            logger.debug(f"Closing pooled DB connection failed: {e}")
+
+    def _is_healthy(self, entry):
+        now = time.monotonic()
+        if now - entry.created_at > self.max_lifetime:
+            metrics_helpers.increment("db.connections_expired")
+            return False
+        if now - entry.last_used > self.ping_after:
+            try:
+                entry.connection.ping(reconnect=False)
+            except Exception as e:
+                logger.info(f"Discarding stale pooled DB connection: {e}")
+                metrics_helpers.increment("db.health_check_failures")
+                return False
+        return True
+
+    def _take_idle(self):
+        """Pops the calling thread's last connection if idle, else the most recently used one. Call with the lock held."""
+        me = threading.get_ident()
+        for index in range(len(self._idle) - 1, -1, -1):
+            if self._idle[index].owner == me:
+                metrics_helpers.increment("db.pool_affinity_hits")
+                return self._idle.pop(index)
+        return self._idle.pop()
+
+    def _borrow(self):
+        start = time.monotonic()
+        deadline = start + self.wait_timeout
+        while True:
+            entry = None
+            must_open = False
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("❌ The database connection pool is closed.")
+                while not self._idle and self._open >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"❌ Timed out after {self.wait_timeout}s waiting for a database connection.\n"
+                            f"   All {self.max_size} pooled connections are in use; raise DB_POOL_SIZE if needed."
+                        )
+                    self._condition.wait(remaining)
+                if self._idle:
+                    entry = self._take_idle()
+                else:
+                    self._open += 1
+                    must_open = True
+
+            if must_open:
+                try:
+                    entry = self._open_connection()
+                except Exception:
+                    self._forget()
+                    raise
+            elif not self._is_healthy(entry):
+                self._close_entry(entry)
+                self._forget()
+                continue
+
+            waited = time.monotonic() - start
+            if waited > 0.001:
+                metrics_helpers.increment("db.pool_wait_seconds", waited)
+            metrics_helpers.increment("db.borrows")
+            entry.owner = threading.get_ident()
+            return entry
+
+    def _forget(self):
+        """Drops one connection from the open count (closed or failed to open) and wakes a waiting thread."""
+        with self._condition:
+            self._open -= 1
+            self._condition.notify()
+
+    def _return(self, entry):
+        entry.last_used = time.monotonic()
+        with self._condition:
+            if not self._closed:
+                self._idle.append(entry)
+                self._condition.notify()
+                return
+            self._open -= 1
+        self._close_entry(entry)
+
+    @contextmanager
+    def connection(self):
+        """Borrows a connection for the duration of the block; it is discarded instead of reused if a connection error occurred."""
+        entry = self._borrow()
+        try:
+            yield entry.connection
+        # GeneratorExit: a streaming query was abandoned with rows still unread on the connection
+        # (stream_query skips cursor.close(), which would read them all); closing the connection drops them
+        except (pymysql.err.OperationalError, pymysql.err.InterfaceError, GeneratorExit):
+            self._close_entry(entry)
+            self._forget()
+            raise
+        except BaseException:
+            self._return(entry)
+            raise
+        else:
+            self._return(entry)
+
+    def close(self):
+        """Closes idle connections; connections still borrowed are closed when they are returned."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+            self._condition.notify_all()
+        for entry in idle:
+            self._close_entry(entry)
+
+
+_db_pool = None
+_db_pool_lock = threading.Lock()
+
+
+def _connect_with_credentials(db_creds):
+    """Returns a connect() callable for the given credentials (resolved once per pool, not per query)."""
+    def connect():
+        return pymysql.connect(
             host=db_creds['db_host'],
             port=db_creds['db_port'],
             user=db_creds['db_user'],
             password=db_creds['db_password'],
-            database=db_name
+            database=db_creds['db_name'],
+            autocommit=True,
         )
+    return connect
+
+
+def get_db_pool():
+    """
+    Returns the process-wide DBConnectionPool (created on first use) for the DB_BACKEND in use:
+    the shop's MySQL database (default) or the local SQLite stand-in (DB_BACKEND=sqlite, see sqlite_db_helpers).
+    Optional settings: DB_POOL_SIZE (default 4), DB_POOL_MAX_LIFETIME (seconds, default 300),
+    DB_POOL_TIMEOUT (seconds to wait for a free connection, default 30).
+    """
+    global _db_pool
+    with _db_pool_lock:
+        if _db_pool is None:
+            if get_db_backend() == 'sqlite':
+                db_name = os.environ.get("DB_NAME") or GenericConfigs.DATABASE_SCHEMA
+                path = sqlite_db_helpers.get_sqlite_path(db_name)
+                connect = lambda: sqlite_db_helpers.connect_sqlite(path, db_name)
+            else:
+                db_creds = get_database_credentials()
+                db_name = db_creds['db_name']
+                connect = _connect_with_credentials(db_creds)
+            _db_pool = DBConnectionPool(
+                connect=connect,
+                db_name=db_name,
+                max_size=get_int_from_env("DB_POOL_SIZE", 4),
+                max_lifetime=get_int_from_env("DB_POOL_MAX_LIFETIME", 300),
+                wait_timeout=get_int_from_env("DB_POOL_TIMEOUT", 30),
+            )
+        return _db_pool
+
+
+def close_db_pool():
+    """Closes the process-wide pool if it was created (called at session end)."""
+    global _db_pool
+    with _db_pool_lock:
+        pool, _db_pool = _db_pool, None
+    if pool is not None:
+        pool.close()
 
+
+def _fetch_all(connection, sql, params=None):
+    """Runs one query on a borrowed connection and returns all rows as dicts."""
+    with metrics_helpers.timed("db.query_seconds"):
         cursor = connection.cursor(pymysql.cursors.DictCursor)
-        cursor.execute(sql)
-        db_data = cursor.fetchall()
-        cursor.close()
-        return db_data
+        try:
+            cursor.execute(sql, params)
+            db_data = cursor.fetchall()
+        finally:
+            cursor.close()
+    metrics_helpers.increment("db.queries")
+    return db_data
 
-    finally:
-        if connection:
-            connection.close()
 
+def query(sql, params=None):
+    """
+    Runs a query with bound parameters and returns all rows as a list of dicts.
+    Use %s placeholders and pass the values in 'params' (list/tuple, or a dict for %(name)s placeholders)
+    instead of formatting them into the SQL string; the driver escapes them.
+    Example:
+        query("SELECT ID, post_status FROM wp_posts WHERE post_type = %s AND ID > %s", ["shop_order_placehold", 800])
+    """
+    with get_db_pool().connection() as connection:
+        return _fetch_all(connection, sql, params)
 
-def get_order_from_db_by_order_no(order_no):
 
-    # Get database name from credentials (from .env or GenericConfigs fallback)
-    db_creds = get_database_credentials()
-    schema = db_creds['db_name']
-    table_prefix = GenericConfigs.DATABASE_TABLE_PREFIX
+def stream_query(sql, params=None, batch_size=1000):
+    """
+    Generator version of query() for large result sets: rows are read from the server in batches of
+    'batch_size' with a server-side (unbuffered) cursor, so memory use stays constant however many rows match.
+    The pooled connection is held until the generator is exhausted or closed; do not run other queries
+    from the same thread while iterating.
+    Example:
+        for order in stream_query("SELECT ID, post_status FROM wp_posts WHERE post_type = %s", ["shop_order_placehold"]):
+            ...
+    """
+    with get_db_pool().connection() as connection:
+        cursor = connection.cursor(pymysql.cursors.SSDictCursor)
+        try:
+            with metrics_helpers.timed("db.query_seconds"):
+                cursor.execute(sql, params)
+            metrics_helpers.increment("db.queries")
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                metrics_helpers.increment("db.streamed_rows", len(rows))
+                yield from rows
+        except GeneratorExit:
+            # Abandoned mid-result: SSCursor.close() would read every remaining row first.
+            # Leave the cursor open; the pool closes the connection on GeneratorExit instead.
+            raise
+        except BaseException:
+            cursor.close()
+            raise
+        else:
+            cursor.close()
 
-    sql = f"SELECT * FROM {schema}.{table_prefix}posts WHERE ID = {order_no} AND post_type = 'shop_order_placehold';"
-    db_order = read_from_db(sql)
 
-    return db_order
+def fetch_scalar(sql, params=None, default=None):
+    """Returns the first column of the first row (e.g. a COUNT(*)), or 'default' if there are no rows."""
+    with get_db_pool().connection() as connection:
+        with metrics_helpers.timed("db.query_seconds"):
+            cursor = connection.cursor()
+            try:
+                cursor.execute(sql, params)
+                row = cursor.fetchone()
+            finally:
+                cursor.close()
+        metrics_helpers.increment("db.queries")
+    return row[0] if row else default
 
 
+def exists(sql, params=None):
+    """True if the query returns at least one row; the server stops at the first match (SELECT EXISTS(...))."""
+    return bool(fetch_scalar(f"SELECT EXISTS({sql.strip().rstrip(';')})", params, default=0))
 
 
+def read_from_db(sql):
+    print(f"🔍 Executing SQL query: {sql}")
+    return query(sql)
 
 
+def get_order_from_db_by_order_no(order_no):
+
+    # Database name from credentials (from .env or GenericConfigs fallback), resolved once by the pool
+    schema = sqlite_db_helpers.quote_identifier(get_db_pool().db_name)
+    table_prefix = GenericConfigs.DATABASE_TABLE_PREFIX
+
+    sql = f"SELECT * FROM {schema}.{table_prefix}posts WHERE ID = %s AND post_type = 'shop_order_placehold';"
+    db_order = query(sql, [order_no])
+
+    return db_order
+
+
+def wait_for_orders_in_db(order_nos, timeout=10, initial_delay=0.1, max_delay=2):
+    """
+    Polls the database until all given orders are committed, checking every order with one 'ID IN (...)'
+    query per round trip over a single pooled connection. The delay between polls starts at
+    'initial_delay' and doubles up to 'max_delay'.
+    Returns a dict of order number -> order row for the orders found; orders still missing when
+    'timeout' seconds have passed are absent from it (the caller asserts, with its own message).
+    :param order_nos: order numbers (str or int)
+    """
+    order_ids = list(dict.fromkeys(int(order_no) for order_no in order_nos))
+    if not order_ids:
+        return {}
+    schema = sqlite_db_helpers.quote_identifier(get_db_pool().db_name)
+    table_prefix = GenericConfigs.DATABASE_TABLE_PREFIX
 
+    found = {}
+    delay = initial_delay
+    deadline = time.monotonic() + timeout
+    with get_db_pool().connection() as connection:
+        while True:
+            # only orders not seen yet are asked for again
+            missing = [order_id for order_id in order_ids if order_id not in found]
+            placeholders = ", ".join(["%s"] * len(missing))
+            sql = (f"SELECT * FROM {schema}.{table_prefix}posts "
+                   f"WHERE ID IN ({placeholders}) AND post_type = 'shop_order_placehold';")
+            for row in _fetch_all(connection, sql, missing):
+                found[int(row['ID'])] = row
+            metrics_helpers.increment("db.order_polls")
+            remaining = deadline - time.monotonic()
+            if len(found) == len(order_ids) or remaining <= 0:
+                break
+            metrics_helpers.counted_sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
 
+    if len(found) < len(order_ids):
+        logger.warning(f"Orders not found in database after {timeout}s: "
+                       f"{[o for o in order_ids if o not in found]}")
+    return {str(order_id): found[order_id] for order_id in order_ids if order_id in found}
 
 
+def wait_for_order_in_db(order_no, timeout=10):
+    """
+    Polls the database until the order is committed (see wait_for_orders_in_db for the backoff).
+    Returns the matching rows like get_order_from_db_by_order_no(), or an empty list on timeout.
+    For several orders use wait_for_orders_in_db().
+    """
+    found = wait_for_orders_in_db([order_no], timeout=timeout)
+    return list(found.values())
@@ -0,0 +1,499 @@
+"""
+WebDriver helpers: browser creation, fast state reset between test classes and a
+session-level pool of warm drivers so each test class does not pay for a cold browser start.
+"""
+
+import os
+import json
+import time
+import threading
+import logging as logger
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException, NoAlertPresentException
+from selenium.webdriver.chrome.options import Options as ChOptions
+from selenium.webdriver.firefox.options import Options as FFOptions
+
+from ssqatest.src.helpers import metrics_helpers
+from ssqatest.src.helpers.config_helpers import get_int_from_env
+
+
+SUPPORTED_BROWSERS = ['chrome', 'ch', 'headlesschrome', 'firefox', 'ff', 'headlessfirefox']
+
+# URL patterns (Chrome DevTools Protocol wildcard syntax, matched against the full URL) for each
+# resource class that BLOCK_RESOURCES can drop.
+RESOURCE_BLOCK_PATTERNS = {
+    'images': ['*.jpg*', '*.jpeg*', '*.png*', '*.gif*', '*.webp*', '*.svg*'],
+    'fonts': ['*.woff*', '*.ttf*', '*.otf*', '*.eot*', '*fonts.googleapis.com*', '*fonts.gstatic.com*'],
+    'analytics': ['*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+                  '*connect.facebook.net*', '*hotjar.com*', '*stats.wp.com*', '*pixel.wp.com*'],
+    'thirdparty': ['*gravatar.com*', '*s.w.org*', '*youtube.com*', '*vimeo.com*', '*platform.twitter.com*'],
+}
+
+
+def get_browser_name():
+    """
+    Returns the lower-cased browser name from the BROWSER environment variable.
+    Raises EnvironmentError if BROWSER is not set and ValueError if it is not supported.
+    """
+    browser = os.environ.get('BROWSER', None)
+    if not browser:
+        supported_list = ", ".join(SUPPORTED_BROWSERS)
+        raise EnvironmentError(
+            "Missing required environment variable: BROWSER. "
+            "Source env.sh or set export BROWSER=chrome. "
+            "Supported browsers: {}".format(supported_list)
+        )
+
+    browser = browser.lower()
+    if browser not in SUPPORTED_BROWSERS:
+        raise ValueError(
+            "Unsupported browser: '{}'. Supported: {}. Set via: export BROWSER=chrome".format(
+                browser, ", ".join(SUPPORTED_BROWSERS)
+            )
+        )
+    return browser
+
+
+def get_page_load_strategy():
+    """
+    Returns the WebDriver page load strategy from PAGE_LOAD_STRATEGY (default 'normal').
+    'eager' returns from driver.get() at DOMContentLoaded, 'none' right after navigation starts;
+    page objects then wait for their own readiness condition (see SeleniumExtended.go_to).
+    """
+    strategy = os.environ.get('PAGE_LOAD_STRATEGY', 'normal').strip().lower()
+    if strategy not in ('normal', 'eager', 'none'):
+        raise ValueError(
+            f"❌ Invalid PAGE_LOAD_STRATEGY value: '{strategy}'\n"
+            f"   Valid values are: 'normal', 'eager', 'none'\n"
+            f"   Set via: export PAGE_LOAD_STRATEGY=eager (defaults to 'normal' if not set)"
+        )
+    return strategy
+
+
+def create_driver(browser):
+    """
+    Launches a new browser (cold start) for the given browser name (see SUPPORTED_BROWSERS).
+    :return: WebDriver instance with the standard viewport already set.
+    """
+    if browser in ('chrome', 'ch', 'headlesschrome'):
+        chrome_options = ChOptions()
+        chrome_options.page_load_strategy = get_page_load_strategy()
+        if browser == 'headlesschrome':
+            chrome_options.add_argument('--disable-gpu')
+            chrome_options.add_argument('--no-sandbox')
+            chrome_options.add_argument('--headless')
+            chrome_bin = os.environ.get('CHROME_BIN')
+            if chrome_bin:
+                chrome_options.binary_location = chrome_bin
+        if get_blocked_resource_classes():
+            # Performance log lets record_page_load() count the requests dropped by URL blocking
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        driver = webdriver.Chrome(options=chrome_options)
+    elif browser in ('firefox', 'ff', 'headlessfirefox'):
+        ff_options = FFOptions()
+        ff_options.page_load_strategy = get_page_load_strategy()
+        if browser == 'headlessfirefox':
+            ff_options.add_argument("--disable-gpu")
+            ff_options.add_argument("--no-sandbox")
+            ff_options.add_argument("--headless")
+        driver = webdriver.Firefox(options=ff_options)
+    else:
+        raise ValueError(f"Unsupported browser: '{browser}'. Supported: {', '.join(SUPPORTED_BROWSERS)}")
+
+    # Standard viewport for deterministic UI tests (Full HD desktop)
+    driver.set_window_size(1920, 1080)
+    return driver
+
+
+def is_chromium(driver):
+    """True if the driver supports Chrome DevTools Protocol commands (Chrome/Chromium)."""
+    return hasattr(driver, "execute_cdp_cmd")
+
+
+def get_blocked_resource_classes():
+    """
+    Returns the resource classes to block from the BLOCK_RESOURCES environment variable
+    (comma separated, e.g. 'images,fonts'; 'all' = every class in RESOURCE_BLOCK_PATTERNS).
+    Returns an empty list when BLOCK_RESOURCES is not set.
+    """
+    value = os.environ.get('BLOCK_RESOURCES', '').strip().lower()
+    if not value:
+        return []
+    if value == 'all':
+        return list(RESOURCE_BLOCK_PATTERNS)
+
+    resource_classes = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in resource_classes if name not in RESOURCE_BLOCK_PATTERNS]
+    if unknown:
+        raise ValueError(
+            f"❌ Invalid BLOCK_RESOURCES value: {unknown}\n"
+            f"   Valid resource classes: {', '.join(RESOURCE_BLOCK_PATTERNS)} (or 'all')\n"
+            f"   Example: export BLOCK_RESOURCES=images,fonts,analytics"
+        )
+    return resource_classes
+
+
+_blocking_active_by_session = {}
+
+
+def apply_resource_blocking(driver, resource_classes):
+    """
+    Blocks requests matching RESOURCE_BLOCK_PATTERNS for the given resource classes, using
+    Chrome DevTools Protocol URL blocking. An empty list removes any blocking from the driver.
+    Only Chromium supports this; on other browsers blocking is skipped with a warning.
+    """
+    patterns = [pattern for name in resource_classes for pattern in RESOURCE_BLOCK_PATTERNS[name]]
+    if not is_chromium(driver):
+        if patterns:
+            logger.warning(f"BLOCK_RESOURCES is only supported on Chrome; not blocking {resource_classes}.")
+        return
+
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    _blocking_active_by_session[driver.session_id] = bool(patterns)
+
+
+class PageLoadStats:
+    """
+    Per-page transfer size and load time, split by whether resource blocking was active for the load.
+    Pages loaded both with and without blocking in the same run (e.g. a class that opts back in
+    to images) give the bytes and time saved per page load.
+    """
+
+    def __init__(self):
+        self._pages = {}
+        self._lock = threading.Lock()
+
+    def add(self, page, blocking, transfer_bytes, load_seconds, blocked_requests):
+        with self._lock:
+            page_stats = self._pages.setdefault(page, {True: [0, 0, 0.0, 0], False: [0, 0, 0.0, 0]})
+            entry = page_stats[blocking]
+            entry[0] += 1
+            entry[1] += transfer_bytes
+            entry[2] += load_seconds
+            entry[3] += blocked_requests
+
+    def summary_lines(self):
+        lines = []
+        with self._lock:
+            pages = {page: {k: list(v) for k, v in stats.items()} for page, stats in self._pages.items()}
+        for page in sorted(pages):
+            blocked, unblocked = pages[page][True], pages[page][False]
+            parts = []
+            if blocked[0]:
+                parts.append(f"blocked: {blocked[0]} loads, avg {blocked[1] / blocked[0] / 1024:.0f} KB, "
+                             f"{blocked[2] / blocked[0]:.2f} s, {blocked[3] / blocked[0]:.1f} requests dropped")
+            if unblocked[0]:
+                parts.append(f"unblocked: {unblocked[0]} loads, avg {unblocked[1] / unblocked[0] / 1024:.0f} KB, "
+                             f"{unblocked[2] / unblocked[0]:.2f} s")
+            if blocked[0] and unblocked[0]:
+                saved_kb = (unblocked[1] / unblocked[0] - blocked[1] / blocked[0]) / 1024
+                saved_seconds = unblocked[2] / unblocked[0] - blocked[2] / blocked[0]
+                parts.append(f"saved per load: {saved_kb:.0f} KB, {saved_seconds:.2f} s")
+            lines.append(f"{page} | " + " | ".join(parts))
+        blocked_loads = sum(stats[True][0] for stats in pages.values())
+        if blocked_loads:
+            dropped = sum(stats[True][3] for stats in pages.values())
+            lines.append(f"all pages | blocked: {blocked_loads} loads, {dropped} requests dropped")
+        return lines
+
+
+PAGE_LOAD_STATS = PageLoadStats()
+
+_PAGE_LOAD_STATS_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+var bytes = nav ? nav.transferSize : 0;
+performance.getEntriesByType('resource').forEach(function (r) { bytes += r.transferSize || 0; });
+var end = nav ? (nav.loadEventEnd || nav.domContentLoadedEventEnd) : 0;
+return {bytes: bytes, load_ms: end || performance.now()};
+"""
+
+
+def record_page_load(driver, url):
+    """
+    Records transfer size, load time and number of blocked requests for the page just loaded.
+    No-op unless BLOCK_RESOURCES is set. Cross-origin resources without Timing-Allow-Origin
+    report 0 bytes, so sizes are lower bounds.
+    """
+    if not get_blocked_resource_classes():
+        return
+
+    stats = driver.execute_script(_PAGE_LOAD_STATS_JS)
+    blocked_requests = 0
+    if is_chromium(driver):
+        try:
+            for entry in driver.get_log("performance"):
+                message = json.loads(entry["message"])["message"]
+                if message.get("method") == "Network.loadingFailed" and message["params"].get("blockedReason"):
+                    blocked_requests += 1
+        except WebDriverException:
+            pass
+
+    blocking = _blocking_active_by_session.get(driver.session_id, False)
+    page = urlparse(url).path.rstrip("/") or "/"
+    PAGE_LOAD_STATS.add(page, blocking, int(stats["bytes"]), stats["load_ms"] / 1000.0, blocked_requests)
+    metrics_helpers.increment("resource_blocking.page_loads")
+    metrics_helpers.increment("resource_blocking.blocked_requests", blocked_requests)
+
+
+def reset_driver_state(driver):
+    """
+    Brings a used browser back to a clean state so the next test class starts like it would
+    in a new browser: dismisses open alerts, closes extra tabs, clears localStorage/sessionStorage
+    and cookies, and navigates to about:blank.
+    Raises WebDriverException if the browser is no longer usable (caller should discard it).
+    """
+    try:
+        driver.switch_to.alert.dismiss()
+    except NoAlertPresentException:
+        pass
+
+    handles = driver.window_handles
+    main_handle = handles[0]
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(main_handle)
+
+    # Storage is per origin, so clear it while still on the page the class left behind.
+    # about:blank / data: pages have no storage and raise a SecurityError; nothing to clear then.
+    try:
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    except WebDriverException:
+        pass
+
+    if is_chromium(driver):
+        # Clears cookies for all domains, not only the current page's domain
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    else:
+        driver.delete_all_cookies()
+
+    driver.get("about:blank")
+
+
+class DriverPool:
+    """
+    Session-level pool of warm WebDriver instances.
+    A test class acquires a driver; when the class finishes the driver is released back to the pool
+    after a fast state reset (see reset_driver_state) instead of being quit.
+    When a hand-off would otherwise need a new browser (first class, or the current driver is due
+    to be recycled), the next browser is launched in a background thread while the current class runs.
+
+    :param browser: Browser name (see SUPPORTED_BROWSERS).
+    :param size: Maximum number of idle drivers kept warm. 0 disables pooling (new browser per class).
+    :param max_uses: A driver is quit and replaced after it has served this many test classes.
+    :param prewarm: Launch the next browser in the background ahead of the hand-off.
+    :param isolation: 'process' (default): a class gets a whole browser, reset between classes.
+                      'context': a class gets its own browser context (separate cookies, storage and cache,
+                      like an incognito window) inside a long-lived Chrome, created with DevTools
+                      Target.createBrowserContext and disposed when the class ends. Falls back to 'process'
+                      for a class if the context cannot be created, and for the session on non-Chromium browsers.
+    """
+
+    ISOLATION_MODES = ("process", "context")
+
+    def __init__(self, browser, size=1, max_uses=10, prewarm=True, isolation="process"):
+        if isolation not in self.ISOLATION_MODES:
+            raise ValueError(
+                f"❌ Invalid BROWSER_ISOLATION value: '{isolation}'\n"
+                f"   Valid values: {', '.join(self.ISOLATION_MODES)}"
+            )
+        self.browser = browser
+        self.size = size
+        self.max_uses = max_uses
+        self.prewarm_enabled = prewarm
+        self.isolation = isolation
+        self._idle = []
+        self._pending = []
+        self._uses = {}
+        # session_id -> (browser context id, the context's window handle, the browser's own window handle)
+        self._contexts = {}
+        self._executor = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            driver = self._idle.pop() if self._idle else None
+            future = self._pending.pop(0) if driver is None and self._pending else None
+
+        if driver is not None:
+            metrics_helpers.increment("driver_pool.cold_starts_avoided")
+        elif future is not None:
+            driver = self._take_prewarmed(future)
+        else:
+            driver = self._launch()
+
+        with self._lock:
+            uses = self._uses.get(driver.session_id, 0) + 1
+            self._uses[driver.session_id] = uses
+
+        # This driver will not come back to the pool, so start its successor now
+        if self.size == 0 or uses >= self.max_uses:
+            self.prewarm()
+        if self.isolation == "context":
+            self._open_context(driver)
+        return driver
+
+    def _open_context(self, driver):
+        """Moves the driver into a new browser context (new window); on failure the class runs in the browser itself."""
+        if not is_chromium(driver):
+            logger.warning("BROWSER_ISOLATION=context needs Chrome; using process isolation.")
+            self.isolation = "process"
+            return
+        context_id = main_handle = None
+        try:
+            with metrics_helpers.timed("driver_pool.context_open_seconds"):
+                main_handle = driver.current_window_handle
+                context_id = driver.execute_cdp_cmd("Target.createBrowserContext", {})["browserContextId"]
+                handles_before = set(driver.window_handles)
+                target_id = driver.execute_cdp_cmd("Target.createTarget", {
+                    "url": "about:blank", "browserContextId": context_id, "width": 1920, "height": 1080,
+                })["targetId"]
+                new_handles = [h for h in driver.window_handles if h not in handles_before]
+                # chromedriver uses the target id as window handle; fall back to the one new handle
+                handle = target_id if target_id in new_handles else new_handles[0]
+                driver.switch_to.window(handle)
+        except (WebDriverException, KeyError, IndexError) as e:
+            logger.warning(f"Could not create a browser context, using process isolation for this class. Error: {e}")
+            metrics_helpers.increment("driver_pool.context_fallbacks")
+            if context_id is not None:
+                # Created but not usable: dispose it (with any window opened in it) so it does not pile up
+                try:
+                    driver.switch_to.window(main_handle)
+                    driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+                except WebDriverException as dispose_error:
+                    logger.warning(f"Could not dispose the unused browser context {context_id}: {dispose_error}")
+            return
+        self._contexts[driver.session_id] = (context_id, handle, main_handle)
+        metrics_helpers.increment("driver_pool.contexts_created")
+
+    def _close_context(self, driver, context):
+        """Closes the class's context window and disposes the context (its cookies, storage and cache go with it)."""
+        context_id, handle, main_handle = context
+        if handle in driver.window_handles:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(main_handle)
+        driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+
+    def release(self, driver):
+        uses = self._uses.get(driver.session_id, 0)
+        context = self._contexts.pop(driver.session_id, None)
+        if uses >= self.max_uses:
+            metrics_helpers.increment("driver_pool.recycled")
+            self._discard(driver)
+            return
+
+        try:
+            if context is not None:
+                # The browser's own window was not used by the class; only the context needs to go
+                try:
+                    driver.switch_to.alert.dismiss()
+                except NoAlertPresentException:
+                    pass
+                self._close_context(driver, context)
+            else:
+                reset_driver_state(driver)
+        except WebDriverException as e:
+            logger.warning(f"Browser state reset failed, discarding driver. Error: {e}")
+            metrics_helpers.increment("driver_pool.reset_failures")
+            self._discard(driver)
+            self.prewarm()
+            return
+
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(driver)
+                return
+        self._discard(driver)
+
+    def prewarm(self):
+        """
+        Starts launching one browser in a background thread so it is ready at the next acquire().
+        No-op if prewarming is disabled or a browser is already idle or launching.
+        """
+        if not self.prewarm_enabled:
+            return
+        with self._lock:
+            if self._closed or self._idle or self._pending:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="driver-prewarm")
+            self._pending.append(self._executor.submit(self._timed_launch))
+
+    def shutdown(self):
+        """Quits all idle and pre-warmed drivers. Call once at the end of the session."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            pending, self._pending = self._pending, []
+        for future in pending:
+            try:
+                driver, _ = future.result()
+                idle.append(driver)
+            except Exception:
+                pass
+        for driver in idle:
+            self._discard(driver)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def _timed_launch(self):
+        start = time.perf_counter()
+        driver = create_driver(self.browser)
+        return driver, time.perf_counter() - start
+
+    def _take_prewarmed(self, future):
+        """Waits for a background launch to finish and records how much launch time it hid."""
+        start = time.perf_counter()
+        try:
+            driver, launch_seconds = future.result()
+        except Exception as e:
+            logger.warning(f"Background browser launch failed, launching in the foreground. Error: {e}")
+            metrics_helpers.increment("driver_pool.prewarm_failures")
+            return self._launch()
+        waited = time.perf_counter() - start
+
+        metrics_helpers.increment("driver_pool.cold_starts")
+        metrics_helpers.increment("driver_pool.cold_start_seconds", launch_seconds)
+        metrics_helpers.increment("driver_pool.prewarm_handoffs")
+        metrics_helpers.increment("driver_pool.prewarm_wait_seconds", waited)
+        metrics_helpers.increment("driver_pool.prewarm_hidden_seconds", max(0.0, launch_seconds - waited))
+        return driver
+
+    def _launch(self):
+        with metrics_helpers.timed("driver_pool.cold_start_seconds"):
+            driver = create_driver(self.browser)
+        metrics_helpers.increment("driver_pool.cold_starts")
+        metrics_helpers.increment("driver_pool.blocking_launches")
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            self._uses.pop(driver.session_id, None)
+        self._contexts.pop(driver.session_id, None)
+        _blocking_active_by_session.pop(driver.session_id, None)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+
+def build_driver_pool():
+    """
+    Creates the DriverPool for this session from environment settings:
+    BROWSER, DRIVER_POOL_SIZE (default 1), DRIVER_POOL_MAX_USES (default 10),
+    DRIVER_PREWARM (default true; 'false' disables background launches),
+    BROWSER_ISOLATION ('process' (default) or 'context', see DriverPool).
+    """
+    return DriverPool(
+        get_browser_name(),
+        size=get_int_from_env("DRIVER_POOL_SIZE", 1),
+        max_uses=get_int_from_env("DRIVER_POOL_MAX_USES", 10),
+        prewarm=os.environ.get("DRIVER_PREWARM", "true").lower() != "false",
+        isolation=os.environ.get("BROWSER_ISOLATION", "process").strip().lower(),
+    )
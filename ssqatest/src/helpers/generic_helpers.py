@@ -1,4 +1,5 @@
 
+import os
 import random
 import string
 import logging as logger
@@ -12,6 +13,10 @@ def generate_random_email_and_password(domain=None, email_prefix=None):
         domain = 'supersqa.com'
     if not email_prefix:
         email_prefix = 'testuser'
+    # Parallel runs (runner.py --workers) give each worker a namespace, so its users are easy to tell apart
+    namespace = os.environ.get('TEST_DATA_NAMESPACE')
+    if namespace:
+        email_prefix = f"{email_prefix}_{namespace}"
 
     random_email_string_length = 10
     random_string = ''.join(random.choices(string.ascii_lowercase, k=random_email_string_length))
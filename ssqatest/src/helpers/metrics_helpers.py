@@ -0,0 +1,105 @@
+"""
+Lightweight in-process counters for framework performance features (driver pool,
+waits, API/DB connection reuse, ...).
+Values are printed in the pytest terminal summary and written to RESULTS_DIR/metrics.json
+at the end of the session, so a run can be compared against previous runs.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+_lock = threading.Lock()
+_values = {}
+_sleep_seconds_by_test = {}
+
+
+def increment(name, amount=1):
+    """Adds 'amount' to the counter 'name' (created on first use). Thread-safe."""
+    with _lock:
+        _values[name] = _values.get(name, 0) + amount
+
+
+def get(name, default=0):
+    with _lock:
+        return _values.get(name, default)
+
+
+def snapshot():
+    """Returns a copy of all counters (dict of name -> value)."""
+    with _lock:
+        return dict(_values)
+
+
+def reset():
+    with _lock:
+        _values.clear()
+        _sleep_seconds_by_test.clear()
+
+
+def counted_sleep(seconds):
+    """
+    time.sleep() that is accounted to the running test, so sleeps show up in the terminal summary
+    and a test that starts sleeping more is easy to spot. Use it for the few sleeps that cannot be
+    replaced by a wait for a condition (e.g. giving the server time to process a write) and for
+    retry / polling backoff. Sleeps on other threads (e.g. background cleanup) count as '<background>'.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        test = "<background>"
+    else:
+        # PYTEST_CURRENT_TEST is '<nodeid> (<phase>)'
+        test = os.environ.get("PYTEST_CURRENT_TEST", "").rsplit(" (", 1)[0] or "<outside tests>"
+    time.sleep(seconds)
+    with _lock:
+        _sleep_seconds_by_test[test] = _sleep_seconds_by_test.get(test, 0) + seconds
+        _values["sleeps.count"] = _values.get("sleeps.count", 0) + 1
+        _values["sleeps.seconds"] = _values.get("sleeps.seconds", 0.0) + seconds
+
+
+def sleep_seconds_by_test():
+    """Returns a copy of the seconds slept per test (dict of test node id -> seconds)."""
+    with _lock:
+        return dict(_sleep_seconds_by_test)
+
+
+@contextmanager
+def timed(name):
+    """
+    Context manager that adds the elapsed wall-clock seconds of the block to counter 'name'.
+    Example:
+        with timed("driver_pool.cold_start_seconds"):
+            driver = create_driver(browser)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        increment(name, time.perf_counter() - start)
+
+
+def format_metrics(values=None):
+    """
+    Returns the counters as sorted, human readable lines for the terminal summary.
+    Float counters (e.g. '*_seconds') are shown with 2 decimals.
+    """
+    values = snapshot() if values is None else values
+    lines = []
+    for name in sorted(values):
+        value = values[name]
+        if isinstance(value, float):
+            lines.append(f"{name}: {value:.2f}")
+        else:
+            lines.append(f"{name}: {value}")
+    return lines
+
+
+def write_metrics_file(results_dir, file_name="metrics.json"):
+    """Writes all counters as JSON to '<results_dir>/<file_name>'. Returns the path written."""
+    os.makedirs(results_dir, exist_ok=True)
+    path = os.path.join(results_dir, file_name)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(snapshot(), f, indent=2, sort_keys=True)
+    return path
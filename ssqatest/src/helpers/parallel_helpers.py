@@ -0,0 +1,325 @@
+"""
+Helpers for runner.py's parallel mode (--workers N).
+Test classes are the unit of distribution, so class-scoped fixtures (browser, login, seeded data) stay
+intact: a class always runs whole, in one worker. Each worker is a separate pytest process with its own
+driver pool, RESULTS_DIR/worker-<i> folder and TEST_DATA_NAMESPACE; at the end the per-worker JUnit
+results are merged and a utilization summary shows how evenly the work was spread. pytest-html reports
+are not merged: each worker writes its own, and an index page links them.
+
+Classes are balanced by how long they took in earlier runs: every session writes its per-class durations
+to RESULTS_DIR/class_durations.json, the runner folds them into a history file (DURATION_HISTORY_FILE,
+default .class_durations.json) and schedules heaviest-first on those durations, both across workers
+and across CI shards (--shard i/n).
+"""
+
+import html
+import json
+import os
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+
+CLASS_DURATIONS_FILE = "class_durations.json"
+# Weight of the newest run when updating a class's duration in the history (moving average)
+HISTORY_NEW_RUN_WEIGHT = 0.5
+
+
+def group_id_for(node_id):
+    """'path::Class' for a test in a class, the module path for a module-level test function."""
+    parts = node_id.split("::")
+    return "::".join(parts[:2]) if len(parts) > 2 else parts[0]
+
+
+def collect_test_groups(pytest_args, cwd=None, env=None):
+    """
+    Collects the selected tests (pytest --collect-only) and groups them by class.
+    Returns a list of (group id, [test node ids]) in collection order; the group id is
+    'path::Class' for tests in a class and the module path for module-level test functions.
+    :param pytest_args: Test paths and selection options (e.g. ['tests', '-m', 'smoke']).
+    """
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", *pytest_args],
+        cwd=cwd, env=env, capture_output=True, text=True,
+    )
+    # 5 = no tests collected
+    if result.returncode not in (0, 5):
+        raise RuntimeError(
+            f"❌ Test collection failed (exit code {result.returncode}).\n"
+            f"   {result.stdout[-2000:]}{result.stderr[-2000:]}"
+        )
+    groups = {}
+    for line in result.stdout.splitlines():
+        line = line.strip()
+        if "::" not in line or line.startswith(("=", "<")):
+            continue
+        groups.setdefault(group_id_for(line), []).append(line)
+    return list(groups.items())
+
+
+def assign_groups(weights, workers):
+    """
+    Longest-processing-time-first scheduling: groups sorted by weight (heaviest first) are each given
+    to the worker with the least total weight so far.
+    :param weights: dict of group id -> weight (e.g. number of tests or expected seconds)
+    Returns a list of 'workers' lists of group ids (empty workers are possible with few groups).
+    """
+    buckets = [[] for _ in range(workers)]
+    loads = [0.0] * workers
+    for group_id in sorted(weights, key=lambda g: (-weights[g], g)):
+        index = loads.index(min(loads))
+        buckets[index].append(group_id)
+        loads[index] += weights[group_id]
+    return buckets
+
+
+def get_duration_history_path():
+    return os.environ.get("DURATION_HISTORY_FILE") or ".class_durations.json"
+
+
+def load_duration_history(path):
+    """Returns the history {group id: {'seconds': float, 'runs': int}}; empty if the file is missing or unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable duration history {path}: {e}")
+        return {}
+
+
+def update_duration_history(path, durations):
+    """
+    Folds one run's class durations into the history file (moving average, so one slow run does not
+    dominate) and writes it atomically. Classes not in 'durations' keep their entries.
+    """
+    history = load_duration_history(path)
+    for group_id, seconds in durations.items():
+        entry = history.get(group_id)
+        if entry is None:
+            history[group_id] = {"seconds": round(seconds, 2), "runs": 1}
+        else:
+            average = HISTORY_NEW_RUN_WEIGHT * seconds + (1 - HISTORY_NEW_RUN_WEIGHT) * entry["seconds"]
+            history[group_id] = {"seconds": round(average, 2), "runs": entry["runs"] + 1}
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+    return history
+
+
+def write_class_durations(results_dir, durations):
+    """Writes one session's per-class durations (group id -> seconds) to RESULTS_DIR/class_durations.json."""
+    os.makedirs(results_dir, exist_ok=True)
+    path = os.path.join(results_dir, CLASS_DURATIONS_FILE)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(durations, f, indent=2, sort_keys=True)
+    return path
+
+
+def read_class_durations(results_dirs, since=None):
+    """
+    Combines the class_durations.json files of the given result folders. Missing files, and files
+    last written before 'since' (epoch seconds, e.g. left over from an earlier run), are skipped.
+    """
+    durations = {}
+    for results_dir in results_dirs:
+        path = os.path.join(results_dir, CLASS_DURATIONS_FILE)
+        if not os.path.exists(path) or (since is not None and os.path.getmtime(path) < since):
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            for group_id, seconds in json.load(f).items():
+                durations[group_id] = durations.get(group_id, 0.0) + seconds
+    return durations
+
+
+def estimate_weights(groups, history):
+    """
+    Expected seconds per group: its history duration, or for classes without history their number of
+    tests times the average seconds per test of the known classes (1s per test if there is no history).
+    :param groups: list of (group id, [test node ids]) from collect_test_groups
+    """
+    known = [(history[g]["seconds"], len(ids)) for g, ids in groups if g in history]
+    known_tests = sum(count for _, count in known)
+    seconds_per_test = sum(seconds for seconds, _ in known) / known_tests if known_tests else 1.0
+    return {g: history[g]["seconds"] if g in history else len(ids) * seconds_per_test for g, ids in groups}
+
+
+def parse_shard(value):
+    """Parses '--shard i/n' (1-based) into (i, n); raises ValueError for anything else."""
+    try:
+        index, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        index, total = 0, 0
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError(
+            f"❌ Invalid --shard value: '{value}'\n"
+            f"   Expected i/n with 1 <= i <= n, e.g. --shard 2/4"
+        )
+    return index, total
+
+
+def worker_env(base_env, worker_index, results_dir):
+    """
+    Environment for one worker process: its own RESULTS_DIR and TEST_DATA_NAMESPACE, while the product
+    cache, auth state cache and data pool stay shared under the run's RESULTS_DIR (unless set explicitly).
+    """
+    env = dict(base_env)
+    env["RESULTS_DIR"] = os.path.join(results_dir, f"worker-{worker_index}")
+    env["TEST_DATA_NAMESPACE"] = f"w{worker_index}"
+    env.setdefault("CACHE_DIR", os.path.join(results_dir, "cache"))
+    env.setdefault("DATA_POOL_DIR", os.path.join(results_dir, "data_pool"))
+    return env
+
+
+def run_workers(assignments, pytest_options, results_dir, html_report=None, cwd=None):
+    """
+    Starts one pytest process per non-empty assignment and waits for all of them.
+    Worker output goes to RESULTS_DIR/worker-<i>/output.log, JUnit results to .../junit.xml and, if
+    'html_report' is given, a pytest-html report to .../<html_report>.
+    :param assignments: list of group-id lists, one per worker (see assign_groups)
+    :param pytest_options: extra pytest options for every worker (e.g. ['-m', 'smoke', '--alluredir=...'])
+    Returns a list of dicts per worker: index, groups, exit_code, seconds, results_dir, log.
+    """
+    procs = []
+    for index, groups in enumerate(assignments):
+        if not groups:
+            continue
+        env = worker_env(os.environ, index, results_dir)
+        worker_dir = env["RESULTS_DIR"]
+        os.makedirs(worker_dir, exist_ok=True)
+        args = [sys.executable, "-m", "pytest", *groups, *pytest_options,
+                f"--junitxml={os.path.join(worker_dir, 'junit.xml')}"]
+        if html_report:
+            args += [f"--html={os.path.join(worker_dir, html_report)}", "--self-contained-html"]
+        log_path = os.path.join(worker_dir, "output.log")
+        log = open(log_path, "w", encoding="utf-8")
+        print(f"Worker {index}: {len(groups)} classes -> {log_path}")
+        procs.append({
+            "index": index, "groups": groups, "results_dir": worker_dir, "log": log_path,
+            "start": time.perf_counter(), "log_file": log,
+            "process": subprocess.Popen(args, cwd=cwd, env=env, stdout=log, stderr=subprocess.STDOUT),
+        })
+
+    results = []
+    pending = list(procs)
+    while pending:
+        for proc in list(pending):
+            if proc["process"].poll() is None:
+                continue
+            proc["log_file"].close()
+            seconds = time.perf_counter() - proc["start"]
+            print(f"Worker {proc['index']} finished in {seconds:.1f}s (exit code {proc['process'].returncode})")
+            results.append({
+                "index": proc["index"], "groups": proc["groups"], "exit_code": proc["process"].returncode,
+                "seconds": seconds, "results_dir": proc["results_dir"], "log": proc["log"],
+            })
+            pending.remove(proc)
+        time.sleep(0.2)
+    return sorted(results, key=lambda r: r["index"])
+
+
+def read_junit_counts(junit_path):
+    """Returns {'tests', 'failures', 'errors', 'skipped', 'time'} summed over a JUnit XML file (zeros if missing)."""
+    counts = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0, "time": 0.0}
+    if not os.path.exists(junit_path):
+        return counts
+    root = ET.parse(junit_path).getroot()
+    suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+    for suite in suites:
+        for key in ("tests", "failures", "errors", "skipped"):
+            counts[key] += int(suite.get(key, 0))
+        counts["time"] += float(suite.get("time", 0))
+    return counts
+
+
+def merge_junit_reports(worker_results, output_path):
+    """Writes one JUnit XML file containing every worker's test suites (one <testsuite> per worker)."""
+    merged = ET.Element("testsuites")
+    for result in worker_results:
+        junit_path = os.path.join(result["results_dir"], "junit.xml")
+        if not os.path.exists(junit_path):
+            continue
+        root = ET.parse(junit_path).getroot()
+        for suite in ([root] if root.tag == "testsuite" else root.findall("testsuite")):
+            suite.set("name", f"{suite.get('name', 'pytest')}-worker-{result['index']}")
+            merged.append(suite)
+    ET.ElementTree(merged).write(output_path, encoding="utf-8", xml_declaration=True)
+    return output_path
+
+
+def build_utilization_summary(worker_results, wall_seconds):
+    """Per-worker busy time, share of the run's wall time and test outcomes, plus run totals."""
+    workers = []
+    for result in worker_results:
+        counts = read_junit_counts(os.path.join(result["results_dir"], "junit.xml"))
+        workers.append({
+            "worker": result["index"],
+            "classes": len(result["groups"]),
+            "tests": counts["tests"],
+            "failed": counts["failures"] + counts["errors"],
+            "skipped": counts["skipped"],
+            "busy_seconds": round(result["seconds"], 1),
+            "utilization": round(result["seconds"] / wall_seconds, 3) if wall_seconds else 0.0,
+            "exit_code": result["exit_code"],
+        })
+    busy = sum(w["busy_seconds"] for w in workers)
+    return {
+        "wall_seconds": round(wall_seconds, 1),
+        "busy_seconds": round(busy, 1),
+        "average_utilization": round(busy / (wall_seconds * len(workers)), 3) if workers and wall_seconds else 0.0,
+        "workers": workers,
+    }
+
+
+def format_utilization_summary(summary):
+    lines = [f"{'worker':>6} {'classes':>7} {'tests':>5} {'failed':>6} {'busy s':>8} {'util':>6}"]
+    for w in summary["workers"]:
+        lines.append(f"{w['worker']:>6} {w['classes']:>7} {w['tests']:>5} {w['failed']:>6} "
+                     f"{w['busy_seconds']:>8.1f} {w['utilization']:>6.0%}")
+    lines.append(f"wall time {summary['wall_seconds']:.1f}s, busy {summary['busy_seconds']:.1f}s, "
+                 f"average utilization {summary['average_utilization']:.0%}")
+    return lines
+
+
+def write_html_index(summary, worker_results, output_path, html_report):
+    """
+    Writes an HTML index page with the utilization table and links to each worker's pytest-html report and log.
+    The reports themselves stay separate (pytest-html does not merge reports itself).
+    """
+    out_dir = os.path.dirname(os.path.abspath(output_path))
+    rows = []
+    for w, result in zip(summary["workers"], worker_results):
+        report = os.path.relpath(os.path.join(result["results_dir"], html_report), out_dir)
+        log = os.path.relpath(result["log"], out_dir)
+        status = "passed" if w["exit_code"] == 0 else f"exit code {w['exit_code']}"
+        rows.append(
+            f"<tr><td>{w['worker']}</td><td>{w['classes']}</td><td>{w['tests']}</td><td>{w['failed']}</td>"
+            f"<td>{w['skipped']}</td><td>{w['busy_seconds']:.1f}</td><td>{w['utilization']:.0%}</td>"
+            f"<td>{html.escape(status)}</td><td><a href=\"{html.escape(report)}\">report</a> · "
+            f"<a href=\"{html.escape(log)}\">log</a></td></tr>"
+        )
+    page = (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>Test run (parallel)</title>"
+        "<style>body{font-family:sans-serif}td,th{padding:4px 10px;text-align:right}</style></head><body>"
+        f"<h1>Test run: {len(summary['workers'])} workers</h1>"
+        f"<p>Wall time {summary['wall_seconds']:.1f}s, busy {summary['busy_seconds']:.1f}s, "
+        f"average utilization {summary['average_utilization']:.0%}</p>"
+        "<table><tr><th>worker</th><th>classes</th><th>tests</th><th>failed</th><th>skipped</th>"
+        "<th>busy s</th><th>util</th><th>status</th><th></th></tr>"
+        f"{''.join(rows)}</table></body></html>"
+    )
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(page)
+    return output_path
+
+
+def write_summary_file(summary, results_dir, file_name="workers.json"):
+    path = os.path.join(results_dir, file_name)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    return path
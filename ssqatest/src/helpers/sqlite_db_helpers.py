@@ -0,0 +1,186 @@
+"""
+SQLite stand-in for the shop's MySQL database, selected with DB_BACKEND=sqlite.
+It lets DB-verification logic (database_helpers) and its tests run without a MySQL server: the database
+file is attached under the schema name so '<schema>.wp_posts' queries work unchanged, the 'wp_posts'
+table has the columns WooCommerce order lookups read, and connections behave like pymysql ones
+(%s / %(name)s placeholders, dict cursors, ping()).
+Rows are written with seed_orders(), usually through the 'seed_orders_db' fixture.
+"""
+
+import os
+import re
+import sqlite3
+import tempfile
+
+import pymysql
+from ssqatest.src.configs.generic_configs import GenericConfigs
+
+
+# Column names and defaults of WordPress' wp_posts table (orders are rows with post_type 'shop_order_placehold')
+POSTS_COLUMNS = (
+    ("ID", "INTEGER PRIMARY KEY"),
+    ("post_author", "INTEGER NOT NULL DEFAULT 0"),
+    ("post_date", "TEXT NOT NULL DEFAULT '0000-00-00 00:00:00'"),
+    ("post_date_gmt", "TEXT NOT NULL DEFAULT '0000-00-00 00:00:00'"),
+    ("post_content", "TEXT NOT NULL DEFAULT ''"),
+    ("post_title", "TEXT NOT NULL DEFAULT ''"),
+    ("post_excerpt", "TEXT NOT NULL DEFAULT ''"),
+    ("post_status", "TEXT NOT NULL DEFAULT 'publish'"),
+    ("comment_status", "TEXT NOT NULL DEFAULT 'open'"),
+    ("ping_status", "TEXT NOT NULL DEFAULT 'open'"),
+    ("post_password", "TEXT NOT NULL DEFAULT ''"),
+    ("post_name", "TEXT NOT NULL DEFAULT ''"),
+    ("to_ping", "TEXT NOT NULL DEFAULT ''"),
+    ("pinged", "TEXT NOT NULL DEFAULT ''"),
+    ("post_modified", "TEXT NOT NULL DEFAULT '0000-00-00 00:00:00'"),
+    ("post_modified_gmt", "TEXT NOT NULL DEFAULT '0000-00-00 00:00:00'"),
+    ("post_content_filtered", "TEXT NOT NULL DEFAULT ''"),
+    ("post_parent", "INTEGER NOT NULL DEFAULT 0"),
+    ("guid", "TEXT NOT NULL DEFAULT ''"),
+    ("menu_order", "INTEGER NOT NULL DEFAULT 0"),
+    ("post_type", "TEXT NOT NULL DEFAULT 'post'"),
+    ("post_mime_type", "TEXT NOT NULL DEFAULT ''"),
+    ("comment_count", "INTEGER NOT NULL DEFAULT 0"),
+)
+
+_PLACEHOLDER = re.compile(r"%\((\w+)\)s|%s|%%")
+
+
+def _translate_placeholders(sql):
+    """Converts pymysql placeholders to sqlite3 ones: %s -> ?, %(name)s -> :name, %% -> %."""
+    def replace(match):
+        if match.group(1):
+            return f":{match.group(1)}"
+        return "?" if match.group(0) == "%s" else "%"
+    return _PLACEHOLDER.sub(replace, sql)
+
+
+class SqliteCursor:
+    """pymysql-style cursor over a sqlite3 cursor; returns dict rows when opened with a pymysql dict cursor class."""
+
+    def __init__(self, cursor, as_dict):
+        self._cursor = cursor
+        self._as_dict = as_dict
+
+    def _row(self, row):
+        if row is None or not self._as_dict:
+            return row
+        return {column[0]: value for column, value in zip(self._cursor.description, row)}
+
+    def execute(self, sql, params=None):
+        if params is None:
+            return self._cursor.execute(_translate_placeholders(sql))
+        if not isinstance(params, dict):
+            params = tuple(params)
+        return self._cursor.execute(_translate_placeholders(sql), params)
+
+    def fetchone(self):
+        return self._row(self._cursor.fetchone())
+
+    def fetchmany(self, size):
+        return [self._row(row) for row in self._cursor.fetchmany(size)]
+
+    def fetchall(self):
+        return [self._row(row) for row in self._cursor.fetchall()]
+
+    def close(self):
+        self._cursor.close()
+
+
+class SqliteConnection:
+    """pymysql-style connection (cursor/ping/close) over a sqlite3 connection in autocommit mode."""
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    def cursor(self, cursor_class=None):
+        as_dict = cursor_class is not None and issubclass(cursor_class, pymysql.cursors.DictCursorMixin)
+        return SqliteCursor(self._connection.cursor(), as_dict)
+
+    def ping(self, reconnect=False):
+        self._connection.execute("SELECT 1")
+
+    def close(self):
+        self._connection.close()
+
+
+def quote_identifier(name):
+    """
+    Quotes a schema/table name for SQL, e.g. a DB_NAME like 'local-shop'. Backticks work in both MySQL
+    and SQLite, so database_helpers uses this for queries on either backend.
+    """
+    return "`" + name.replace("`", "``") + "`"
+
+
+def get_sqlite_path(db_name):
+    """DB_SQLITE_PATH if set, else '<RESULTS_DIR or temp dir>/db/<db_name>.sqlite3'."""
+    path = os.environ.get("DB_SQLITE_PATH")
+    if not path:
+        base_dir = os.environ.get("RESULTS_DIR") or tempfile.gettempdir()
+        path = os.path.join(base_dir, "db", f"{db_name}.sqlite3")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    return path
+
+
+def create_schema(connection, db_name):
+    """Creates the posts table in the attached schema if it does not exist yet."""
+    table_prefix = GenericConfigs.DATABASE_TABLE_PREFIX
+    schema = quote_identifier(db_name)
+    columns = ", ".join(f"{name} {definition}" for name, definition in POSTS_COLUMNS)
+    connection.execute(f"CREATE TABLE IF NOT EXISTS {schema}.{table_prefix}posts ({columns})")
+    connection.execute(f"CREATE INDEX IF NOT EXISTS {schema}.{table_prefix}posts_type_status_date "
+                       f"ON {table_prefix}posts (post_type, post_status, post_date, ID)")
+
+
+def connect_sqlite(path, db_name):
+    """
+    Opens a connection with the database file at 'path' attached as 'db_name' and the schema created.
+    Returns a SqliteConnection; the pool may hand it to other threads, so sqlite3's same-thread check is off.
+    """
+    connection = sqlite3.connect(":memory:", isolation_level=None, check_same_thread=False, timeout=30)
+    connection.execute("ATTACH DATABASE ? AS " + quote_identifier(db_name), (path,))
+    connection.execute(f"PRAGMA {quote_identifier(db_name)}.journal_mode=WAL")
+    create_schema(connection, db_name)
+    return SqliteConnection(connection)
+
+
+def seed_orders(connection, db_name, orders):
+    """
+    Inserts (or replaces) order rows in '<db_name>.wp_posts'.
+    :param orders: list of dicts with at least 'ID'; post_type defaults to 'shop_order_placehold' and
+                   post_status to 'wc-processing', any other wp_posts column may be given
+    Returns the IDs written.
+    """
+    table_prefix = GenericConfigs.DATABASE_TABLE_PREFIX
+    known = {name for name, _ in POSTS_COLUMNS}
+    ids = []
+    cursor = connection.cursor()
+    try:
+        for order in orders:
+            row = {"post_type": "shop_order_placehold", "post_status": "wc-processing", **order}
+            unknown = set(row) - known
+            if unknown:
+                raise ValueError(f"❌ Unknown {table_prefix}posts column(s) in seeded order: {sorted(unknown)}\n"
+                                 f"   Known columns: {', '.join(sorted(known))}")
+            columns = ", ".join(row)
+            placeholders = ", ".join(["%s"] * len(row))
+            cursor.execute(f"INSERT OR REPLACE INTO {quote_identifier(db_name)}.{table_prefix}posts ({columns}) "
+                           f"VALUES ({placeholders})", list(row.values()))
+            ids.append(int(row["ID"]))
+    finally:
+        cursor.close()
+    return ids
+
+
+def delete_orders(connection, db_name, order_ids):
+    """Deletes the given rows from '<db_name>.wp_posts'."""
+    if not order_ids:
+        return
+    table_prefix = GenericConfigs.DATABASE_TABLE_PREFIX
+    placeholders = ", ".join(["%s"] * len(order_ids))
+    cursor = connection.cursor()
+    try:
+        cursor.execute(f"DELETE FROM {quote_identifier(db_name)}.{table_prefix}posts WHERE ID IN ({placeholders})",
+                       list(order_ids))
+    finally:
+        cursor.close()
@@ -9,6 +9,8 @@ from ssqatest.src.helpers.config_helpers import get_base_url
 class CartPage(CartPageLocators):
 
     endpoint = '/cart'
+    # Element that must exist before tests interact with the page (checked after navigation)
+    ready_locator = CartPageLocators.CART_BLOCK
 
     def __init__(self, driver):
         self.driver = driver
@@ -17,20 +19,15 @@ class CartPage(CartPageLocators):
     def go_to_cart_page(self):
         base_url = get_base_url()
         cart_url = base_url + self.endpoint
-        self.driver.get(cart_url)
+        self.sl.go_to(cart_url, ready_locator=self.ready_locator)
 
     def verify_cart_page_url(self):
         self.sl.wait_until_url_contains('/cart/')
 
     def get_all_product_names_in_cart(self):
-        product_name_elements = self.sl.wait_and_get_elements(self.PRODUCT_NAMES_IN_CART)
-        product_names = []
-        for elem in product_name_elements:
-            # Get text from the element - this is what's actually displayed on the page
-            text = elem.text.strip()
-            if text:
-                product_names.append(text)
-        return product_names
+        snapshot = self.sl.snapshot({'names': self.PRODUCT_NAMES_IN_CART}, wait_until_visible=True)
+        # Rendered text only - this is what's actually displayed on the page
+        return [name['text'] for name in snapshot['names'] if name['text']]
 
     def get_quantity_for_product(self, product_name):
         """
@@ -1,12 +1,24 @@
+from selenium.common.exceptions import TimeoutException
 
 from ssqatest.src.SeleniumExtended import SeleniumExtended
 from ssqatest.src.pages.locators.CheckoutPageLocators import CheckoutPageLocators
 from ssqatest.src.helpers.generic_helpers import generate_random_email_and_password
 from ssqatest.src.helpers.config_helpers import get_base_url
 
+# Sets window.ssqaCheckoutUpdated once WooCommerce's next checkout refresh (update_order_review AJAX) has finished
+_JS_WATCH_UPDATED_CHECKOUT = """
+window.ssqaCheckoutUpdated = false;
+if (window.jQuery) {
+    window.jQuery(document.body).one('updated_checkout', function () { window.ssqaCheckoutUpdated = true; });
+}
+"""
+
+
 class CheckoutPage(CheckoutPageLocators):
 
     endpoint = '/checkout'
+    # Checkout block renders its form client-side; the place order button means the form is there
+    ready_locator = CheckoutPageLocators.PLACE_ORDER_BTN
 
     def __init__(self, driver):
         self.driver = driver
@@ -15,15 +27,11 @@ class CheckoutPage(CheckoutPageLocators):
     def go_to_checkout_page(self):
         base_url = get_base_url()
         checkout_url = base_url + self.endpoint
-        self.driver.get(checkout_url)
+        self.sl.go_to(checkout_url, ready_locator=self.ready_locator)
 
-    def _field_exists(self, locator, timeout=2):
-        """Check if a field exists on the page."""
-        try:
-            self.sl.wait_until_element_is_visible(locator, timeout=timeout)
-            return True
-        except:
-            return False
+    def _field_exists(self, locator):
+        """Check if a field exists on the page (answers as soon as the checkout form is rendered)."""
+        return self.sl.is_present_now(locator, settled_locator=self.ready_locator, legacy_timeout=2)
 
     def input_billing_first_name(self, first_name=None):
         first_name = first_name if first_name else 'AutomationFname'
@@ -64,10 +72,22 @@ class CheckoutPage(CheckoutPageLocators):
 
     def select_billing_country(self, country="United States (US)"):
         if self._field_exists(self.BILLING_COUNTRY_DROPDOWN):
+            if self.sl.wait_and_get_selected_option_text(self.BILLING_COUNTRY_DROPDOWN) == country:
+                return
+            states_before = self.sl.get_select_option_values(self.BILLING_STATE_DROPDOWN)
+            # WooCommerce fires 'updated_checkout' when the checkout refresh started by the country change is done
+            self.driver.execute_script(_JS_WATCH_UPDATED_CHECKOUT)
             self.sl.wait_and_select_dropdown(self.BILLING_COUNTRY_DROPDOWN, to_select=country, select_by="visible_text")
-            # Wait a moment for state dropdown to populate after country selection
-            import time
-            time.sleep(0.5)
+            # Done when the state dropdown is repopulated for the new country, or, for countries with the
+            # same state list (or none), when the checkout refresh has finished without changing it
+            try:
+                self.sl.wait_until_select_is_repopulated(
+                    self.BILLING_STATE_DROPDOWN, states_before, timeout=5,
+                    or_until=lambda driver: driver.execute_script("return window.ssqaCheckoutUpdated === true;")
+                )
+            except TimeoutException:
+                # Checkout without the AJAX refresh (no jQuery): the state field is updated synchronously
+                pass
 
     def select_billing_state(self, state='California'):
         if self._field_exists(self.BILLING_STATE_DROPDOWN):
@@ -15,23 +15,28 @@ class Header(HeaderLocators):
 
     def wait_until_cart_item_count(self, count, timeout=20):
         # Accept "N item", "N items", or "N" (theme may vary). Longer timeout for headless/AJAX updates.
-        expected_substring = str(count)
+        import re
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support import expected_conditions as EC
+        # The header cart also shows the cart total (e.g. "$10.00 0 items"), so a bare "1" in its text
+        # proves nothing; only "<count> item(s)" as a whole word counts there.
+        count_in_header = re.compile(rf"\b{count} items?\b")
+
+        def header_shows_count(driver):
+            return bool(count_in_header.search(driver.find_element(*self.CART_RIGHT_HEADER).text or ""))
+
         try:
-            self.sl.wait_until_element_contains_text(self.CART_ITEM_COUNT, expected_substring, timeout=timeout)
-            return
-        except Exception:
-            pass
-        # Fallback: any element inside site-header-cart that contains the count (theme may use different markup)
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        WebDriverWait(self.driver, timeout).until(
-            lambda d: expected_substring in (d.find_element(By.ID, "site-header-cart").text or ""),
-            message=f'Header cart did not show count "{count}" after {timeout}s.',
-        )
+            # Count element, or the count phrase inside site-header-cart (theme may use different markup)
+            self.sl.wait_for_any([
+                EC.text_to_be_present_in_element(self.CART_ITEM_COUNT, str(count)),
+                header_shows_count,
+            ], timeout=timeout)
+        except TimeoutException:
+            raise TimeoutException(f'Header cart did not show count "{count}" after {timeout}s.')
 
     def get_all_menu_item_text(self):
-        elms = self.sl.wait_and_get_elements(self.MENU_ITEMS)
-        menu_text = [elm.text for elm in elms]
+        snapshot = self.sl.snapshot({'menu_items': self.MENU_ITEMS}, wait_until_visible=True)
+        menu_text = [item['text'] for item in snapshot['menu_items']]
         return menu_text
 
     def assert_all_menu_items_displayed(self):
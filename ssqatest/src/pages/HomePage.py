@@ -5,13 +5,16 @@ from ssqatest.src.pages.locators.HomePageLocators import HomePageLocators
 
 class HomePage(HomePageLocators):
 
+    # Element that must exist before tests interact with the page (checked after navigation)
+    ready_locator = HomePageLocators.PRODUCT
+
     def __init__(self, driver):
         self.driver = driver
         self.sl = SeleniumExtended(self.driver)
 
     def go_to_home_page(self):
         home_url = get_base_url()
-        self.driver.get(home_url)
+        self.sl.go_to(home_url, ready_locator=self.ready_locator)
 
     def click_first_add_to_cart_button(self):
         self.sl.wait_and_click(self.ADD_TO_CART_BTN)
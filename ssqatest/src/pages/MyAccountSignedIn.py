@@ -1,12 +1,32 @@
 from ssqatest.src.pages.locators.MyAccountSignedInLocators import MyAccountSignedInLocators
 from ssqatest.src.SeleniumExtended import SeleniumExtended
+from ssqatest.src.helpers.config_helpers import get_base_url
 
 
 class MyAccountSignedIn(MyAccountSignedInLocators):
+
+    endpoint = '/my-account/'
+    # Element that must exist before tests interact with the page (checked after navigation)
+    ready_locator = MyAccountSignedInLocators.MAIN_CONTENT
+
     def __init__(self, driver):
         self.driver = driver
         self.sl = SeleniumExtended(self.driver)
 
+    def go_to_my_account(self):
+        my_account_url = get_base_url().rstrip("/") + self.endpoint
+        self.sl.go_to(my_account_url, ready_locator=self.ready_locator)
+
+    def open_my_account_and_check_signed_in(self):
+        """
+        Opens My Account without assuming the session is valid: waits for either the account area or the
+        login form and returns True if the account area was shown (False = signed out, e.g. a revoked session).
+        """
+        my_account_url = get_base_url().rstrip("/") + self.endpoint
+        self.sl.go_to(my_account_url)
+        winner, _ = self.sl.wait_for_any([self.MAIN_CONTENT, self.LOGIN_FORM])
+        return winner == self.MAIN_CONTENT
+
     def verify_user_is_signed_in(self):
         self.sl.wait_until_element_is_visible(self.LEFT_NAV_LOGOUT_BTN)
 
@@ -17,16 +37,12 @@ class MyAccountSignedIn(MyAccountSignedInLocators):
         return not self._is_login_form_visible()
 
     def _is_login_form_visible(self):
-        try:
-            self.sl.wait_until_element_is_visible(self.LOGIN_FORM, timeout=2)
-            return True
-        except Exception:
-            return False
+        return self.sl.is_present_now(self.LOGIN_FORM, legacy_timeout=2)
 
     def get_left_nav_link_texts(self):
         """Returns list of visible link texts in left nav (e.g. Dashboard, Orders, Log out)."""
-        elements = self.sl.wait_and_get_elements(self.LEFT_NAV_LINKS)
-        return [el.text.strip() for el in elements if el.text]
+        snapshot = self.sl.snapshot({'links': self.LEFT_NAV_LINKS}, wait_until_visible=True)
+        return [link['text'] for link in snapshot['links'] if link['text']]
 
     def is_main_content_visible(self):
         self.sl.wait_until_element_is_visible(self.MAIN_CONTENT)
@@ -8,6 +8,8 @@ import logging as logger
 class MyAccountSignedOut(MyAccountSignedOutLocators):
 
     endpoint = '/my-account/'
+    # Element that must exist before tests interact with the page (checked after navigation)
+    ready_locator = MyAccountSignedOutLocators.LOGIN_USER_NAME
 
     def __init__(self, driver):
         self.driver = driver
@@ -19,7 +21,7 @@ class MyAccountSignedOut(MyAccountSignedOutLocators):
         my_account_url = base_url + self.endpoint
         logger.info(f"Going to: {my_account_url}")
 
-        self.driver.get(my_account_url)
+        self.sl.go_to(my_account_url, ready_locator=self.ready_locator)
 
     def input_login_username(self, username):
         self.sl.wait_and_input_text(self.LOGIN_USER_NAME, username)
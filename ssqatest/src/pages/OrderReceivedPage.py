@@ -4,13 +4,15 @@ from ssqatest.src.pages.locators.OrderReceivedPageLocators import OrderReceivedP
 
 class OrderReceivedPage(OrderReceivedPageLocators):
 
+    # Reached by placing an order (no direct url); checked after the navigation in verify_order_received_page_loaded
+    ready_locator = OrderReceivedPageLocators.PAGE_MAIN_HEADER
+
     def __init__(self, driver):
         self.driver = driver
         self.sl = SeleniumExtended(self.driver)
 
     def verify_order_received_page_loaded(self):
         # Wait for URL to change to order-received page first
-        import time
         from selenium.webdriver.support.ui import WebDriverWait
         from selenium.webdriver.support import expected_conditions as EC
         
@@ -24,10 +26,10 @@ class OrderReceivedPage(OrderReceivedPageLocators):
             current_url = self.driver.current_url
             raise Exception(f"Page did not navigate to order-received page. Current URL: {current_url}")
         
-        # Small delay to ensure page is fully loaded
-        time.sleep(1)
+        # Make sure the new page has finished loading and has its readiness element before reading it
+        self.sl.wait_until_page_is_settled(self.ready_locator, timeout=10)
         
-        # Wait for the header element to be visible, then check text
+        # Then wait for the header to be visible and check its text
         header_element = self.sl.wait_until_element_is_visible(self.PAGE_MAIN_HEADER, timeout=10)
         header_text = header_element.text.strip()
         # Check if header contains the expected text (case-insensitive)
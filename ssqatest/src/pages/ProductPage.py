@@ -1,20 +1,111 @@
 from selenium.webdriver.common.by import By
 from ssqatest.src.SeleniumExtended import SeleniumExtended
 from ssqatest.src.pages.locators.ProductPageLocators import ProductPageLocators
+from ssqatest.src.pages.models.PdpModel import PdpModel, RelatedProduct
 from ssqatest.src.helpers.config_helpers import get_base_url
 
 class ProductPage(ProductPageLocators):
 
-
+    # Element that must exist before tests interact with the page (checked after navigation)
+    ready_locator = ProductPageLocators.PRODUCT_TITLE
 
     def __init__(self, driver):
         self.driver = driver
         self.sl = SeleniumExtended(self.driver)
+        self._pdp_model = None  # cached by extract_pdp_model() until the next navigation or interaction
 
     def go_to_product_page(self, product_slug):
+        self.invalidate_pdp_model()
         base_url = get_base_url()
         product_page_url = f"{base_url}/product/{product_slug}"
-        self.driver.get(product_page_url)
+        self.sl.go_to(product_page_url, ready_locator=self.ready_locator)
+
+    def invalidate_pdp_model(self):
+        """Drops the cached PdpModel. Methods of this class that navigate or change the page call it;
+        call it yourself after changing the page through the driver directly."""
+        self._pdp_model = None
+
+    def extract_pdp_model(self, refresh=False):
+        """
+        Reads everything a PDP displays (title, price, meta, description, breadcrumb, sale badge, tabs,
+        images, related products) in one browser round trip and returns it as an immutable PdpModel.
+        The model is cached until the next navigation or interaction through this page object, so
+        classes with many read-only assertions do not go back to the browser for each one. It is read
+        once the page has settled, so sections the page does not have (e.g. no gallery thumbnails or
+        related products) are empty in the model rather than still loading.
+
+        :param refresh: If True, re-reads the page even if a cached model exists.
+        """
+        if self._pdp_model is not None and not refresh:
+            return self._pdp_model
+
+        self.sl.wait_until_element_is_visible(self.PRODUCT_TITLE)
+        self.sl.wait_until_page_is_settled()
+        snapshot = self.sl.snapshot(
+            {
+                'title': self.PRODUCT_TITLE,
+                'price': self.PRODUCT_PRICE,
+                'type_text': self.PRODUCT_TYPE_TEXT,
+                'sku': self.PRODUCT_PAGE_SKU_AND_LABEL,
+                'category': self.PRODUCT_PAGE_CATEGORY_AND_LABEL,
+                'description_header': self.PRODUCT_DESCRIPTION_HEADER,
+                'description': self.PRODUCT_DESCRIPTION,
+                'breadcrumb': self.BREADCRUMB,
+                'sale_badge': self.MAIN_PRODUCT_SALE_BADGE,
+                'tabs': self.LEFT_NAV_TABS,
+                'main_image': self.PRODUCT_IMAGE_MAIN,
+                'alternate_images': self.PRODUCT_ALTERNATE_IMAGES,
+                'related_header': self.RELATED_PRODUCTS_SECTION_HEADER,
+                'related': self.RELATED_PRODUCTS_LIST,
+            },
+            attributes={
+                'price': ['innerHTML'],
+                'main_image': ['data-src', 'src'],
+                'alternate_images': ['src'],
+                'related': ['src'],
+            },
+            # each related product's own image, so a missing image is not filled in by the next item's
+            children={'related': {'image': 'img'}}
+        )
+
+        def first_text(key):
+            matches = snapshot[key]
+            return matches[0]['text'] if matches else ''
+
+        price = snapshot['price'][0]['attributes']['innerHTML'] if snapshot['price'] else ''
+        main_image = snapshot['main_image'][0] if snapshot['main_image'] else None
+        main_image_attributes = main_image['attributes'] if main_image else {}
+        visible_badges = [badge['text'] for badge in snapshot['sale_badge'] if badge['visible']]
+        related_products = []
+        for item in snapshot['related']:
+            image = item['children']['image']
+            related_products.append(RelatedProduct(
+                text=item['text'],
+                image_url=image['attributes']['src'] if image else None,
+                image_visible=bool(image and image['visible']),
+            ))
+
+        pdp_model = PdpModel(
+            title=first_text('title'),
+            price_text=first_text('price'),
+            price_html=price or '',
+            product_type_text=first_text('type_text'),
+            sku_and_label=first_text('sku'),
+            category_and_label=first_text('category'),
+            description_header=first_text('description_header'),
+            description_paragraphs=tuple(paragraph['text'] for paragraph in snapshot['description']),
+            breadcrumb=first_text('breadcrumb'),
+            sale_badge_text=visible_badges[0] if visible_badges else None,
+            tab_labels=tuple(tab['text'] for tab in snapshot['tabs']),
+            # Try data-src first (lazy loading), fallback to src if already loaded
+            main_image_url=main_image_attributes.get('data-src') or main_image_attributes.get('src'),
+            main_image_visible=bool(main_image and main_image['visible']),
+            alternate_image_urls=tuple(image['attributes']['src'] for image in snapshot['alternate_images']),
+            related_products_header=first_text('related_header'),
+            related_products=tuple(related_products),
+        )
+        self._pdp_model = pdp_model
+        return self._pdp_model
 
     def get_displayed_product_name(self):
         return self.sl.wait_and_get_text(self.PRODUCT_TITLE)
@@ -26,8 +117,9 @@ class ProductPage(ProductPageLocators):
         return src
 
     def get_url_of_displayed_alternate_images(self):
-        image_elements = self.sl.wait_until_elements_are_visible(self.PRODUCT_ALTERNATE_IMAGES)
-        srcs = [elem.get_attribute('src') for elem in image_elements]
+        snapshot = self.sl.snapshot({'images': self.PRODUCT_ALTERNATE_IMAGES}, attributes=['src'],
+                                    wait_until_visible=True)
+        srcs = [image['attributes']['src'] for image in snapshot['images']]
         return srcs
 
     def get_product_type_text(self):
@@ -46,23 +138,26 @@ class ProductPage(ProductPageLocators):
         return self.sl.wait_until_element_is_visible(self.ADD_TO_CART_BUTTON)
 
     def click_add_to_cart_button(self):
+        self.invalidate_pdp_model()
         # Use wait_and_click which handles scroll and click interception
         self.sl.wait_and_click(self.ADD_TO_CART_BUTTON)
 
     def get_view_cart_btn_on_add_to_cart_success_message_box(self):
-        """View cart link after add-to-cart success; falls back to any visible cart link if theme differs."""
-        from selenium.common.exceptions import TimeoutException
-        from selenium.webdriver.common.by import By
-        try:
-            return self.sl.wait_until_element_is_visible(self.VIEW_CART_BTN_IN_SUCCESS_MESSAGE, timeout=10)
-        except TimeoutException:
-            links = self.driver.find_elements(By.CSS_SELECTOR, 'a[href*="cart"]')
-            for el in links:
-                if el.is_displayed() and ("view" in (el.text or "").lower() or "cart" in (el.text or "").lower()):
+        """View cart link after add-to-cart success; also accepts any visible 'View cart' link if theme differs."""
+        def any_view_cart_link(driver):
+            # Must say 'view': plain 'Cart' links (menu, header) are on the page before the message appears
+            for el in driver.find_elements(By.CSS_SELECTOR, 'a[href*="cart"]'):
+                if el.is_displayed() and "view" in (el.text or "").lower():
                     return el
-            raise
+            return None
+
+        _, view_cart_btn = self.sl.wait_for_any(
+            [self.VIEW_CART_BTN_IN_SUCCESS_MESSAGE, any_view_cart_link], timeout=10
+        )
+        return view_cart_btn
 
     def click_view_cart_btn_on_add_to_cart_success_message_box(self):
+        self.invalidate_pdp_model()
         view_cart_btn = self.get_view_cart_btn_on_add_to_cart_success_message_box()
         view_cart_btn.click()
 
@@ -71,6 +166,7 @@ class ProductPage(ProductPageLocators):
 
     def set_quantity(self, value):
         """Set the quantity input to the given integer (e.g. 2). Clears existing value first."""
+        self.invalidate_pdp_model()
         qty_field = self.get_quantity_field_element()
         qty_field.clear()
         qty_field.send_keys(str(int(value)))
@@ -81,41 +177,11 @@ class ProductPage(ProductPageLocators):
 
     def is_sale_badge_visible(self):
         """Returns True if the main product's sale badge is visible (ignores related products in section.related)."""
-        try:
-            elements = self.sl.wait_and_get_elements(self.SALE_BADGE)
-            for el in elements:
-                if not el.is_displayed():
-                    continue
-                try:
-                    in_related = self.driver.execute_script(
-                        "var s = arguments[0].closest('section.related'); return s !== null;", el
-                    )
-                    if not in_related:
-                        return True
-                except Exception:
-                    pass
-            return False
-        except Exception:
-            return False
+        return self.extract_pdp_model().is_on_sale
 
     def get_sale_badge_text(self):
         """Returns the main product's sale badge text if visible (first badge not in section.related)."""
-        try:
-            elements = self.sl.wait_and_get_elements(self.SALE_BADGE)
-            for el in elements:
-                if not el.is_displayed():
-                    continue
-                try:
-                    in_related = self.driver.execute_script(
-                        "var s = arguments[0].closest('section.related'); return s !== null;", el
-                    )
-                    if not in_related:
-                        return el.text or ""
-                except Exception:
-                    pass
-            return ""
-        except Exception:
-            return ""
+        return self.extract_pdp_model().sale_badge_text or ""
 
     def get_displayed_sku_and_label(self):
         return self.sl.wait_and_get_text(self.PRODUCT_PAGE_SKU_AND_LABEL)
@@ -128,8 +194,8 @@ class ProductPage(ProductPageLocators):
 
     def get_displayed_product_description_full(self):
         """All description paragraphs joined (matches API HTML stripped with no space between tags)."""
-        elements = self.sl.wait_and_get_elements(self.PRODUCT_DESCRIPTION)
-        return "".join(elem.text for elem in elements)
+        snapshot = self.sl.snapshot({'paragraphs': self.PRODUCT_DESCRIPTION}, wait_until_visible=True)
+        return "".join(paragraph['text'] for paragraph in snapshot['paragraphs'])
 
     def get_displayed_product_description_header(self):
         return self.sl.wait_and_get_text(self.PRODUCT_DESCRIPTION_HEADER)
@@ -145,11 +211,12 @@ class ProductPage(ProductPageLocators):
         return self.sl.wait_until_elements_are_visible(self.LEFT_NAV_TABS)
 
     def get_labels_of_left_nav_tabs(self):
-        tabs_elements = self.get_left_nav_tab_elements()
-        return [i.text for i in tabs_elements]
+        snapshot = self.sl.snapshot({'tabs': self.LEFT_NAV_TABS}, wait_until_visible=True)
+        return [tab['text'] for tab in snapshot['tabs']]
 
     def click_additional_information_tab(self):
         """Clicks the Additional information tab so its content is visible."""
+        self.invalidate_pdp_model()
         self.sl.wait_and_click(self.ADDITIONAL_INFO_TAB_LINK)
 
     def get_additional_information_content_text(self):
@@ -159,6 +226,7 @@ class ProductPage(ProductPageLocators):
     # --- Reviews tab ---
     def click_reviews_tab(self):
         """Clicks the Reviews tab so its content is visible."""
+        self.invalidate_pdp_model()
         self.sl.wait_and_click(self.REVIEWS_TAB_LINK)
 
     def get_reviews_tab_content_text(self):
@@ -166,71 +234,52 @@ class ProductPage(ProductPageLocators):
         Caller must load the product page and open the Reviews tab first."""
         return self.sl.wait_and_get_text(self.REVIEWS_TAB_CONTENT)
 
-    def is_reviews_tab_content_visible(self):
-        """Returns True if the Reviews tab content panel is visible."""
+    def _is_reviews_element_visible(self, locator, legacy_timeout):
+        """
+        Non-blocking visibility check inside the Reviews tab. The tab content is server-rendered, so a
+        settled page is enough; it does not wait for the tab itself, which is missing on pages without reviews.
+        The settle wait is bounded by the timeout of the visibility wait this replaces.
+        """
+        from selenium.common.exceptions import TimeoutException
         try:
-            el = self.sl.wait_until_element_is_visible(self.REVIEWS_TAB_CONTENT, timeout=5)
-            return el.is_displayed()
-        except Exception:
+            return self.sl.is_present_now(locator, legacy_timeout=legacy_timeout, timeout=legacy_timeout)
+        except TimeoutException:
+            # Page still loading (or AJAX pending) after the legacy timeout
             return False
 
+    def is_reviews_tab_content_visible(self):
+        """Returns True if the Reviews tab content panel is visible."""
+        return self._is_reviews_element_visible(self.REVIEWS_TAB_CONTENT, legacy_timeout=5)
+
     def is_reviews_form_visible(self):
         """Returns True if the review comment form is visible."""
-        try:
-            el = self.sl.wait_until_element_is_visible(self.REVIEWS_FORM, timeout=3)
-            return el.is_displayed()
-        except Exception:
-            return False
+        return self._is_reviews_element_visible(self.REVIEWS_FORM, legacy_timeout=3)
 
     def is_reviews_rating_visible(self):
         """Returns True if rating selector (dropdown or stars) is visible."""
+        from selenium.common.exceptions import TimeoutException
         try:
             # WooCommerce may use p.stars (star links) or select#rating
-            el = self.sl.wait_until_element_is_visible(self.REVIEWS_RATING_SELECT, timeout=2)
-            return el.is_displayed()
-        except Exception:
-            # TODO: may be use the correct locator the first time
-            try:
-                stars = self.driver.find_elements(By.CSS_SELECTOR, "div#tab-reviews p.stars")
-                return bool(stars and stars[0].is_displayed())
-            except Exception:
-                return False
+            self.sl.wait_for_any([self.REVIEWS_RATING_SELECT, self.REVIEWS_RATING_STARS], timeout=2)
+            return True
+        except TimeoutException:
+            return False
 
     def is_reviews_comment_textarea_visible(self):
-        try:
-                el = self.sl.wait_until_element_is_visible(self.REVIEWS_COMMENT_TEXTAREA, timeout=2)
-                return el.is_displayed()
-        except Exception:
-            return False
+        return self._is_reviews_element_visible(self.REVIEWS_COMMENT_TEXTAREA, legacy_timeout=2)
 
     def is_reviews_author_input_visible(self):
-        try:
-            el = self.sl.wait_until_element_is_visible(self.REVIEWS_AUTHOR_INPUT, timeout=2)
-            return el.is_displayed()
-        except Exception:
-            return False
+        return self._is_reviews_element_visible(self.REVIEWS_AUTHOR_INPUT, legacy_timeout=2)
 
     def is_reviews_email_input_visible(self):
-        try:
-            el = self.sl.wait_until_element_is_visible(self.REVIEWS_EMAIL_INPUT, timeout=2)
-            return el.is_displayed()
-        except Exception:
-            return False
+        return self._is_reviews_element_visible(self.REVIEWS_EMAIL_INPUT, legacy_timeout=2)
 
     def is_reviews_submit_button_visible(self):
-        try:
-            el = self.sl.wait_until_element_is_visible(self.REVIEWS_SUBMIT_BUTTON, timeout=2)
-            return el.is_displayed()
-        except Exception:
-            return False
+        return self._is_reviews_element_visible(self.REVIEWS_SUBMIT_BUTTON, legacy_timeout=2)
 
     def is_reviews_save_details_checkbox_visible(self):
         """Returns True if 'Save my name, email, and website...' checkbox is visible."""
-        try:
-            el = self.sl.wait_until_element_is_visible(self.REVIEWS_SAVE_DETAILS_CHECKBOX, timeout=2)
-            return el.is_displayed()
-        except Exception:
-            return False
+        return self._is_reviews_element_visible(self.REVIEWS_SAVE_DETAILS_CHECKBOX, legacy_timeout=2)
 
     def get_reviews_save_details_checkbox_label_text(self):
         """Returns the label text for the save-details checkbox (for assertion)."""
@@ -244,36 +293,37 @@ class ProductPage(ProductPageLocators):
 
     def fill_review_rating(self, value):
         """Set rating to 1-5. Tries select#rating first, then star links (p.stars a.star-N)."""
+        self.invalidate_pdp_model()
         rating = int(value)
         if rating < 1 or rating > 5:
             return
         try:
-            el = self.sl.wait_until_element_is_visible(self.REVIEWS_RATING_SELECT, timeout=2)
-            from selenium.webdriver.support.ui import Select
-            Select(el).select_by_value(str(rating))
-            return
-        except Exception:
-            pass
-        try:
-            star = self.driver.find_element(By.CSS_SELECTOR, f"div#tab-reviews p.stars a.star-{rating}")
-            if star.is_displayed():
-                star.click()
+            winner, el = self.sl.wait_for_any([self.REVIEWS_RATING_SELECT, self.REVIEWS_RATING_STARS], timeout=2)
+            if winner == self.REVIEWS_RATING_SELECT:
+                from selenium.webdriver.support.ui import Select
+                Select(el).select_by_value(str(rating))
+            else:
+                el.find_element(By.CSS_SELECTOR, f"a.star-{rating}").click()
         except Exception:
             pass
 
     def fill_review_comment(self, text):
+        self.invalidate_pdp_model()
         self.sl.wait_until_element_is_visible(self.REVIEWS_COMMENT_TEXTAREA)
         self.sl.wait_and_input_text(self.REVIEWS_COMMENT_TEXTAREA, text)
 
     def fill_review_author(self, text):
+        self.invalidate_pdp_model()
         self.sl.wait_until_element_is_visible(self.REVIEWS_AUTHOR_INPUT)
         self.sl.wait_and_input_text(self.REVIEWS_AUTHOR_INPUT, text)
 
     def fill_review_email(self, text):
+        self.invalidate_pdp_model()
         self.sl.wait_until_element_is_visible(self.REVIEWS_EMAIL_INPUT)
         self.sl.wait_and_input_text(self.REVIEWS_EMAIL_INPUT, text)
 
     def click_review_submit(self):
+        self.invalidate_pdp_model()
         self.sl.wait_and_click(self.REVIEWS_SUBMIT_BUTTON)
 
     def get_alert_text(self):
@@ -283,6 +333,7 @@ class ProductPage(ProductPageLocators):
 
     def dismiss_alert_if_present(self):
         """Accepts any open browser alert (e.g. 'Please select a rating'). Call after submit if needed."""
+        self.invalidate_pdp_model()
         try:
             alert = self.driver.switch_to.alert
             alert.accept()
@@ -329,8 +380,11 @@ class ProductPage(ProductPageLocators):
 
     def get_review_list_texts(self):
         """Returns list of visible text per review (one string per li.comment). Caller must have Reviews tab open."""
-        elements = self.get_review_list_elements()
-        return [el.text for el in elements] if elements else []
+        try:
+            snapshot = self.sl.snapshot({'reviews': self.REVIEWS_LIST}, wait_until_visible=True)
+        except Exception:
+            return []
+        return [review['text'] for review in snapshot['reviews']]
 
     def get_reviews_tab_label_text(self):
         """Returns the Reviews tab label text (e.g. 'Reviews (0)' or 'Reviews (1)')."""
@@ -344,21 +398,22 @@ class ProductPage(ProductPageLocators):
         return self.sl.wait_and_get_text(self.VARIABLE_PRODUCT_COLOR_ATTRIBUTE_LABEL)
 
     def get_label_for_logo_attribute_dropdown(self):
-        """Logo attribute label; wait for variations table then find by text or locator (theme/headless may differ)."""
-        from selenium.webdriver.common.by import By
-        # Wait for variations table to be present (headless may render later)
-        self.sl.wait_until_element_is_visible((By.CSS_SELECTOR, "table.variations"), timeout=15)
-        ths = self.driver.find_elements(By.CSS_SELECTOR, "table.variations tr th.label")
-        for th in ths:
-            text = (th.text or "").strip()
-            if "Logo" in text:
-                return "Logo"
-        labels = self.driver.find_elements(By.CSS_SELECTOR, "table.variations tr th.label label")
-        for el in labels:
-            if "Logo" in (el.text or ""):
-                return "Logo"
-        # Primary: explicit locator (for= logo, pa_logo, attribute_logo)
-        return self.sl.wait_and_get_text(self.VARIABLE_PRODUCT_LOGO_ATTRIBUTE_LABEL)
+        """Logo attribute label; found by text or by locator, whichever shows first (theme/headless may differ)."""
+        def logo_label_by_text(driver):
+            # Covers th.label text and the label inside it
+            for th in driver.find_elements(By.CSS_SELECTOR, "table.variations tr th.label"):
+                if th.is_displayed() and "Logo" in (th.text or ""):
+                    return th
+            return None
+
+        # Variations table may render later in headless, hence the longer timeout
+        winner, el = self.sl.wait_for_any(
+            [logo_label_by_text, self.VARIABLE_PRODUCT_LOGO_ATTRIBUTE_LABEL], timeout=15
+        )
+        if winner is logo_label_by_text:
+            return "Logo"
+        # Explicit locator (for= logo, pa_logo, attribute_logo)
+        return el.text
 
     def get_color_dropdown_options_elements(self):
         return self.sl.wait_until_elements_are_visible(self.VARIABLE_PRODUCT_COLOR_ATTRIBUTE_OPTIONS)
@@ -370,7 +425,7 @@ class ProductPage(ProductPageLocators):
     def get_color_dropdown_options_values_and_text(self):
         """
         Gets color dropdown options with value and text.
-        Retry logic is handled in SeleniumExtended.wait_and_get_dropdown_options_with_attributes().
+        Read in a single round trip by SeleniumExtended.wait_and_get_dropdown_options_with_attributes().
         """
         return self.sl.wait_and_get_dropdown_options_with_attributes(
             self.VARIABLE_PRODUCT_COLOR_ATTRIBUTE_OPTIONS
@@ -379,7 +434,7 @@ class ProductPage(ProductPageLocators):
     def get_logo_dropdown_options_values_and_text(self):
         """
         Gets logo dropdown options with value and text.
-        Retry logic is handled in SeleniumExtended.wait_and_get_dropdown_options_with_attributes().
+        Read in a single round trip by SeleniumExtended.wait_and_get_dropdown_options_with_attributes().
         """
         return self.sl.wait_and_get_dropdown_options_with_attributes(
             self.VARIABLE_PRODUCT_LOGO_ATTRIBUTE_OPTIONS
@@ -390,6 +445,7 @@ class ProductPage(ProductPageLocators):
         Selects a color option by visible text.
         Retry logic is handled in SeleniumExtended.wait_and_select_dropdown().
         """
+        self.invalidate_pdp_model()
         self.sl.wait_and_select_dropdown(
             self.VARIABLE_PRODUCT_COLOR_ATTRIBUTE_DROPDOWN,
             to_select=color,
@@ -401,6 +457,7 @@ class ProductPage(ProductPageLocators):
         Selects a logo option by visible text.
         Retry logic is handled in SeleniumExtended.wait_and_select_dropdown().
         """
+        self.invalidate_pdp_model()
         self.sl.wait_and_select_dropdown(
             self.VARIABLE_PRODUCT_LOGO_ATTRIBUTE_DROPDOWN,
             to_select=logo_option,
@@ -408,6 +465,7 @@ class ProductPage(ProductPageLocators):
         )
 
     def click_reset_variations_btn(self):
+        self.invalidate_pdp_model()
         self.sl.wait_and_click(self.RESET_VARIATIONS_BTN)
 
     def get_selected_color_option(self):
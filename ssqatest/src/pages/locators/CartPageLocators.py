@@ -3,6 +3,8 @@ from selenium.webdriver.common.by import By
 
 class CartPageLocators:
 
+    # Cart wrapper: the cart block (present for both empty and non-empty carts) or the classic cart form
+    CART_BLOCK = (By.CSS_SELECTOR, '.woocommerce-cart-form, div.wp-block-woocommerce-cart')
     PRODUCT_NAMES_IN_CART = (By.CSS_SELECTOR, '[class*="product-name"]')
     # One row/block per product; product name and quantity live in the same line item.
     # Demostore: classic WooCommerce cart table. If your store uses block cart, update to the
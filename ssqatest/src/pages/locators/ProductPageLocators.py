@@ -29,6 +29,8 @@ class ProductPageLocators:
     REVIEWS_EMPTY_MESSAGE = (By.CSS_SELECTOR, 'div#tab-reviews .woocommerce-noreviews, div#tab-reviews p')
     REVIEWS_FORM = (By.CSS_SELECTOR, 'div#tab-reviews form#commentform')
     REVIEWS_RATING_SELECT = (By.CSS_SELECTOR, 'div#tab-reviews p.stars select#rating, div#tab-reviews select#rating')
+    # Star links WooCommerce renders in place of select#rating when its JS is active
+    REVIEWS_RATING_STARS = (By.CSS_SELECTOR, 'div#tab-reviews p.stars')
     REVIEWS_COMMENT_TEXTAREA = (By.CSS_SELECTOR, 'div#tab-reviews textarea#comment')
     REVIEWS_AUTHOR_INPUT = (By.CSS_SELECTOR, 'div#tab-reviews input#author')
     REVIEWS_EMAIL_INPUT = (By.CSS_SELECTOR, 'div#tab-reviews input#email')
@@ -38,8 +40,8 @@ class ProductPageLocators:
     REVIEWS_FORM_ERROR = (By.CSS_SELECTOR, 'div#tab-reviews .woocommerce-error, div#tab-reviews .comment-form .error, div#tab-reviews #commentform .error, div#tab-reviews .comment-notes')
     # Breadcrumb: WooCommerce uses nav.woocommerce-breadcrumb
     BREADCRUMB = (By.CSS_SELECTOR, 'nav.woocommerce-breadcrumb')
-    # Sale badge (WooCommerce .onsale); main product only – filter out section.related in code
-    SALE_BADGE = (By.CSS_SELECTOR, 'span.onsale')
+    # Sale badge (WooCommerce .onsale) of the main product only, not the related products' badges
+    MAIN_PRODUCT_SALE_BADGE = (By.CSS_SELECTOR, 'span.onsale:not(section.related span.onsale)')
     VARIABLE_PRODUCT_COLOR_ATTRIBUTE_LABEL = (By.CSS_SELECTOR, 'table.variations tr th.label label[for="pa_color"]')
     # Logo attribute: theme may use for="logo", for="pa_logo", or for="attribute_logo"
     VARIABLE_PRODUCT_LOGO_ATTRIBUTE_LABEL = (By.CSS_SELECTOR, 'table.variations tr th.label label[for="logo"], table.variations tr th.label label[for="attribute_logo"], table.variations tr th.label label[for="pa_logo"]')
@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class RelatedProduct:
+    """One item of the 'Related products' section of a PDP."""
+    text: str
+    image_url: Optional[str]
+    image_visible: bool
+
+
+@dataclass(frozen=True)
+class PdpModel:
+    """
+    Immutable view of the data displayed on a product detail page, read in one browser round trip
+    by ProductPage.extract_pdp_model(). Text values are the rendered (visible) text, '' if not displayed.
+    """
+    title: str
+    price_text: str
+    price_html: str
+    product_type_text: str
+    sku_and_label: str
+    category_and_label: str
+    description_header: str
+    description_paragraphs: Tuple[str, ...]
+    breadcrumb: str
+    sale_badge_text: Optional[str]  # None if the main product has no visible sale badge
+    tab_labels: Tuple[str, ...]
+    main_image_url: Optional[str]
+    main_image_visible: bool
+    alternate_image_urls: Tuple[str, ...]
+    related_products_header: str
+    related_products: Tuple[RelatedProduct, ...]
+
+    @property
+    def description(self):
+        """All description paragraphs joined (same as ProductPage.get_displayed_product_description_full())."""
+        return "".join(self.description_paragraphs)
+
+    @property
+    def is_on_sale(self):
+        return self.sale_badge_text is not None
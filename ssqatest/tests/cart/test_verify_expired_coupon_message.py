@@ -1,6 +1,6 @@
 
 import pytest
-from ssqatest.src.helpers.api_helpers import create_coupon, delete_coupon_by_coupon_code
+from ssqatest.src.helpers.api_helpers import create_coupons
 from ssqatest.src.pages.HomePage import HomePage
 from ssqatest.src.pages.CartPage import CartPage
 from ssqatest.src.pages.Header import Header
@@ -9,14 +9,15 @@ from ssqatest.src.pages.Header import Header
 class TestCartExpiredCoupon:
 
     @pytest.fixture(scope='class')
-    def setup(self, request):
-        expired_coupon = create_coupon(expired=True)
-        request.cls.expired_coupon = expired_coupon
+    def setup(self, request, cleanup_registry):
+        expired_coupon = create_coupons(qty=1, expired=True)[0]
+        # Deleted in bulk after the tests, not in this class's teardown; by id, so no lookup by code is needed
+        cleanup_registry.register("coupons", expired_coupon["id"])
+        request.cls.expired_coupon = expired_coupon["code"]
         request.cls.homepage = HomePage(self.driver)
         request.cls.cart = CartPage(self.driver)
         request.cls.header = Header(self.driver)
         yield
-        delete_coupon_by_coupon_code(expired_coupon)
 
     @pytest.mark.tcid66
     def test_expired_coupon_message(self, setup):
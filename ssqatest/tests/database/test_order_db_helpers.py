@@ -0,0 +1,44 @@
+
+import pytest
+from ssqatest.src.helpers.database_helpers import (
+    get_order_from_db_by_order_no,
+    wait_for_order_in_db,
+    wait_for_orders_in_db,
+    stream_query,
+    fetch_scalar,
+    exists,
+    get_db_pool,
+)
+from ssqatest.src.helpers.sqlite_db_helpers import quote_identifier
+from ssqatest.src.configs.generic_configs import GenericConfigs
+
+
+# Runs against the local SQLite stand-in only (no browser, no shop): DB_BACKEND=sqlite python -m pytest tests/database
+class TestOrderDbHelpers:
+
+    @pytest.mark.tcid158
+    def test_get_order_by_order_no_returns_seeded_order(self, seed_orders_db):
+        seed_orders_db([{"ID": 900001, "post_status": "wc-processing"}])
+        db_order = get_order_from_db_by_order_no("900001")
+        assert len(db_order) == 1, f"Expected 1 row for order 900001 but found {len(db_order)}"
+        assert db_order[0]['post_status'] == 'wc-processing', f"Unexpected order status: {db_order[0]['post_status']}"
+
+    @pytest.mark.tcid159
+    def test_wait_for_orders_checks_many_orders_and_reports_missing(self, seed_orders_db):
+        seed_orders_db([{"ID": 900011}, {"ID": 900012}, {"ID": 900013, "post_type": "product"}])
+        found = wait_for_orders_in_db(["900011", 900012, 900013], timeout=0.3)
+        assert sorted(found) == ['900011', '900012'], f"Expected orders 900011 and 900012 only but found {sorted(found)}"
+        assert wait_for_order_in_db(900014, timeout=0) == [], "Expected no rows for an order that was never created"
+
+    @pytest.mark.tcid160
+    def test_stream_and_scalar_queries(self, seed_orders_db):
+        ids = seed_orders_db([{"ID": 900100 + i} for i in range(25)])
+        table = f"{quote_identifier(get_db_pool().db_name)}.{GenericConfigs.DATABASE_TABLE_PREFIX}posts"
+        streamed = [row['ID'] for row in stream_query(f"SELECT ID FROM {table} WHERE ID BETWEEN %s AND %s ORDER BY ID",
+                                                      [ids[0], ids[-1]], batch_size=10)]
+        assert streamed == ids, f"Streamed order ids do not match the seeded ones: {streamed}"
+        count = fetch_scalar(f"SELECT COUNT(*) FROM {table} WHERE ID BETWEEN %(first)s AND %(last)s",
+                             {"first": ids[0], "last": ids[-1]})
+        assert count == 25, f"Expected 25 seeded orders but counted {count}"
+        assert exists(f"SELECT 1 FROM {table} WHERE ID = %s", [ids[0]]), "Expected exists() to find a seeded order"
+        assert not exists(f"SELECT 1 FROM {table} WHERE ID = %s", [1]), "Expected exists() to be False for a missing order"
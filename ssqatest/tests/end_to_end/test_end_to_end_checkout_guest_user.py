@@ -6,7 +6,7 @@ from ssqatest.src.pages.CartPage import CartPage
 from ssqatest.src.pages.CheckoutPage import CheckoutPage
 from ssqatest.src.pages.OrderReceivedPage import OrderReceivedPage
 from ssqatest.src.configs.generic_configs import GenericConfigs
-from ssqatest.src.helpers.database_helpers import get_order_from_db_by_order_no
+from ssqatest.src.helpers.database_helpers import wait_for_order_in_db
 
 
 @pytest.mark.usefixtures('init_driver')
@@ -57,15 +57,14 @@ class TestEndToEndCheckoutGuestUser:
         print('********')
         print(order_no)
         print('********')
-        db_order = get_order_from_db_by_order_no(order_no)
-
-        db_order = get_order_from_db_by_order_no(order_no)
+        # the order can be committed shortly after the page renders; poll instead of querying once
+        db_order = wait_for_order_in_db(order_no, timeout=10)
         assert db_order, (
             f"❌ Order was created in frontend but not found in database.\n"
             f"   Order number: {order_no}\n"
             f"   \n"
             f"   Possible causes:\n"
-            f"   - Order was not committed to database (timing issue)\n"
+            f"   - Order was not committed to database within 10s (timing issue)\n"
             f"   - Order ID format mismatch\n"
             f"   - Database query is incorrect\n"
             f"   - Order was created in a different database/schema"
@@ -6,11 +6,12 @@ TC-123 to TC-147 (TC-125 removed: Be the first to review not supported in curren
 
 import time
 import pytest
+from ssqatest.src.helpers.metrics_helpers import counted_sleep
 from ssqatest.src.pages.ProductPage import ProductPage
 from ssqatest.src.helpers.api_helpers import (
     get_product_by_slug,
     get_product_reviews,
-    delete_product_review,
+    delete_product_reviews,
     create_product_review,
 )
 
@@ -45,8 +46,7 @@ class TestPDPReviews:
     def test_zero_reviews_empty_state_text(self, setup):
         """When product has no reviews, empty state message is displayed (TMP-REVIEW-002)."""
         product_id = self.product_api_data["id"]
-        for r in get_product_reviews(product_id):
-            delete_product_review(r["id"])
+        delete_product_reviews([r["id"] for r in get_product_reviews(product_id)])
         self.product_page.go_to_product_page(BEANIE_SLUG)
         self.product_page.click_reviews_tab()
         content = self.product_page.get_reviews_tab_content_text()
@@ -214,7 +214,7 @@ class TestPDPReviews:
         self.product_page.fill_review_email("testauthorui@example.com")
         self.product_page.click_review_submit()
         self.product_page.dismiss_alert_if_present()
-        time.sleep(2)
+        counted_sleep(2)
         texts = self.product_page.get_review_list_texts()
         if len(texts) > 0:
             last_review_text = texts[-1]
@@ -241,7 +241,7 @@ class TestPDPReviews:
         self.product_page.fill_review_email("counttest@example.com")
         self.product_page.click_review_submit()
         self.product_page.dismiss_alert_if_present()
-        time.sleep(2)
+        counted_sleep(2)
         try:
             content_after_submit = self.product_page.get_reviews_tab_content_text()
             if "awaiting" in (content_after_submit or "").lower():
@@ -274,7 +274,7 @@ class TestPDPReviews:
         self.product_page.fill_review_email("authordisplay@example.com")
         self.product_page.click_review_submit()
         self.product_page.dismiss_alert_if_present()
-        time.sleep(3)
+        counted_sleep(3)
         try:
             body_text = self.product_page.driver.find_element("tag name", "body").text
             body_lower = (body_text or "").lower()
@@ -319,7 +319,7 @@ class TestPDPReviews:
     @pytest.mark.tcid135
     def test_create_review_via_api_appears_on_pdp(self, setup):
         """Review created via API appears on PDP Reviews tab (TMP-REVIEW-013)."""
-        time.sleep(2)
+        counted_sleep(2)
         product_id = self.product_api_data["id"]
         ts = time.time()
         review_text = f"API review content {ts}."
@@ -333,7 +333,7 @@ class TestPDPReviews:
             content = self.product_page.get_reviews_tab_content_text()
             if review_text in (content or ""):
                 return
-            time.sleep(1)
+            counted_sleep(1)
         content = self.product_page.get_reviews_tab_content_text()
         assert review_text in (content or ""), (
             f"API-created review content must appear on PDP within 10s. Content: '{content[:400] if content else ''}'."
@@ -345,7 +345,7 @@ class TestPDPReviews:
         product_id = self.product_api_data["id"]
         for i in range(2):
             create_product_review(product_id, f"API User {i} {time.time()}", f"Review {i} content {time.time()}.", 4, f"api{i}{int(time.time())}@example.com")
-            time.sleep(2)
+            counted_sleep(2)
         reviews = get_product_reviews(product_id)
         n = len(reviews)
         self.product_page.go_to_product_page(BEANIE_SLUG)
@@ -354,7 +354,7 @@ class TestPDPReviews:
             label = self.product_page.get_reviews_tab_label_text()
             if str(n) in (label or ""):
                 break
-            time.sleep(1)
+            counted_sleep(1)
         label = self.product_page.get_reviews_tab_label_text()
         assert str(n) in (label or ""), f"Tab label should show Reviews ({n}). Got: '{label}'."
         items = self.product_page.get_review_list_elements()
@@ -371,8 +371,7 @@ class TestPDPReviews:
         if len(existing) == 0:
             create_product_review(product_id, "Single Review Author", f"Single review content {time.time()}.", 5, f"single{int(time.time())}@example.com")
         elif len(existing) > 1:
-            for r in existing[1:]:
-                delete_product_review(r["id"])
+            delete_product_reviews([r["id"] for r in existing[1:]])
         self.product_page.go_to_product_page(BEANIE_SLUG)
         self.product_page.click_reviews_tab()
         texts = self.product_page.get_review_list_texts()
@@ -394,12 +393,12 @@ class TestPDPReviews:
 
     def _api_review_then_assert_rating_display(self, rating_value):
         """Create one review via API with given rating, open PDP Reviews tab, return content."""
-        time.sleep(2)
+        counted_sleep(2)
         product_id = self.product_api_data["id"]
         create_product_review(product_id, f"Rater {rating_value} {time.time()}", f"Rating {rating_value} test {time.time()}.", rating_value, f"rater{rating_value}{int(time.time())}@example.com")
         self.product_page.go_to_product_page(BEANIE_SLUG)
         self.product_page.click_reviews_tab()
-        time.sleep(1)
+        counted_sleep(1)
         return self.product_page.get_reviews_tab_content_text()
 
     @pytest.mark.tcid138
@@ -436,7 +435,7 @@ class TestPDPReviews:
         product_id = self.product_api_data["id"]
         ts = time.time()
         create_product_review(product_id, "Mix A", f"A {ts}.", 3, f"mixa{int(ts)}@ex.com")
-        time.sleep(2)
+        counted_sleep(2)
         create_product_review(product_id, "Mix B", f"B {ts}.", 5, f"mixb{int(ts)}@ex.com")
         get_product_reviews(product_id)
         self.product_page.go_to_product_page(BEANIE_SLUG)
@@ -11,6 +11,7 @@ from selenium.webdriver.common.by import By
 
 
 @pytest.mark.usefixtures("init_driver")
+@pytest.mark.allow_resources("images")
 class TestProductDetailPageVariableProduct:
 
     @pytest.fixture(scope='class')
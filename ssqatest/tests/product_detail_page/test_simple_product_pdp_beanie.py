@@ -6,7 +6,6 @@ Batch 4: TC-118–TC-122 (breadcrumb, sale badge, quantity, add to cart with qua
 """
 
 import pytest
-from selenium.webdriver.common.by import By
 
 from ssqatest.src.pages.ProductPage import ProductPage
 from ssqatest.src.pages.CartPage import CartPage
@@ -20,6 +19,7 @@ BEANIE_SLUG = "beanie"
 
 
 @pytest.mark.usefixtures("init_driver")
+@pytest.mark.allow_resources("images")
 class TestSimpleProductPDPBeanie:
     """PDP tests for simple product Beanie. API data used as source of truth for assertions."""
 
@@ -35,7 +35,7 @@ class TestSimpleProductPDPBeanie:
     @pytest.mark.tcid103
     def test_beanie_pdp_product_name(self, setup):
         """UI must display the same product title as the catalog (API)."""
-        displayed_name = self.product_page.get_displayed_product_name()
+        displayed_name = self.product_page.extract_pdp_model().title
         expected_name = self.product_api_data["name"]
         assert displayed_name == expected_name, (
             f"Product title on PDP does not match catalog. Expected: '{expected_name}'. Displayed: '{displayed_name}'."
@@ -44,7 +44,9 @@ class TestSimpleProductPDPBeanie:
     @pytest.mark.tcid104
     def test_beanie_pdp_main_image(self, setup):
         """Main product image must be visible and match catalog image URL."""
-        main_image_src = self.product_page.get_url_of_displayed_main_image()
+        pdp = self.product_page.extract_pdp_model()
+        assert pdp.main_image_visible, "Main product image is not visible."
+        main_image_src = pdp.main_image_url
         assert main_image_src, "Main product image has no src/data-src."
         api_image_urls = [img["src"] for img in self.product_api_data.get("images", [])]
         assert api_image_urls, "API product has no images; cannot validate PDP image."
@@ -56,7 +58,7 @@ class TestSimpleProductPDPBeanie:
     @pytest.mark.tcid105
     def test_beanie_pdp_simple_product_type_text(self, setup):
         """UI must show 'This is a simple product.' so customers know no options are required."""
-        product_type_text = self.product_page.get_product_type_text()
+        product_type_text = self.product_page.extract_pdp_model().product_type_text
         expected = "This is a simple product."
         assert product_type_text == expected, (
             f"Product type text on PDP incorrect. Expected: '{expected}'. Actual: '{product_type_text}'."
@@ -85,7 +87,7 @@ class TestSimpleProductPDPBeanie:
     @pytest.mark.tcid108
     def test_beanie_pdp_single_price_display(self, setup):
         """Single price must be displayed and match catalog (API price_html)."""
-        displayed_price = self.product_page.get_displayed_product_price()
+        displayed_price = self.product_page.extract_pdp_model().price_text
         assert displayed_price, "Price section has no displayed text."
         api_price_text = convert_html_to_text(self.product_api_data["price_html"]).strip()
         assert self._normalize_price_text(displayed_price) == self._normalize_price_text(api_price_text), (
@@ -115,7 +117,7 @@ class TestSimpleProductPDPBeanie:
     @pytest.mark.tcid110
     def test_beanie_pdp_sku(self, setup):
         """SKU on PDP must match catalog."""
-        displayed_sku = self.product_page.get_displayed_sku_and_label()
+        displayed_sku = self.product_page.extract_pdp_model().sku_and_label
         expected_sku = f'SKU: {self.product_api_data["sku"]}'
         assert displayed_sku == expected_sku, (
             f"SKU on PDP does not match catalog. Expected: '{expected_sku}'. Displayed: '{displayed_sku}'."
@@ -124,7 +126,7 @@ class TestSimpleProductPDPBeanie:
     @pytest.mark.tcid111
     def test_beanie_pdp_category(self, setup):
         """Category on PDP must match catalog."""
-        displayed_category = self.product_page.get_displayed_category_and_label()
+        displayed_category = self.product_page.extract_pdp_model().category_and_label
         api_category_name = self.product_api_data["categories"][0]["name"]
         expected_category = f"Category: {api_category_name}"
         assert displayed_category == expected_category, (
@@ -134,11 +136,12 @@ class TestSimpleProductPDPBeanie:
     @pytest.mark.tcid112
     def test_beanie_pdp_description_section(self, setup):
         """Description header and content must be present and match catalog."""
-        description_header = self.product_page.get_displayed_product_description_header()
+        pdp = self.product_page.extract_pdp_model()
+        description_header = pdp.description_header
         assert description_header == "Description", (
             f"Description section header incorrect. Expected: 'Description'. Actual: '{description_header}'."
         )
-        displayed_description = self.product_page.get_displayed_product_description_full()
+        displayed_description = pdp.description
         api_description_text = convert_html_to_text(self.product_api_data["description"]).strip()
         assert displayed_description == api_description_text, (
             f"Description content does not match catalog. Expected: '{api_description_text[:80]}...'. "
@@ -177,20 +180,20 @@ class TestSimpleProductPDPBeanie:
     @pytest.mark.tcid115
     def test_beanie_pdp_related_products_section(self, setup):
         """Related products header and list must match catalog (API related_ids); each item must have image."""
-        section_header = self.product_page.get_related_products_section_header()
+        pdp = self.product_page.extract_pdp_model()
+        section_header = pdp.related_products_header
         assert section_header == "Related products", (
             f"Related products header must be 'Related products'. Displayed: '{section_header}'."
         )
-        related_elements = self.product_page.get_related_products_elements_list()
+        related_products = pdp.related_products
         related_ids = self.product_api_data.get("related_ids") or []
         exp_count = min(3, len(related_ids)) if related_ids else 0
-        assert len(related_elements) == exp_count, (
-            f"Related products count must match catalog (up to 3). Expected: {exp_count}. Displayed: {len(related_elements)}."
+        assert len(related_products) == exp_count, (
+            f"Related products count must match catalog (up to 3). Expected: {exp_count}. Displayed: {len(related_products)}."
         )
-        for elem in related_elements:
-            img = elem.find_element(By.TAG_NAME, "img")
-            assert img.is_displayed(), "Related product item must display an image."
-            src = img.get_attribute("src")
+        for related in related_products:
+            assert related.image_visible, "Related product item must display an image."
+            src = related.image_url
             assert src and (src.endswith(".jpg") or ".jpg" in src), (
                 f"Related product image must have valid src. Got: '{src}'."
             )
@@ -198,7 +201,7 @@ class TestSimpleProductPDPBeanie:
     @pytest.mark.tcid116
     def test_beanie_pdp_product_tabs(self, setup):
         """Tabs must be Description, Additional information, and Reviews (with count)."""
-        tab_labels = self.product_page.get_labels_of_left_nav_tabs()
+        tab_labels = list(self.product_page.extract_pdp_model().tab_labels)
         assert len(tab_labels) == 3, (
             f"PDP must have 3 tabs. Displayed: {len(tab_labels)} — {tab_labels}."
         )
@@ -222,7 +225,7 @@ class TestSimpleProductPDPBeanie:
     @pytest.mark.tcid118
     def test_beanie_pdp_breadcrumb(self, setup):
         """Breadcrumb must be visible and contain the product name (Beanie)."""
-        breadcrumb_text = self.product_page.get_breadcrumb_text()
+        breadcrumb_text = self.product_page.extract_pdp_model().breadcrumb
         assert breadcrumb_text, "Breadcrumb has no visible text."
         assert "Beanie" in breadcrumb_text, (
             f"Breadcrumb must contain product name 'Beanie'. Actual: '{breadcrumb_text}'."